@@ -1,30 +1,68 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, make_response
+from werkzeug.exceptions import HTTPException
+from markupsafe import Markup
 import sys
 import os
 import time
-import statistics
-import json
-from datetime import datetime, timedelta
-from collections import deque
+import html
+import hashlib
+import gzip
+import operator
+import struct
+import zlib
+from datetime import datetime
 import atexit
+import threading
+import queue
 import requests
+from croniter import croniter
 from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
-# Add temp3 directory to path to use the working implementation
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'temp3'))
+try:
+    import brotli
+except ImportError:  # brotli is optional - responses fall back to gzip
+    brotli = None
+
+# Add temp3 directory to path to use the working implementation (once - app and collector both import it)
+TEMP3_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'temp3')
+if TEMP3_DIR not in sys.path:
+    sys.path.insert(0, TEMP3_DIR)
 import starlink_grpc
 
 # Import our new modules
 from database import StarlinkDatabase
 from data_collector import DataCollector
 from speed_test import SpeedTestEngine
+from dish_poller import DishPoller
+from stats_stream import Broadcaster, StatsBroadcaster
+import throughput
+from json_provider import JSONProvider
+import quality
+from quality import calculate_quality_score, quality_scores
+from decimation import lttb_indices
 
 app = Flask(__name__)
+app.json = JSONProvider(app)
+# The pages' CSS/JS are fixed files - let browsers reuse them for as long as the static pages
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
+
+# One dish channel shared by every caller, so polls reuse the open HTTP/2 connection
+# (the collector, the dish poller and read_dish's worker all call it from their own threads)
+dish_context = starlink_grpc.ChannelContext()
+atexit.register(dish_context.close)  # Registered first so it runs after everything using it has stopped
 
 # Initialize database and data collector
 db = StarlinkDatabase()
-collector = DataCollector(db, collection_interval=30)  # Collect every 30 seconds
-speed_test_engine = SpeedTestEngine(db)
+collector = DataCollector(db, collection_interval=30, context=dish_context)  # Collect every 30 seconds
+# Finished speed tests are pushed to waiting speed test pages rather than polled for
+speed_test_events = Broadcaster(encode=app.json.dumps)
+speed_test_engine = SpeedTestEngine(db, on_result=speed_test_events.send)
+
+# Compile the throughput and quality kernels up front so no request pays for it
+throughput.warm_up()
+quality.warm_up()
 
 # Start background data collection
 collector.start()
@@ -35,37 +73,140 @@ atexit.register(collector.stop)
 atexit.register(speed_test_engine.stop_scheduler)
 
 # In-memory storage for historical data (in production, use Redis/database)
+# (epoch second, formatted HH:MM:SS) - replaced as a whole, so readers never need a lock
+_clock_cache = (None, '')
+
+def clock_time():
+    """Current local time as HH:MM:SS, formatted at most once per second"""
+    global _clock_cache
+    now = time.time()
+    second = int(now)
+    cached_second, text = _clock_cache
+    if second != cached_second:
+        text = time.strftime('%H:%M:%S', time.localtime(now))
+        _clock_cache = (second, text)
+    return text
+
 class DataStore:
-    def __init__(self, max_points=300):  # Store 5 minutes at 1-second intervals
+    # Series stored as rows of the ring buffer, one column per point. Quality scores are
+    # derived from the other rows on read, so the whole chart follows the current scoring tables.
+    SERIES = ('latency', 'download_speeds', 'upload_speeds', 'obstruction', 'snr_above_noise')
+    
+    def __init__(self, max_points=300, path=None):  # Store 5 minutes at 1-second intervals
+        """
+        Ring buffer of the latest dish samples for the live chart
+        
+        Args:
+            max_points: Number of samples kept
+            path: File to keep the buffer in, so it survives restarts (memory only if not set)
+        """
         self.max_points = max_points
-        self.timestamps = deque(maxlen=max_points)
-        self.latency_data = deque(maxlen=max_points)
-        self.download_speeds = deque(maxlen=max_points)
-        self.upload_speeds = deque(maxlen=max_points)
-        self.obstruction_data = deque(maxlen=max_points)
-        self.quality_scores = deque(maxlen=max_points)
+        self.timestamps = [None] * max_points
+        self.head = 0  # Next slot to write - the oldest point once the buffer is full
+        self.filled = 0
+        
+        if path:
+            self.values, self.times = self._open_file(path)
+            self._restore()
+        else:
+            # float32 matches the dish's own precision and halves the bytes each chart read walks
+            self.values = np.zeros((len(self.SERIES), max_points), dtype=np.float32)
+            self.times = np.zeros(max_points)  # Epoch seconds per point, 0 for an empty slot
+        
+        # Encoded JSON payloads, reused by every reader until the next point is written
+        self.version = 0
+        self._json_cache = {}
     
-    def add_data_point(self, latency, download_mbps, upload_mbps, obstruction_pct, quality_score):
-        now = datetime.now()
-        self.timestamps.append(now.strftime('%H:%M:%S'))
-        self.latency_data.append(latency)
-        self.download_speeds.append(download_mbps)
-        self.upload_speeds.append(upload_mbps)
-        self.obstruction_data.append(obstruction_pct)
-        self.quality_scores.append(quality_score)
+    def _open_file(self, path):
+        """Map the values rows and epoch times of the ring onto one file, creating it if needed"""
+        values_size = len(self.SERIES) * self.max_points * 4
+        size = values_size + self.max_points * 8
+        if not os.path.exists(path) or os.path.getsize(path) != size:
+            # New file, or one written with a different max_points - start empty
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'wb') as f:
+                f.truncate(size)
+        values = np.memmap(path, dtype=np.float32, mode='r+', shape=(len(self.SERIES), self.max_points))
+        times = np.memmap(path, dtype=np.float64, mode='r+', offset=values_size, shape=(self.max_points,))
+        return values, times
+    
+    def _restore(self):
+        """Pick up head, fill level and display timestamps from a buffer written by an earlier run"""
+        written = np.flatnonzero(self.times)
+        if not len(written):
+            return
+        self.filled = len(written)
+        self.head = (int(self.times.argmax()) + 1) % self.max_points  # Slot after the newest point
+        for slot in written.tolist():
+            self.timestamps[slot] = time.strftime('%H:%M:%S', time.localtime(self.times[slot]))
+    
+    def add_data_point(self, latency, download_mbps, upload_mbps, obstruction_pct, snr_above_noise):
+        self.timestamps[self.head] = clock_time()
+        self.values[:, self.head] = (latency, download_mbps, upload_mbps, obstruction_pct, snr_above_noise)
+        self.times[self.head] = time.time()  # Written last - a point only counts once its time is set
+        self.head = (self.head + 1) % self.max_points
+        self.filled = min(self.filled + 1, self.max_points)
+        self.version += 1
+    
+    def latest(self):
+        """Most recent point, rounded for display, or None before the first sample"""
+        if not self.filled:
+            return None
+        last = self.head - 1  # -1 wraps to the end of the ring
+        point = self.values[:, last]
+        latency, download_mbps, upload_mbps, obstruction_pct, snr_above_noise = point.tolist()
+        # Score the stored float32 point with the chart's scorer so the two agree at the thresholds
+        quality_score = quality_scores(*point[:4, None], point[4:] != 0)[0]
+        return {
+            'latency': round(latency, 1),
+            'download_mbps': round(download_mbps, 1),
+            'upload_mbps': round(upload_mbps, 1),
+            'obstruction_pct': round(obstruction_pct, 2),
+            'quality_score': int(quality_score),
+            'timestamp': self.timestamps[last]
+        }
     
     def get_chart_data(self):
+        head = self.head
+        if self.filled < self.max_points:
+            timestamps = self.timestamps[:head]
+            values = self.values[:, :head]
+        else:
+            # Unwrap the ring so points come out oldest first
+            timestamps = self.timestamps[head:] + self.timestamps[:head]
+            values = np.concatenate((self.values[:, head:], self.values[:, :head]), axis=1)
+        
+        # Rows go to the JSON provider as arrays - no intermediate Python lists
+        latency, download_speeds, upload_speeds, obstruction, snr_above_noise = values
         return {
-            'timestamps': list(self.timestamps),
-            'latency': list(self.latency_data),
-            'download_speeds': list(self.download_speeds),
-            'upload_speeds': list(self.upload_speeds),
-            'obstruction': list(self.obstruction_data),
-            'quality_scores': list(self.quality_scores)
+            'timestamps': timestamps,
+            'latency': latency,
+            'download_speeds': download_speeds,
+            'upload_speeds': upload_speeds,
+            'obstruction': obstruction,
+            'quality_scores': quality_scores(latency, download_speeds, upload_speeds, obstruction, snr_above_noise != 0)
         }
+    
+    def _encode_once(self, name, build):
+        """JSON bytes of build(), encoded at most once per data point"""
+        version, encoded = self._json_cache.get(name, (None, b''))
+        if version != self.version:
+            # Tag with the version read before encoding, so a concurrent write can't be masked
+            version = self.version
+            encoded = app.json.dumps(build()).encode('utf-8')
+            self._json_cache[name] = (version, encoded)
+        return encoded
+    
+    def get_chart_json(self):
+        """get_chart_data() encoded as JSON bytes"""
+        return self._encode_once('chart', self.get_chart_data)
+    
+    def get_latest_json(self):
+        """latest() encoded as JSON bytes"""
+        return self._encode_once('latest', self.latest)
 
 # Global data store
-data_store = DataStore()
+data_store = DataStore(path=os.environ.get('LIVE_HISTORY_PATH'))
 
 @lru_cache(maxsize=10)
 def reverse_geocode(lat, lon):
@@ -112,113 +253,249 @@ def reverse_geocode(lat, lon):
     
     return None
 
-def calculate_quality_score(latency, download_mbps, upload_mbps, obstruction_pct, snr_good):
-    """Calculate connection quality score (0-100)"""
-    score = 100
-    
-    # Latency impact (0-30 points)
-    if latency > 100:
-        score -= 30
-    elif latency > 75:
-        score -= 20
-    elif latency > 50:
-        score -= 10
-    
-    # Speed impact (0-25 points each)
-    if download_mbps < 10:
-        score -= 25
-    elif download_mbps < 25:
-        score -= 15
-    elif download_mbps < 50:
-        score -= 5
-    
-    if upload_mbps < 3:
-        score -= 25
-    elif upload_mbps < 8:
-        score -= 15
-    elif upload_mbps < 15:
-        score -= 5
-    
-    # Obstruction impact (0-20 points)
-    if obstruction_pct > 10:
-        score -= 20
-    elif obstruction_pct > 5:
-        score -= 15
-    elif obstruction_pct > 1:
-        score -= 10
-    elif obstruction_pct > 0.1:
-        score -= 5
-    
-    # SNR impact (0-10 points)
-    if not snr_good:
-        score -= 10
-    
-    return max(0, min(100, score))
+# Rolling aggregates over the last 5 minutes of dish history, fed only the new samples each poll
+throughput_window = throughput.ThroughputWindow(300)
+throughput_lock = threading.Lock()
 
-def get_speed_data():
-    """Get speed data - try multiple approaches to find actual speeds"""
+def get_history_speed_data():
+    """Speeds from the rolling history aggregates, or None if there is no recent activity"""
     try:
-        # Method 1: Try bulk history for recent high activity
-        bulk_data = starlink_grpc.history_bulk_data(300)  # Last 5 minutes
-        
-        if bulk_data and len(bulk_data) > 1:
-            data = bulk_data[1]
+        # Rolling history aggregates for recent high activity
+        with throughput_lock:
+            general, data = starlink_grpc.history_bulk_data(300, start=throughput_window.end_counter,
+                                                            context=dish_context)
+            throughput_window.extend(data.get('downlink_throughput_bps', []),
+                                     data.get('uplink_throughput_bps', []))
+            throughput_window.end_counter = general['end_counter']
             
-            downlink_data = data.get('downlink_throughput_bps', [])
-            uplink_data = data.get('uplink_throughput_bps', [])
-            
-            if downlink_data and uplink_data:
-                # Look for significant activity in the last 5 minutes
-                active_downlink = [x for x in downlink_data if x > 1e6]  # > 1 Mbps
-                active_uplink = [x for x in uplink_data if x > 1e6]      # > 1 Mbps
-                
-                # Also get recent activity regardless of threshold
-                recent_downlink = [x for x in downlink_data[-60:] if x > 0]
-                recent_uplink = [x for x in uplink_data[-60:] if x > 0]
-                
-                result = {}
-                
-                if active_downlink and active_uplink:
-                    # We found periods of high activity
-                    result['download_mbps'] = statistics.mean(active_downlink) / 1e6
-                    result['upload_mbps'] = statistics.mean(active_uplink) / 1e6
-                    result['peak_download'] = max(active_downlink) / 1e6
-                    result['peak_upload'] = max(active_uplink) / 1e6
-                    result['type'] = f"Active usage (last 5min, {len(active_downlink)} samples)"
-                    return result
-                
-                elif recent_downlink and recent_uplink:
-                    # Use recent data even if low
-                    avg_down = statistics.mean(recent_downlink)
-                    avg_up = statistics.mean(recent_uplink)
-                    result['download_mbps'] = avg_down / 1e6
-                    result['upload_mbps'] = avg_up / 1e6
-                    result['peak_download'] = max(recent_downlink) / 1e6
-                    result['peak_upload'] = max(recent_uplink) / 1e6
-                    result['type'] = f"Recent activity ({len(recent_downlink)} samples)"
-                    return result
+            # High activity (> 1 Mbps) over the last 5 minutes and any activity in the last minute
+            (active_dl_sum, active_dl_count, active_dl_peak,
+             active_ul_sum, active_ul_count, active_ul_peak,
+             recent_dl_sum, recent_dl_count, recent_dl_peak,
+             recent_ul_sum, recent_ul_count, recent_ul_peak) = throughput_window.snapshot()
+        
+        result = {}
+        
+        if active_dl_count and active_ul_count:
+            # We found periods of high activity
+            result['download_mbps'] = active_dl_sum / active_dl_count / 1e6
+            result['upload_mbps'] = active_ul_sum / active_ul_count / 1e6
+            result['peak_download'] = active_dl_peak / 1e6
+            result['peak_upload'] = active_ul_peak / 1e6
+            result['type'] = f"Active usage (last 5min, {active_dl_count} samples)"
+            return result
+        
+        elif recent_dl_count and recent_ul_count:
+            # Use recent data even if low
+            result['download_mbps'] = recent_dl_sum / recent_dl_count / 1e6
+            result['upload_mbps'] = recent_ul_sum / recent_ul_count / 1e6
+            result['peak_download'] = recent_dl_peak / 1e6
+            result['peak_upload'] = recent_ul_peak / 1e6
+            result['type'] = f"Recent activity ({recent_dl_count} samples)"
+            return result
     
     except Exception as e:
         print(f"Error getting bulk speeds: {e}")
     
-    # Method 2: Fallback to instantaneous from status
-    try:
-        status = starlink_grpc.get_status()
-        downlink_mbps = status.downlink_throughput_bps / 1e6 if hasattr(status, 'downlink_throughput_bps') else 0
-        uplink_mbps = status.uplink_throughput_bps / 1e6 if hasattr(status, 'uplink_throughput_bps') else 0
-        
-        return {
-            'download_mbps': downlink_mbps,
-            'upload_mbps': uplink_mbps,
-            'peak_download': downlink_mbps,
-            'peak_upload': uplink_mbps,
-            'type': 'Current instantaneous'
-        }
-    except Exception as e:
-        print(f"Error getting status speeds: {e}")
+    return None
+
+def get_status_speed_data(status):
+    """Instantaneous speeds from a status reading"""
+    downlink_mbps = status.downlink_throughput_bps / 1e6
+    uplink_mbps = status.uplink_throughput_bps / 1e6
+    
+    return {
+        'download_mbps': downlink_mbps,
+        'upload_mbps': uplink_mbps,
+        'peak_download': downlink_mbps,
+        'peak_upload': uplink_mbps,
+        'type': 'Current instantaneous'
+    }
+
+# Overlaps the status and history gRPC round trips of a dish reading
+dish_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='dish')
+
+def read_dish():
+    """Fetch the dish status together with the current speed data, both in flight at once"""
+    pending_status = dish_executor.submit(starlink_grpc.get_status, dish_context)
+    speed_data = get_history_speed_data()
+    status = pending_status.result()
+    return status, speed_data or get_status_speed_data(status)
+
+def sample_dish():
+    """Take one dish reading and record it in the live chart history"""
+    status, speed_data = read_dish()
+    
+    # Get current metrics
+    latency = status.pop_ping_latency_ms
+    downlink_mbps = speed_data['download_mbps'] if speed_data else 0
+    uplink_mbps = speed_data['upload_mbps'] if speed_data else 0
+    
+    # Obstruction info
+    fraction_obstructed = status.obstruction_stats.fraction_obstructed * 100
+    
+    # SNR status
+    snr_above_noise = status.is_snr_above_noise_floor
+    
+    # Add to data store (quality is scored from these when read)
+    data_store.add_data_point(latency, downlink_mbps, uplink_mbps, fraction_obstructed, snr_above_noise)
     
+    return status, speed_data
+
+# Sample the dish at a fixed 1 Hz in the background - request handlers only read the latest sample
+dish_poller = DishPoller(sample_dish, interval=1)
+dish_poller.start()
+atexit.register(dish_poller.stop)
+
+# Compress text responses - the pages are mostly repeated CSS/markup. Brotli is preferred when
+# installed (quality 4 beats gzip-6 on size at similar CPU cost), gzip is the fallback
+COMPRESS_MIMETYPES = ('text/html', 'application/json')
+COMPRESS_MIN_SIZE = 500
+BROTLI_QUALITY = 4
+
+# Files served from disk (static assets, the /speedtest and /advanced pages) only change on
+# deploy, so each version is compressed once at the highest level and the bytes reused
+STATIC_COMPRESS_MIMETYPES = ('text/html', 'text/css', 'text/javascript', 'application/javascript')
+_static_compressed = {}
+
+def compress_static(response, encoding):
+    """Swap a send_file response's body for its cached, fully compressed bytes"""
+    etag, _ = response.get_etag()
+    if not etag:
+        return response
+
+    # send_file's ETag covers the file's path, size and mtime
+    key = (etag, encoding)
+    body = _static_compressed.get(key)
+    response.direct_passthrough = False
+    if body is None:
+        data = response.get_data()
+        body = brotli.compress(data, quality=11) if encoding == 'br' else gzip.compress(data, compresslevel=9)
+        _static_compressed[key] = body
+    else:
+        response.response.close()
+
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+def preferred_encoding():
+    """The Content-Encoding to compress this request's response with, or None"""
+    if brotli is not None and 'br' in request.accept_encodings:
+        return 'br'
+    if 'gzip' in request.accept_encodings:
+        return 'gzip'
     return None
 
+@app.after_request
+def compress_response(response):
+    """Brotli/gzip HTML/JSON responses and static files when the client accepts it"""
+    response.vary.add('Accept-Encoding')
+    if response.status_code != 200 or 'Content-Encoding' in response.headers:
+        return response
+
+    encoding = preferred_encoding()
+    if encoding is None:
+        return response
+
+    if response.direct_passthrough:
+        if response.mimetype in STATIC_COMPRESS_MIMETYPES:
+            return compress_static(response, encoding)
+        return response
+    if response.mimetype not in COMPRESS_MIMETYPES:
+        return response
+
+    data = response.get_data()
+    if len(data) < COMPRESS_MIN_SIZE:
+        return response
+
+    if encoding == 'br':
+        response.set_data(brotli.compress(data, quality=BROTLI_QUALITY))
+    else:
+        response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = encoding
+    return response
+
+# Error pages are encoded once at import; only the error details are filled in per request
+def _build_error_page(title, heading, message, footer='', script=''):
+    """Encode a full-page error template with an {error} placeholder"""
+    return f"""
+        <html>
+        <head><title>{title}</title></head>
+        <body style="font-family: Arial, sans-serif; margin: 40px;">
+        <div style="background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+            <h1 style="color: #ef4444;">⚠️ {heading}</h1>
+            <p style="color: #666;">{message}</p>
+            <div style="background: #fee; padding: 15px; border-radius: 5px; margin: 20px 0;">
+                <strong>Error details:</strong><br>
+                <code style="color: #c00;">{{error}}</code>
+            </div>
+            {footer}
+        </div>{script}
+        </body>
+        </html>
+        """.encode('utf-8')
+
+_ANALYTICS_ERROR_PAGE = _build_error_page(
+    'Analytics Error', 'Analytics Dashboard Error', 'Unable to load analytics data',
+    '<p><a href="/" style="color: #667eea;">← Back to Monitor</a></p>')
+
+_CONNECTION_ERROR_PAGE = _build_error_page(
+    'Starlink Monitor - Error', 'Starlink Monitor - Connection Error', 'Unable to connect to Starlink dish',
+    """<p style="color: #666;">Please ensure:</p>
+            <ul style="color: #666;">
+                <li>Your Starlink dish is powered on and connected</li>
+                <li>The dish is accessible at IP address 192.168.100.1</li>
+                <li>Your network configuration allows access to the dish</li>
+            </ul>
+            <p style="color: #999; font-size: 0.9em;">This page will automatically retry in 30 seconds...</p>""",
+    """
+        <script>
+        // Probe the cheap stats API and only load the dashboard again once the dish answers
+        function retry() {
+            setTimeout(async function() {
+                try {
+                    const response = await fetch('/api/current-stats', { cache: 'no-store' });
+                    if (response.ok) {
+                        location.reload();
+                        return;
+                    }
+                    const data = await response.json();
+                    document.querySelector('code').textContent = data.error;
+                } catch (error) {
+                    // Server unreachable too - keep waiting
+                }
+                retry();
+            }, 30000);
+        }
+        retry();
+        </script>""")
+
+@lru_cache(maxsize=32)
+def _filled_error_page(page, message):
+    """Error page bytes for a message - an unreachable dish fails every request the same way"""
+    return page.replace(b'{error}', html.escape(message).encode('utf-8'))
+
+def error_page(page, error):
+    """Fill a pre-encoded error page with the (escaped) error details"""
+    return Response(_filled_error_page(page, str(error)), status=500, mimetype='text/html')
+
+# Error page for each page endpoint; other endpoints handle their own errors (the APIs answer in JSON)
+_ERROR_PAGES = {
+    'index': _CONNECTION_ERROR_PAGE,
+    'analytics': _ANALYTICS_ERROR_PAGE,
+}
+
+@app.errorhandler(Exception)
+def page_error(e):
+    """Show the failing page's error page instead of wrapping each page handler in try/except"""
+    if isinstance(e, HTTPException):
+        return e  # 404s and the like keep their usual responses
+    page = _ERROR_PAGES.get(request.endpoint)
+    if page is None:
+        raise e  # Not a page - Flask logs it and answers with a plain 500
+    return error_page(page, e)
+
 # Health check endpoint
 @app.route('/health')
 def health():
@@ -240,29 +517,86 @@ def health():
             'error': str(e)
         }), 500
 
+# Historical query results and encoded responses, keyed by use and query. The collector writes at most
+# once per collection interval, so pages and panels asking for the same range can share one query.
+HISTORICAL_CACHE_TTL = 30
+HISTORICAL_CACHE_SIZE = 64
+_historical_cache = {}  # key -> (monotonic time built, value)
+_historical_cache_lock = threading.Lock()
+
+def cached(key, build, keep=None):
+    """Result of build(), reused for HISTORICAL_CACHE_TTL seconds (only if keep(result), when given)"""
+    now = time.monotonic()
+    entry = _historical_cache.get(key)
+    if entry is None or now - entry[0] >= HISTORICAL_CACHE_TTL:
+        entry = (now, build())
+        if keep is not None and not keep(entry[1]):
+            return entry[1]
+        with _historical_cache_lock:
+            _historical_cache.pop(key, None)
+            if len(_historical_cache) >= HISTORICAL_CACHE_SIZE:
+                del _historical_cache[next(iter(_historical_cache))]  # Oldest entry
+            _historical_cache[key] = entry
+    return entry[1]
+
+def cached_json(key, build, max_age=None):
+    """JSON response of build(), reusing the encoded body for HISTORICAL_CACHE_TTL seconds"""
+    body = cached(('json',) + key, lambda: app.json.dumps(build()).encode('utf-8'))
+    response = Response(body, mimetype='application/json')
+    if max_age is not None:
+        response.cache_control.max_age = max_age  # Browsers may reuse it without asking again
+    return response
+
+# Browser cache lifetime for the 30-day aggregates (comparison, analytics, insights) - they move slowly
+AGGREGATE_MAX_AGE = 300
+
+def cached_summary_stats(days):
+    """db.get_summary_stats(days), shared for HISTORICAL_CACHE_TTL seconds"""
+    return cached(('summary_stats', days), lambda: db.get_summary_stats(days=days))
+
+def cached_summary_windows(*days):
+    """db.get_summary_stats for several windows, read in one pass per table and shared like the above"""
+    return cached(('summary_windows',) + days, lambda: db.get_summary_stats_multi(days))
+
 # Historical Data API Endpoints
 @app.route('/api/historical/summary')
 def historical_summary():
     """Get summary statistics for different time periods"""
     try:
         days = int(request.args.get('days', 30))
-        stats = db.get_summary_stats(days=days)
         
-        return jsonify({
-            'period_days': days,
-            'total_measurements': stats.get('total_measurements', 0),
-            'avg_latency_ms': round(stats.get('avg_latency', 0), 1),
-            'avg_download_mbps': round(stats.get('avg_download', 0), 1),
-            'avg_upload_mbps': round(stats.get('avg_upload', 0), 1),
-            'avg_quality_score': round(stats.get('avg_quality', 0), 0),
-            'outage_count': stats.get('outage_count', 0),
-            'total_outage_hours': round(stats.get('total_outage_seconds', 0) / 3600, 1),
-            'oldest_data': stats.get('oldest_data'),
-            'newest_data': stats.get('newest_data')
-        })
+        def build():
+            stats = cached_summary_stats(days)
+            return {
+                'period_days': days,
+                'total_measurements': stats.get('total_measurements', 0),
+                'avg_latency_ms': round(stats.get('avg_latency', 0), 1),
+                'avg_download_mbps': round(stats.get('avg_download', 0), 1),
+                'avg_upload_mbps': round(stats.get('avg_upload', 0), 1),
+                'avg_quality_score': round(stats.get('avg_quality', 0), 0),
+                'outage_count': stats.get('outage_count', 0),
+                'total_outage_hours': round(stats.get('total_outage_seconds', 0) / 3600, 1),
+                'oldest_data': stats.get('oldest_data'),
+                'newest_data': stats.get('newest_data')
+            }
+        
+        return cached_json(('summary', days), build)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Trend charts are a few hundred pixels wide - longer series are cut down to about this many points
+TREND_MAX_POINTS = 500
+
+def decimated_trend_data(metric, period, days, max_points, columnar=False):
+    """db.get_trend_data, reduced to at most max_points periods by LTTB on the averages"""
+    data = db.get_trend_data(metric, period, days, columnar=True)
+    keep = lttb_indices(data['avg_value'], max_points)
+    if len(keep) < len(data['period']):
+        data = {name: [values[i] for i in keep] for name, values in data.items()}
+    if columnar:
+        return data
+    return [dict(zip(data, row)) for row in zip(*data.values())]
+
 @app.route('/api/historical/trends')
 def historical_trends():
     """Get trend data for charts"""
@@ -270,19 +604,19 @@ def historical_trends():
         metric = request.args.get('metric', 'download_mbps')
         period = request.args.get('period', 'hour')  # hour, day, minute
         days = int(request.args.get('days', 7))
+        columnar = request.args.get('format') == 'columns'  # One list per column instead of one dict per row
+        max_points = int(request.args.get('max_points', TREND_MAX_POINTS))
         
         # Validate metric
         valid_metrics = ['download_mbps', 'upload_mbps', 'latency_ms', 'quality_score', 'obstruction_pct']
         if metric not in valid_metrics:
             return jsonify({'error': f'Invalid metric. Must be one of: {valid_metrics}'}), 400
         
-        trends = db.get_trend_data(metric, period, days)
-        
-        return jsonify({
+        return cached_json(('trends', metric, period, days, columnar, max_points), lambda: {
             'metric': metric,
             'period': period,
             'days': days,
-            'data': trends
+            'data': decimated_trend_data(metric, period, days, max_points, columnar=columnar)
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -292,11 +626,10 @@ def daily_stats():
     """Get daily statistics"""
     try:
         days = int(request.args.get('days', 30))
-        stats = db.get_daily_stats(days=days)
         
-        return jsonify({
+        return cached_json(('daily', days), lambda: {
             'period_days': days,
-            'daily_stats': stats
+            'daily_stats': db.get_daily_stats(days=days)
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -306,9 +639,9 @@ def performance_comparison():
     """Get performance comparison data"""
     try:
         metric = request.args.get('metric', 'download_mbps')
-        comparison = db.get_performance_comparison(metric)
         
-        return jsonify(comparison)
+        return cached_json(('comparison', metric), lambda: db.get_performance_comparison(metric),
+                           max_age=AGGREGATE_MAX_AGE)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -317,79 +650,70 @@ def outages():
     """Get outage history"""
     try:
         days = int(request.args.get('days', 30))
-        outage_list = db.get_outages(days=days)
         
-        return jsonify({
+        return cached_json(('outages', days), lambda: {
             'period_days': days,
-            'outages': outage_list
+            'outages': db.get_outages(days=days)
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Grade bands, best first: (grade, minimum quality score, latency below, download above)
+PERFORMANCE_GRADES = (
+    ('A', 90, 30, 50),
+    ('B', 80, 50, 25),
+    ('C', 70, 75, 15),
+    ('D', 60, 100, 10),
+)
+
 def calculate_performance_grade(latency, download, upload, quality_score):
     """Calculate performance grade A-F based on metrics"""
-    if quality_score >= 90 and latency < 30 and download > 50:
-        return 'A'
-    elif quality_score >= 80 and latency < 50 and download > 25:
-        return 'B'
-    elif quality_score >= 70 and latency < 75 and download > 15:
-        return 'C'
-    elif quality_score >= 60 and latency < 100 and download > 10:
-        return 'D'
-    else:
-        return 'F'
+    for grade, min_quality, max_latency, min_download in PERFORMANCE_GRADES:
+        if quality_score >= min_quality and latency < max_latency and download > min_download:
+            return grade
+    return 'F'
 
-def calculate_week_summary(week_stats, week_start):
-    """Calculate weekly summary from daily stats"""
-    if not week_stats:
-        return {}
-    
-    total_days = len(week_stats)
-    avg_latency = sum(s.get('avg_latency_ms', 0) for s in week_stats) / total_days
-    avg_download = sum(s.get('avg_download_mbps', 0) for s in week_stats) / total_days
-    avg_upload = sum(s.get('avg_upload_mbps', 0) for s in week_stats) / total_days
-    avg_quality = sum(s.get('avg_quality_score', 0) for s in week_stats) / total_days
-    total_outages = sum(s.get('outage_count', 0) for s in week_stats)
-    total_outage_time = sum(s.get('total_outage_minutes', 0) for s in week_stats)
-    
+def report_grade(stats):
+    """Performance grade of a report row from its averages (missing ones count as 0)"""
+    return calculate_performance_grade(stats['avg_latency_ms'] or 0, stats['avg_download_mbps'] or 0,
+                                       stats['avg_upload_mbps'] or 0, stats['avg_quality_score'] or 0)
+
+def summarize_period_stats(period_stats):
+    """Round a period's aggregated daily stats for display and grade them"""
     return {
-        'week_start': week_start.isoformat(),
-        'week_end': (week_start + timedelta(days=6)).isoformat(),
-        'days_with_data': total_days,
-        'avg_latency_ms': round(avg_latency, 1),
-        'avg_download_mbps': round(avg_download, 1),
-        'avg_upload_mbps': round(avg_upload, 1),
-        'avg_quality_score': round(avg_quality, 1),
-        'total_outages': total_outages,
-        'total_outage_minutes': total_outage_time,
-        'performance_grade': calculate_performance_grade(avg_latency, avg_download, avg_upload, avg_quality)
+        'days_with_data': period_stats['days_with_data'],
+        'avg_latency_ms': round(period_stats['avg_latency_ms'] or 0, 1),
+        'avg_download_mbps': round(period_stats['avg_download_mbps'] or 0, 1),
+        'avg_upload_mbps': round(period_stats['avg_upload_mbps'] or 0, 1),
+        'avg_quality_score': round(period_stats['avg_quality_score'] or 0, 1),
+        'total_outages': period_stats['total_outages'] or 0,
+        'total_outage_minutes': period_stats['total_outage_minutes'] or 0,
+        'performance_grade': report_grade(period_stats)
     }
 
-def calculate_month_summary(month_stats, month_key):
-    """Calculate monthly summary from daily stats"""
-    if not month_stats:
-        return {}
-    
-    total_days = len(month_stats)
-    avg_latency = sum(s.get('avg_latency_ms', 0) for s in month_stats) / total_days
-    avg_download = sum(s.get('avg_download_mbps', 0) for s in month_stats) / total_days
-    avg_upload = sum(s.get('avg_upload_mbps', 0) for s in month_stats) / total_days
-    avg_quality = sum(s.get('avg_quality_score', 0) for s in month_stats) / total_days
-    total_outages = sum(s.get('outage_count', 0) for s in month_stats)
-    total_outage_time = sum(s.get('total_outage_minutes', 0) for s in month_stats)
-    
+def calculate_week_summary(week_stats):
+    """Calculate weekly summary from the week's aggregated daily stats"""
+    return {
+        'week_start': week_stats['period_start'],
+        'week_end': week_stats['period_end'],
+        **summarize_period_stats(week_stats)
+    }
+
+def calculate_month_summary(month_stats):
+    """Calculate monthly summary from the month's aggregated daily stats"""
     return {
-        'month': month_key,
-        'days_with_data': total_days,
-        'avg_latency_ms': round(avg_latency, 1),
-        'avg_download_mbps': round(avg_download, 1),
-        'avg_upload_mbps': round(avg_upload, 1),
-        'avg_quality_score': round(avg_quality, 1),
-        'total_outages': total_outages,
-        'total_outage_minutes': total_outage_time,
-        'performance_grade': calculate_performance_grade(avg_latency, avg_download, avg_upload, avg_quality)
+        'month': month_stats['period_start'],
+        **summarize_period_stats(month_stats)
     }
 
+def ndjson_response(rows):
+    """Stream rows as newline-delimited JSON, encoding each as it is sent"""
+    def generate():
+        for row in rows:
+            yield app.json.dumps(row) + '\n'
+    
+    return Response(generate(), mimetype='application/x-ndjson')
+
 @app.route('/api/historical/reports')
 def get_reports():
     """Get comprehensive daily/weekly/monthly reports"""
@@ -399,79 +723,31 @@ def get_reports():
         
         if report_type == 'daily':
             # Get daily statistics for the past N days
-            daily_stats = db.get_daily_stats(days)
-            
-            # Calculate performance grades
-            for stat in daily_stats:
-                grade = calculate_performance_grade(
-                    stat.get('avg_latency_ms', 0),
-                    stat.get('avg_download_mbps', 0),
-                    stat.get('avg_upload_mbps', 0),
-                    stat.get('avg_quality_score', 0)
-                )
-                stat['performance_grade'] = grade
+            reports = db.get_daily_stats(days)
             
-            return jsonify({
-                'success': True,
-                'report_type': 'daily',
-                'data': daily_stats
-            })
+            # Calculate performance grades (the averages stay unrounded; the page formats them)
+            for stat in reports:
+                stat['performance_grade'] = report_grade(stat)
             
         elif report_type == 'weekly':
-            # Group daily stats by week
-            daily_stats = db.get_daily_stats(days)
-            weekly_reports = []
-            
-            current_week = []
-            current_week_start = None
-            
-            for stat in daily_stats:
-                stat_date = datetime.strptime(stat['date'], '%Y-%m-%d').date()
-                week_start = stat_date - timedelta(days=stat_date.weekday())
-                
-                if current_week_start != week_start:
-                    if current_week:
-                        weekly_reports.append(calculate_week_summary(current_week, current_week_start))
-                    current_week = [stat]
-                    current_week_start = week_start
-                else:
-                    current_week.append(stat)
-            
-            if current_week:
-                weekly_reports.append(calculate_week_summary(current_week, current_week_start))
-            
-            return jsonify({
-                'success': True,
-                'report_type': 'weekly',
-                'data': weekly_reports
-            })
+            # Daily stats are grouped by week in the database
+            reports = [calculate_week_summary(week) for week in db.get_period_stats('week', days)]
             
         elif report_type == 'monthly':
-            # Group daily stats by month
-            daily_stats = db.get_daily_stats(days)
-            monthly_reports = {}
-            
-            for stat in daily_stats:
-                stat_date = datetime.strptime(stat['date'], '%Y-%m-%d').date()
-                month_key = stat_date.strftime('%Y-%m')
-                
-                if month_key not in monthly_reports:
-                    monthly_reports[month_key] = []
-                monthly_reports[month_key].append(stat)
-            
-            # Calculate monthly summaries
-            monthly_data = []
-            for month, stats in monthly_reports.items():
-                monthly_data.append(calculate_month_summary(stats, month))
-            
-            return jsonify({
-                'success': True,
-                'report_type': 'monthly',
-                'data': sorted(monthly_data, key=lambda x: x['month'], reverse=True)
-            })
+            # Daily stats are grouped by month in the database
+            reports = [calculate_month_summary(month) for month in db.get_period_stats('month', days)]
         
         else:
             return jsonify({'success': False, 'error': 'Invalid report type'}), 400
+        
+        if request.args.get('format') == 'ndjson':
+            return ndjson_response(reports)
+        
+        return jsonify({
+            'success': True,
+            'report_type': report_type,
+            'data': reports
+        })
             
     except Exception as e:
         app.logger.error(f"Error getting reports: {e}")
@@ -482,11 +758,10 @@ def get_advanced_analytics():
     """Get advanced performance analytics"""
     try:
         days = int(request.args.get('days', 30))
-        analytics = db.get_advanced_analytics(days)
-        return jsonify({
+        return cached_json(('analytics', days), lambda: {
             'success': True,
-            'data': analytics
-        })
+            'data': db.get_advanced_analytics(days)
+        }, max_age=AGGREGATE_MAX_AGE)
     except Exception as e:
         app.logger.error(f"Error getting advanced analytics: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -496,15 +771,55 @@ def get_performance_insights():
     """Get actionable performance insights"""
     try:
         days = int(request.args.get('days', 30))
-        insights = db.get_performance_insights(days)
-        return jsonify({
+        return cached_json(('insights', days), lambda: {
             'success': True,
-            'data': insights
-        })
+            'data': db.get_performance_insights(days)
+        }, max_age=AGGREGATE_MAX_AGE)
     except Exception as e:
         app.logger.error(f"Error getting performance insights: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/dashboard/bootstrap')
+def dashboard_bootstrap():
+    """Initial data for every analytics page section in one response"""
+    try:
+        days = int(request.args.get('days', 30))
+        trend_period = request.args.get('trend_period', 'hour')
+        trend_days = int(request.args.get('trend_days', 7))
+        
+        sections = {
+            'trends': lambda: {metric: decimated_trend_data(metric, trend_period, trend_days, TREND_MAX_POINTS,
+                                                            columnar=True)
+                               for metric in ('download_mbps', 'latency_ms')},
+            'comparison': lambda: db.get_performance_comparison('download_mbps'),
+            'analytics': lambda: db.get_advanced_analytics(days),
+            'insights': lambda: db.get_performance_insights(days),
+            'speedtest_summary': lambda: db.get_speed_test_summary(days=days),
+            'speedtest_trends': lambda: db.get_speed_test_trends(days=days)
+        }
+        
+        def build():
+            # Sections that fail are reported on their own - the page loads those from their endpoints
+            data, errors = {}, {}
+            for name, build_section in sections.items():
+                try:
+                    data[name] = build_section()
+                except Exception as e:
+                    app.logger.error(f"Error getting dashboard {name} data: {e}")
+                    errors[name] = str(e)
+            return {'success': True, 'data': data, 'errors': errors}
+        
+        # Only complete results are cached, so a failed section is retried on the next load
+        result = cached(('bootstrap', days, trend_period, trend_days), build, keep=lambda result: not result['errors'])
+        response = jsonify(result)
+        if not result['errors']:
+            # Shorter-lived than the aggregates alone: it also carries hourly trends and speed test results
+            response.cache_control.max_age = 60
+        return response
+    except Exception as e:
+        app.logger.error(f"Error getting dashboard bootstrap data: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
 @app.route('/api/collector/status')
 def collector_status():
     """Get data collector status"""
@@ -517,20 +832,13 @@ def run_speed_test():
     try:
         test_type = request.json.get('test_type', 'manual') if request.is_json else 'manual'
         
-        # Run speed test in background thread
-        import threading
-        result = {'status': 'starting', 'message': 'Speed test initiated'}
+        # Hand the test to the engine's worker - only one test runs at a time
+        test_id = speed_test_engine.request_test(test_type=test_type)
+        if test_id is None:
+            return jsonify({'status': 'busy', 'message': 'A speed test is already running'}), 409
         
-        def run_test():
-            try:
-                speed_test_engine.run_server_speed_test(test_type=test_type)
-            except Exception as e:
-                app.logger.error(f"Speed test error: {e}")
-        
-        test_thread = threading.Thread(target=run_test, daemon=True)
-        test_thread.start()
-        
-        return jsonify(result)
+        # The result pushed on /api/speedtest/events carries the same test_id
+        return jsonify({'status': 'starting', 'message': 'Speed test initiated', 'test_id': test_id})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -542,13 +850,21 @@ def get_speed_test_history():
         test_type = request.args.get('type')
         limit = int(request.args.get('limit', 50))
         
-        tests = db.get_speed_tests(days=days, test_type=test_type, limit=limit)
-        
-        return jsonify({
-            'success': True,
-            'data': tests,
-            'period_days': days
-        })
+        # Answer repeat polls with 304 until a test is added or ages out of the window
+        version = db.get_speed_tests_version(days=days, test_type=test_type)
+        etag = hashlib.blake2b(repr((version, days, test_type, limit)).encode('utf-8'), digest_size=8).hexdigest()
+        if etag in request.if_none_match:
+            response = make_response('', 304)
+        else:
+            tests = db.get_speed_tests(days=days, test_type=test_type, limit=limit)
+            response = jsonify({
+                'success': True,
+                'data': tests,
+                'period_days': days
+            })
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
     except Exception as e:
         app.logger.error(f"Error getting speed test history: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -598,6 +914,11 @@ def get_speed_test_schedules():
         app.logger.error(f"Error getting schedules: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@lru_cache(maxsize=1024)
+def is_valid_cron(cron_expression):
+    """Whether a cron expression parses, remembered per expression"""
+    return croniter.is_valid(cron_expression)
+
 @app.route('/api/speedtest/schedules', methods=['POST'])
 def create_speed_test_schedule():
     """Create a new speed test schedule"""
@@ -611,8 +932,7 @@ def create_speed_test_schedule():
             return jsonify({'success': False, 'error': 'Name and cron expression required'}), 400
         
         # Validate cron expression
-        from croniter import croniter
-        if not croniter.is_valid(cron_expression):
+        if not is_valid_cron(cron_expression):
             return jsonify({'success': False, 'error': 'Invalid cron expression'}), 400
         
         schedule_id = db.create_speed_test_schedule(name, cron_expression, enabled)
@@ -629,2877 +949,360 @@ def create_speed_test_schedule():
 @app.route('/api/chart-data')
 def chart_data():
     """Return chart data in JSON format"""
-    return jsonify(data_store.get_chart_data())
+    return Response(data_store.get_chart_json(), mimetype='application/json')
+
+def get_current_stats():
+    """Latest sampled stats point (raises the last poll error if the dish is unreachable)"""
+    dish_poller.get()
+    return data_store.latest()
 
 @app.route('/api/current-stats')
 def current_stats():
     """Return current statistics for updating charts"""
     try:
-        status = starlink_grpc.get_status()
-        speed_data = get_speed_data()
-        
-        # Get current metrics
-        latency = status.pop_ping_latency_ms if hasattr(status, 'pop_ping_latency_ms') else 0
-        downlink_mbps = speed_data['download_mbps'] if speed_data else 0
-        uplink_mbps = speed_data['upload_mbps'] if speed_data else 0
-        
-        # Obstruction info
-        fraction_obstructed = 0
-        if hasattr(status, 'obstruction_stats') and hasattr(status.obstruction_stats, 'fraction_obstructed'):
-            fraction_obstructed = status.obstruction_stats.fraction_obstructed * 100
-        
-        # SNR status
-        snr_above_noise = status.is_snr_above_noise_floor if hasattr(status, 'is_snr_above_noise_floor') else False
-        
-        # Calculate quality score
-        quality_score = calculate_quality_score(latency, downlink_mbps, uplink_mbps, fraction_obstructed, snr_above_noise)
-        
-        # Add to data store
-        data_store.add_data_point(latency, downlink_mbps, uplink_mbps, fraction_obstructed, quality_score)
-        
-        return jsonify({
-            'latency': round(latency, 1),
-            'download_mbps': round(downlink_mbps, 1),
-            'upload_mbps': round(uplink_mbps, 1),
-            'obstruction_pct': round(fraction_obstructed, 2),
-            'quality_score': round(quality_score, 0),
-            'timestamp': datetime.now().strftime('%H:%M:%S')
-        })
+        dish_poller.get()
+        # Every client polling within the same sample shares one encoded payload
+        return Response(data_store.get_latest_json(), mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# One reading per tick, pushed to every open dashboard instead of each tab polling
+stats_broadcaster = StatsBroadcaster(get_current_stats, interval=5, encode=app.json.dumps)
+stats_broadcaster.start()
+atexit.register(stats_broadcaster.stop)
+
+def event_stream(broadcaster):
+    """Server-Sent Events response relaying a broadcaster's messages to this client"""
+    subscription = broadcaster.subscribe()
+    
+    def generate():
+        try:
+            yield ': connected\n\n'  # Sends the headers now, so the client knows it is subscribed
+            while True:
+                try:
+                    message = subscription.get(timeout=15)
+                except queue.Empty:
+                    yield ': keepalive\n\n'  # Comment line keeps proxies from closing an idle stream
+                    continue
+                yield f'data: {message}\n\n'
+        finally:
+            broadcaster.unsubscribe(subscription)
+    
+    response = Response(generate(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@app.route('/api/stream')
+def stats_stream():
+    """Server-Sent Events stream of current statistics"""
+    return event_stream(stats_broadcaster)
+
+@app.route('/api/speedtest/events')
+def speed_test_events_stream():
+    """Server-Sent Events stream of speed test results as they are stored"""
+    return event_stream(speed_test_events)
+
 @app.route('/speedtest')
 def speedtest_interface():
     """Speed test interface with built-in testing"""
-    try:
-        # Get recent speed test history
-        recent_tests = db.get_speed_tests(days=7, limit=10) or []
-        summary = db.get_speed_test_summary(days=30) or {}
-        
-        # Ensure all summary values are numbers
-        summary = {
-            'total_tests': summary.get('total_tests') or 0,
-            'avg_download': summary.get('avg_download') or 0,
-            'avg_upload': summary.get('avg_upload') or 0,
-            'avg_ping': summary.get('avg_ping') or 0
-        }
-        
-        return f"""
-        <html>
-        <head>
-            <title>🚀 Starlink Speed Test</title>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    margin: 0;
-                    padding: 20px;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    min-height: 100vh;
-                }}
-                .container {{
-                    max-width: 1200px;
-                    margin: 0 auto;
-                    background: white;
-                    border-radius: 15px;
-                    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-                    padding: 30px;
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 40px;
-                }}
-                .header h1 {{
-                    color: #333;
-                    margin: 0;
-                    font-size: 2.5em;
-                }}
-                .main-nav {{
-                    background: rgba(255, 255, 255, 0.95);
-                    border-radius: 12px;
-                    padding: 20px 30px;
-                    margin-bottom: 30px;
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-                    backdrop-filter: blur(10px);
-                }}
-                .nav-brand {{
-                    display: flex;
-                    align-items: center;
-                    gap: 10px;
-                }}
-                .nav-logo {{
-                    font-size: 1.5em;
-                }}
-                .nav-title {{
-                    font-size: 1.2em;
-                    font-weight: 600;
-                    color: #333;
-                }}
-                .nav-links {{
-                    display: flex;
-                    gap: 8px;
-                }}
-                .nav-link {{
-                    display: flex;
-                    align-items: center;
-                    gap: 8px;
-                    padding: 12px 20px;
-                    border-radius: 8px;
-                    text-decoration: none;
-                    color: #666;
-                    font-weight: 500;
-                    transition: all 0.2s ease;
-                    background: transparent;
-                }}
-                .nav-link:hover {{
-                    background: #f0f4ff;
-                    color: #4f46e5;
-                    transform: translateY(-1px);
-                }}
-                .nav-link.active {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-                }}
-                .nav-link.active:hover {{
-                    transform: translateY(-2px);
-                    box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-                }}
-                .nav-icon {{
-                    font-size: 1.1em;
-                }}
-                .nav-text {{
-                    font-size: 0.95em;
-                }}
-                
-                .test-section {{
-                    background: #f8fafc;
-                    border-radius: 10px;
-                    padding: 30px;
-                    margin-bottom: 30px;
-                    text-align: center;
-                }}
-                .test-button {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    border: none;
-                    padding: 15px 40px;
-                    font-size: 1.2em;
-                    border-radius: 50px;
-                    cursor: pointer;
-                    transition: transform 0.2s;
-                    margin: 10px;
-                }}
-                .test-button:hover {{
-                    transform: translateY(-2px);
-                }}
-                .test-button:disabled {{
-                    background: #ccc;
-                    cursor: not-allowed;
-                    transform: none;
-                }}
-                
-                .results-section {{
-                    display: grid;
-                    grid-template-columns: 1fr 1fr;
-                    gap: 30px;
-                    margin-bottom: 30px;
-                }}
-                .results-card {{
-                    background: white;
-                    border-radius: 10px;
-                    padding: 20px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                }}
-                .results-card h3 {{
-                    margin: 0 0 20px 0;
-                    color: #333;
-                }}
-                
-                .stats-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }}
-                .stat-card {{
-                    background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
-                    padding: 20px;
-                    border-radius: 10px;
-                    text-align: center;
-                }}
-                .stat-value {{
-                    font-size: 1.8em;
-                    font-weight: bold;
-                    color: #333;
-                    margin-bottom: 5px;
-                }}
-                .stat-label {{
-                    font-size: 0.9em;
-                    color: #666;
-                }}
-                
-                .history-table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin-top: 20px;
-                }}
-                .history-table th,
-                .history-table td {{
-                    padding: 12px;
-                    text-align: left;
-                    border-bottom: 1px solid #eee;
-                }}
-                .history-table th {{
-                    background: #f8fafc;
-                    font-weight: 600;
-                }}
-                
-                .status-indicator {{
-                    padding: 4px 12px;
-                    border-radius: 12px;
-                    font-size: 0.8em;
-                    font-weight: 600;
-                }}
-                .status-completed {{ background: #d1fae5; color: #065f46; }}
-                .status-running {{ background: #dbeafe; color: #1e40af; }}
-                .status-failed {{ background: #fecaca; color: #991b1b; }}
-                
-                .loading {{
-                    display: none;
-                    text-align: center;
-                    padding: 20px;
-                    color: #666;
-                }}
-                
-                @media (max-width: 768px) {{
-                    .main-nav {{
-                        flex-direction: column;
-                        gap: 20px;
-                        padding: 20px;
-                    }}
-                    .nav-brand {{
-                        justify-content: center;
-                    }}
-                    .nav-links {{
-                        justify-content: center;
-                        flex-wrap: wrap;
-                    }}
-                    .nav-link {{
-                        padding: 10px 16px;
-                    }}
-                    .nav-text {{
-                        font-size: 0.85em;
-                    }}
-                    .results-section {{
-                        grid-template-columns: 1fr;
-                    }}
-                    .stats-grid {{
-                        grid-template-columns: 1fr 1fr;
-                    }}
-                    .header h1 {{
-                        font-size: 2em;
-                    }}
-                }}
-                
-                @media (max-width: 480px) {{
-                    .nav-text {{
-                        display: none;
-                    }}
-                    .nav-link {{
-                        padding: 12px;
-                    }}
-                    .stats-grid {{
-                        grid-template-columns: 1fr;
-                    }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🚀 Starlink Speed Test</h1>
-                </div>
-                
-                <nav class="main-nav">
-                    <div class="nav-brand">
-                        <span class="nav-logo">🛰️</span>
-                        <span class="nav-title">Starlink Monitor</span>
-                    </div>
-                    <div class="nav-links">
-                        <a href="/" class="nav-link">
-                            <span class="nav-icon">📊</span>
-                            <span class="nav-text">Live Monitor</span>
-                        </a>
-                        <a href="/speedtest" class="nav-link active">
-                            <span class="nav-icon">⚡</span>
-                            <span class="nav-text">Speed Test</span>
-                        </a>
-                        <a href="/analytics" class="nav-link">
-                            <span class="nav-icon">📈</span>
-                            <span class="nav-text">Analytics</span>
-                        </a>
-                        <a href="/advanced" class="nav-link">
-                            <span class="nav-icon">🔬</span>
-                            <span class="nav-text">Advanced</span>
-                        </a>
-                    </div>
-                </nav>
-                
-                <div class="test-section">
-                    <h2>Run Speed Test</h2>
-                    <p>Test your Starlink connection speed using our built-in speed test engine</p>
-                    <button id="runTestBtn" class="test-button" onclick="runSpeedTest()">🚀 Start Speed Test</button>
-                    <button class="test-button" onclick="window.open('https://fast.com', '_blank')">🌐 External Test (Fast.com)</button>
-                    
-                    <div id="testStatus" class="loading">
-                        <p>⏳ Running speed test... This may take 1-2 minutes</p>
-                        <div style="margin: 20px 0;">
-                            <div style="background: #e5e7eb; border-radius: 10px; height: 6px; overflow: hidden;">
-                                <div id="progressBar" style="background: #667eea; height: 100%; width: 0%; transition: width 0.5s;"></div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="stats-grid">
-                    <div class="stat-card">
-                        <div class="stat-value">{summary.get('total_tests', 0) or 0}</div>
-                        <div class="stat-label">Total Tests (30 days)</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value">{(summary.get('avg_download') or 0):.1f} Mbps</div>
-                        <div class="stat-label">Avg Download Speed</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value">{(summary.get('avg_upload') or 0):.1f} Mbps</div>
-                        <div class="stat-label">Avg Upload Speed</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="stat-value">{(summary.get('avg_ping') or 0):.0f} ms</div>
-                        <div class="stat-label">Avg Latency</div>
-                    </div>
-                </div>
-                
-                <div class="results-section">
-                    <div class="results-card">
-                        <h3>📊 Recent Test Results</h3>
-                        <table class="history-table">
-                            <thead>
-                                <tr>
-                                    <th>Date</th>
-                                    <th>Download</th>
-                                    <th>Upload</th>
-                                    <th>Ping</th>
-                                    <th>Status</th>
-                                </tr>
-                            </thead>
-                            <tbody id="historyTableBody">
-                                {"".join([
-                                    f'''<tr>
-                                        <td>{str(test.get('timestamp', ''))[:16]}</td>
-                                        <td>{(test.get('download_mbps') or 0):.1f} Mbps</td>
-                                        <td>{(test.get('upload_mbps') or 0):.1f} Mbps</td>
-                                        <td>{(test.get('ping_ms') or 0):.0f} ms</td>
-                                        <td><span class="status-indicator status-{test.get('status', 'completed')}">{str(test.get('status', 'completed')).title()}</span></td>
-                                    </tr>'''
-                                    for test in recent_tests[:5]
-                                ])}
-                            </tbody>
-                        </table>
-                        <p style="text-align: center; margin-top: 15px;">
-                            <a href="/analytics" style="color: #667eea;">View Full History →</a>
-                        </p>
-                    </div>
-                    
-                    <div class="results-card">
-                        <h3>⏰ Speed Test Scheduling</h3>
-                        <p>Set up automatic speed tests to track your connection over time.</p>
-                        
-                        <div style="margin: 20px 0;">
-                            <label for="scheduleName" style="display: block; margin-bottom: 5px; font-weight: 600;">Schedule Name:</label>
-                            <input type="text" id="scheduleName" placeholder="Daily Morning Test" style="width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 4px; margin-bottom: 10px;">
-                        </div>
-                        
-                        <div style="margin: 20px 0;">
-                            <label for="scheduleType" style="display: block; margin-bottom: 5px; font-weight: 600;">Frequency:</label>
-                            <select id="scheduleType" style="width: 100%; padding: 8px; border: 1px solid #ddd; border-radius: 4px;">
-                                <option value="0 9 * * *">Daily at 9 AM</option>
-                                <option value="0 12 * * *">Daily at Noon</option>
-                                <option value="0 21 * * *">Daily at 9 PM</option>
-                                <option value="0 12 * * 0">Weekly (Sunday at Noon)</option>
-                                <option value="0 */6 * * *">Every 6 Hours</option>
-                            </select>
-                        </div>
-                        
-                        <button class="test-button" onclick="createSchedule()" style="width: 100%; margin-top: 10px;">⏰ Create Schedule</button>
-                        
-                        <div id="scheduleStatus" style="margin-top: 15px; padding: 10px; border-radius: 5px; display: none;"></div>
-                    </div>
-                </div>
-            </div>
-            
-            <script>
-                let testRunning = false;
-                
-                async function runSpeedTest() {{
-                    if (testRunning) return;
-                    
-                    testRunning = true;
-                    const button = document.getElementById('runTestBtn');
-                    const status = document.getElementById('testStatus');
-                    const progressBar = document.getElementById('progressBar');
-                    
-                    button.disabled = true;
-                    button.textContent = '⏳ Testing...';
-                    status.style.display = 'block';
-                    
-                    // Simulate progress
-                    let progress = 0;
-                    const progressInterval = setInterval(() => {{
-                        progress += Math.random() * 10;
-                        if (progress > 90) progress = 90;
-                        progressBar.style.width = progress + '%';
-                    }}, 1000);
-                    
-                    try {{
-                        const response = await fetch('/api/speedtest/run', {{
-                            method: 'POST',
-                            headers: {{'Content-Type': 'application/json'}},
-                            body: JSON.stringify({{'test_type': 'manual'}})
-                        }});
-                        
-                        const result = await response.json();
-                        
-                        if (result.status === 'starting') {{
-                            // Wait for test to complete (check every 5 seconds)
-                            let attempts = 0;
-                            const checkInterval = setInterval(async () => {{
-                                attempts++;
-                                if (attempts > 24) {{ // Max 2 minutes
-                                    clearInterval(checkInterval);
-                                    clearInterval(progressInterval);
-                                    showTestComplete('Timeout - test may still be running in background');
-                                    return;
-                                }}
-                                
-                                try {{
-                                    const historyResponse = await fetch('/api/speedtest/history?limit=1');
-                                    const historyData = await historyResponse.json();
-                                    
-                                    if (historyData.success && historyData.data.length > 0) {{
-                                        const latestTest = historyData.data[0];
-                                        const testTime = new Date(latestTest.timestamp);
-                                        const now = new Date();
-                                        
-                                        // If latest test is less than 2 minutes old, it's probably our test
-                                        if ((now - testTime) < 120000) {{
-                                            clearInterval(checkInterval);
-                                            clearInterval(progressInterval);
-                                            progressBar.style.width = '100%';
-                                            setTimeout(() => {{
-                                                showTestComplete(latestTest);
-                                                location.reload(); // Refresh to show new data
-                                            }}, 1000);
-                                        }}
-                                    }}
-                                }} catch (e) {{
-                                    console.error('Error checking test status:', e);
-                                }}
-                            }}, 5000);
-                        }}
-                    }} catch (error) {{
-                        clearInterval(progressInterval);
-                        showTestComplete('Error: ' + error.message);
-                    }}
-                }}
-                
-                function showTestComplete(result) {{
-                    testRunning = false;
-                    const button = document.getElementById('runTestBtn');
-                    const status = document.getElementById('testStatus');
-                    
-                    button.disabled = false;
-                    button.textContent = '🚀 Start Speed Test';
-                    
-                    if (typeof result === 'object') {{
-                        status.innerHTML = `
-                            <h3>✅ Test Complete!</h3>
-                            <p><strong>Download:</strong> ${{result.download_mbps.toFixed(1)}} Mbps</p>
-                            <p><strong>Upload:</strong> ${{result.upload_mbps.toFixed(1)}} Mbps</p>
-                            <p><strong>Ping:</strong> ${{result.ping_ms.toFixed(0)}} ms</p>
-                        `;
-                    }} else {{
-                        status.innerHTML = `<h3>ℹ️ ${{result}}</h3>`;
-                    }}
-                    
-                    setTimeout(() => {{
-                        status.style.display = 'none';
-                    }}, 10000);
-                }}
-                
-                async function createSchedule() {{
-                    const name = document.getElementById('scheduleName').value;
-                    const cronExpression = document.getElementById('scheduleType').value;
-                    const statusDiv = document.getElementById('scheduleStatus');
-                    
-                    if (!name.trim()) {{
-                        statusDiv.style.display = 'block';
-                        statusDiv.style.backgroundColor = '#fecaca';
-                        statusDiv.style.color = '#991b1b';
-                        statusDiv.textContent = 'Please enter a schedule name';
-                        return;
-                    }}
-                    
-                    try {{
-                        const response = await fetch('/api/speedtest/schedules', {{
-                            method: 'POST',
-                            headers: {{'Content-Type': 'application/json'}},
-                            body: JSON.stringify({{
-                                name: name,
-                                cron_expression: cronExpression,
-                                enabled: true
-                            }})
-                        }});
-                        
-                        const result = await response.json();
-                        
-                        statusDiv.style.display = 'block';
-                        if (result.success) {{
-                            statusDiv.style.backgroundColor = '#d1fae5';
-                            statusDiv.style.color = '#065f46';
-                            statusDiv.textContent = 'Schedule created successfully!';
-                            document.getElementById('scheduleName').value = '';
-                        }} else {{
-                            statusDiv.style.backgroundColor = '#fecaca';
-                            statusDiv.style.color = '#991b1b';
-                            statusDiv.textContent = 'Error: ' + result.error;
-                        }}
-                        
-                        setTimeout(() => {{
-                            statusDiv.style.display = 'none';
-                        }}, 5000);
-                        
-                    }} catch (error) {{
-                        statusDiv.style.display = 'block';
-                        statusDiv.style.backgroundColor = '#fecaca';
-                        statusDiv.style.color = '#991b1b';
-                        statusDiv.textContent = 'Error creating schedule: ' + error.message;
-                    }}
-                }}
-            </script>
-        </body>
-        </html>
-        """
-    except Exception as e:
-        return f"""
-        <html>
-        <head><title>Speed Test Error</title></head>
-        <body style="font-family: Arial, sans-serif; margin: 40px;">
-        <div style="background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-            <h1 style="color: #ef4444;">⚠️ Speed Test Error</h1>
-            <p style="color: #666;">Unable to load speed test interface</p>
-            <div style="background: #fee; padding: 15px; border-radius: 5px; margin: 20px 0;">
-                <strong>Error details:</strong><br>
-                <code style="color: #c00;">{str(e)}</code>
-            </div>
-            <p><a href="/" style="color: #667eea;">← Back to Monitor</a></p>
-        </div>
-        </body>
-        </html>
-        """
+    # Static page - its summary cards and recent results are fetched from the speed test API
+    response = app.send_static_file('speedtest.html')
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
+
+# Compiled once - each request only fills in the summary figures
+_ANALYTICS_PAGE = app.jinja_env.get_template('analytics.html')
+
+def _sparkline(points):
+    """Inline SVG polyline of points, scaled into a 100x30 box (empty if under two points)"""
+    values = [value for value in points if value is not None]
+    if len(values) < 2:
+        return Markup('')
+    low, high = min(values), max(values)
+    scale = 28 / ((high - low) or 1)
+    step = 100 / (len(values) - 1)
+    coords = ' '.join(f'{i * step:.1f},{29 - (value - low) * scale:.1f}' for i, value in enumerate(values))
+    return Markup(f'<svg class="sparkline" viewBox="0 0 100 30" preserveAspectRatio="none">'
+                  f'<polyline points="{coords}"/></svg>')
+
+def daily_sparklines(days=7):
+    """Sparkline per summary card metric from the daily stats, oldest day first"""
+    daily = db.get_daily_stats(days=days)[::-1]
+    return {key: _sparkline([day[column] for day in daily])
+            for key, column in (('download', 'avg_download_mbps'), ('upload', 'avg_upload_mbps'),
+                                ('latency', 'avg_latency_ms'), ('quality', 'avg_quality_score'))}
 
 @app.route('/analytics')
 def analytics():
     """Analytics dashboard with historical data and trends"""
-    try:
-        # Get summary stats for the overview
-        summary_7d = db.get_summary_stats(days=7)
-        summary_30d = db.get_summary_stats(days=30)
-        
-        return f"""
+    # Get summary stats for the overview
+    windows = cached_summary_windows(7, 30)
+    summary_7d, summary_30d = windows[7], windows[30]
+    sparklines = cached(('sparklines', 7), daily_sparklines)
+    
+    # The cards are filled in by analytics.js from this state, encoded once
+    response = make_response(_ANALYTICS_PAGE.render(
+        dash={'s7': summary_7d, 's30': summary_30d},
+        summary_7d=summary_7d,
+        summary_30d=summary_30d,
+        sparklines=sparklines,
+        updated=time.strftime('%Y-%m-%d %H:%M:%S')
+    ))
+    # Quick refreshes reuse the browser's copy - the summaries are cached server-side for longer anyway
+    response.headers['Cache-Control'] = 'private, max-age=15'
+    return response
+
+# Static parts of the dashboard page, encoded once at import. Only the body
+# between them (templates/index.html) carries per-request values; the page's
+# CSS and chart script are static files the browser caches.
+_INDEX_HEAD = """
         <!DOCTYPE html>
         <html>
         <head>
-            <title>Starlink Analytics Dashboard</title>
+            <title>Starlink Speed Monitor</title>
             <meta charset="utf-8">
             <meta name="viewport" content="width=device-width, initial-scale=1">
-            <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-            <script src="https://cdn.jsdelivr.net/npm/date-fns@2.29.3/index.min.js"></script>
-            <style>
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Arial, sans-serif; 
-                    margin: 0; 
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: #333;
-                }}
-                .container {{
-                    max-width: 1400px; 
-                    margin: 20px auto; 
-                    background: white; 
-                    padding: 30px; 
-                    border-radius: 15px; 
-                    box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                }}
-                h1 {{
-                    color: #333; 
-                    margin-bottom: 30px; 
-                    display: flex; 
-                    align-items: center;
-                }}
-                h2 {{
-                    color: #555;
-                    border-bottom: 2px solid #eee;
-                    padding-bottom: 10px;
-                    margin: 30px 0 20px 0;
-                }}
-                .main-nav {{
-                    background: rgba(255, 255, 255, 0.95);
-                    border-radius: 12px;
-                    padding: 20px 30px;
-                    margin-bottom: 30px;
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-                    backdrop-filter: blur(10px);
-                }}
-                .nav-brand {{
-                    display: flex;
-                    align-items: center;
-                    gap: 10px;
-                }}
-                .nav-logo {{
-                    font-size: 1.5em;
-                }}
-                .nav-title {{
-                    font-size: 1.2em;
-                    font-weight: 600;
-                    color: #333;
-                }}
-                .nav-links {{
-                    display: flex;
-                    gap: 8px;
-                }}
-                .nav-link {{
-                    display: flex;
-                    align-items: center;
-                    gap: 8px;
-                    padding: 12px 20px;
-                    border-radius: 8px;
-                    text-decoration: none;
-                    color: #666;
-                    font-weight: 500;
-                    transition: all 0.2s ease;
-                    background: transparent;
-                }}
-                .nav-link:hover {{
-                    background: #f0f4ff;
-                    color: #4f46e5;
-                    transform: translateY(-1px);
-                }}
-                .nav-link.active {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-                }}
-                .nav-link.active:hover {{
-                    transform: translateY(-2px);
-                    box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-                }}
-                .nav-icon {{
-                    font-size: 1.1em;
-                }}
-                .nav-text {{
-                    font-size: 0.95em;
-                }}
-                
-                /* Summary Cards */
-                .summary-grid {{ 
-                    display: grid; 
-                    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); 
-                    gap: 20px; 
-                    margin-bottom: 30px;
-                }}
-                .summary-card {{
-                    padding: 20px; 
-                    background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); 
-                    border-radius: 10px;
-                    text-align: center;
-                }}
-                .summary-title {{ font-size: 0.9em; color: #666; margin-bottom: 5px; }}
-                .summary-value {{ font-size: 1.8em; font-weight: bold; color: #333; }}
-                .summary-period {{ font-size: 0.7em; color: #999; margin-top: 5px; }}
-                
-                /* Chart Grid */
-                .charts-grid {{
-                    display: grid;
-                    grid-template-columns: 1fr;
-                    gap: 30px;
-                    margin-bottom: 30px;
-                }}
-                .chart-row {{
-                    display: grid;
-                    grid-template-columns: 1fr 1fr;
-                    gap: 20px;
-                }}
-                .chart-container {{
-                    background: #f8f9fa;
-                    padding: 20px;
-                    border-radius: 10px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                }}
-                .chart-title {{
-                    font-size: 1.2em;
-                    font-weight: bold;
-                    color: #333;
-                    margin-bottom: 15px;
-                    text-align: center;
-                }}
-                .chart-controls {{
-                    text-align: center;
-                    margin-bottom: 15px;
-                }}
-                .chart-controls select {{
-                    margin: 0 10px;
-                    padding: 5px 10px;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                }}
-                
-                /* Responsive */
-                @media (max-width: 768px) {{
-                    .main-nav {{
-                        flex-direction: column;
-                        gap: 20px;
-                        padding: 20px;
-                    }}
-                    .nav-brand {{
-                        justify-content: center;
-                    }}
-                    .nav-links {{
-                        justify-content: center;
-                        flex-wrap: wrap;
-                    }}
-                    .nav-link {{
-                        padding: 10px 16px;
-                    }}
-                    .nav-text {{
-                        font-size: 0.85em;
-                    }}
-                    .chart-row {{
-                        grid-template-columns: 1fr;
-                    }}
-                    .container {{
-                        margin: 10px;
-                        padding: 20px;
-                    }}
-                }}
-                
-                @media (max-width: 480px) {{
-                    .nav-text {{
-                        display: none;
-                    }}
-                    .nav-link {{
-                        padding: 12px;
-                    }}
-                    h1 {{
-                        font-size: 1.8em;
-                    }}
-                    .summary-grid {{
-                        grid-template-columns: 1fr;
-                    }}
-                }}
-                
-                .good {{ color: #10b981; }}
-                .warning {{ color: #f59e0b; }}
-                .bad {{ color: #ef4444; }}
-                .loading {{ text-align: center; padding: 40px; color: #666; }}
-                
-                /* Reports Section */
-                .reports-section {{ margin-top: 30px; }}
-                .report-controls {{
-                    display: flex;
-                    gap: 15px;
-                    margin-bottom: 20px;
-                    align-items: center;
-                    flex-wrap: wrap;
-                }}
-                .report-controls select {{
-                    padding: 8px 12px;
-                    border: 1px solid #ddd;
-                    border-radius: 4px;
-                    font-size: 0.9em;
-                }}
-                .refresh-btn {{
-                    padding: 8px 16px;
-                    background: #667eea;
-                    color: white;
-                    border: none;
-                    border-radius: 4px;
-                    cursor: pointer;
-                    font-size: 0.9em;
-                }}
-                .refresh-btn:hover {{ background: #5a67d8; }}
-                
-                .reports-container {{ margin-top: 20px; }}
-                .report-table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    background: white;
-                    border-radius: 8px;
-                    overflow: hidden;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                }}
-                .report-table th,
-                .report-table td {{
-                    padding: 12px;
-                    text-align: left;
-                    border-bottom: 1px solid #eee;
-                }}
-                .report-table th {{
-                    background: #f8fafc;
-                    font-weight: 600;
-                    color: #374151;
-                    font-size: 0.85em;
-                    text-transform: uppercase;
-                    letter-spacing: 0.5px;
-                }}
-                .report-table tr:hover {{
-                    background: #f9fafb;
-                }}
-                .report-table tr:last-child td {{
-                    border-bottom: none;
-                }}
-                .grade-badge {{
-                    padding: 4px 8px;
-                    border-radius: 12px;
-                    font-size: 0.8em;
-                    font-weight: 600;
-                    display: inline-block;
-                    min-width: 20px;
-                    text-align: center;
-                }}
-                .grade-A {{ background: #d1fae5; color: #065f46; }}
-                .grade-B {{ background: #dbeafe; color: #1e40af; }}
-                .grade-C {{ background: #fef3c7; color: #92400e; }}
-                .grade-D {{ background: #fed7aa; color: #9a3412; }}
-                .grade-F {{ background: #fecaca; color: #991b1b; }}
-                
-                /* Advanced Analytics Section */
-                .analytics-section {{ margin-top: 30px; }}
-                .analytics-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }}
-                .analytics-card {{
-                    background: white;
-                    padding: 20px;
-                    border-radius: 10px;
-                    box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-                    border-left: 4px solid #667eea;
-                }}
-                .analytics-card h3 {{
-                    margin: 0 0 15px 0;
-                    color: #374151;
-                    font-size: 1.1em;
-                }}
-                .comparison-row {{
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    padding: 10px 0;
-                    border-bottom: 1px solid #f3f4f6;
-                }}
-                .comparison-row:last-child {{
-                    border-bottom: none;
-                }}
-                .comparison-label {{
-                    font-weight: 600;
-                    color: #6b7280;
-                }}
-                .comparison-value {{
-                    font-weight: bold;
-                }}
-                .metric-badge {{
-                    padding: 4px 12px;
-                    border-radius: 12px;
-                    font-size: 0.85em;
-                    font-weight: 600;
-                }}
-                .metric-excellent {{ background: #d1fae5; color: #065f46; }}
-                .metric-good {{ background: #dbeafe; color: #1e40af; }}
-                .metric-fair {{ background: #fef3c7; color: #92400e; }}
-                .metric-poor {{ background: #fed7aa; color: #9a3412; }}
-                .metric-bad {{ background: #fecaca; color: #991b1b; }}
-                
-                /* Performance Insights */
-                .insights-section {{ margin-top: 30px; }}
-                .insights-container {{ margin-top: 20px; }}
-                .insight-item {{
-                    background: white;
-                    padding: 20px;
-                    border-radius: 8px;
-                    margin-bottom: 15px;
-                    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                    border-left: 4px solid #6b7280;
-                }}
-                .insight-high {{ border-left-color: #ef4444; }}
-                .insight-medium {{ border-left-color: #f59e0b; }}
-                .insight-low {{ border-left-color: #10b981; }}
-                .insight-title {{
-                    font-weight: bold;
-                    color: #374151;
-                    margin-bottom: 5px;
-                }}
-                .insight-description {{
-                    color: #6b7280;
-                    margin-bottom: 10px;
-                }}
-                .insight-recommendation {{
-                    background: #f9fafb;
-                    padding: 10px;
-                    border-radius: 4px;
-                    font-size: 0.9em;
-                    color: #374151;
-                    font-style: italic;
-                }}
-            </style>
+            <link rel="preconnect" href="https://cdn.jsdelivr.net">
+            <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.1/dist/chart.umd.min.js" defer></script>
+            <link rel="stylesheet" href="/static/dashboard.css">
         </head>
         <body>
-        <div class="container">
-            <h1>📊 Starlink Analytics Dashboard</h1>
-            
-            <nav class="main-nav">
-                <div class="nav-brand">
-                    <span class="nav-logo">🛰️</span>
-                    <span class="nav-title">Starlink Monitor</span>
-                </div>
-                <div class="nav-links">
-                    <a href="/" class="nav-link">
-                        <span class="nav-icon">📊</span>
-                        <span class="nav-text">Live Monitor</span>
-                    </a>
-                    <a href="/speedtest" class="nav-link">
-                        <span class="nav-icon">⚡</span>
-                        <span class="nav-text">Speed Test</span>
-                    </a>
-                    <a href="/analytics" class="nav-link active">
-                        <span class="nav-icon">📈</span>
-                        <span class="nav-text">Analytics</span>
-                    </a>
-                    <a href="/advanced" class="nav-link">
-                        <span class="nav-icon">🔬</span>
-                        <span class="nav-text">Advanced</span>
-                    </a>
-                </div>
-            </nav>
-            
-            <h2>📈 Summary Statistics</h2>
-            <div class="summary-grid">
-                <div class="summary-card">
-                    <div class="summary-title">Avg Download Speed</div>
-                    <div class="summary-value good">{summary_7d.get('avg_download', 0):.1f} Mbps</div>
-                    <div class="summary-period">Last 7 days</div>
-                </div>
-                <div class="summary-card">
-                    <div class="summary-title">Avg Upload Speed</div>
-                    <div class="summary-value good">{summary_7d.get('avg_upload', 0):.1f} Mbps</div>
-                    <div class="summary-period">Last 7 days</div>
-                </div>
-                <div class="summary-card">
-                    <div class="summary-title">Avg Latency</div>
-                    <div class="summary-value {'good' if summary_7d.get('avg_latency', 0) < 50 else 'warning'}">{summary_7d.get('avg_latency', 0):.0f} ms</div>
-                    <div class="summary-period">Last 7 days</div>
-                </div>
-                <div class="summary-card">
-                    <div class="summary-title">Connection Quality</div>
-                    <div class="summary-value good">{summary_7d.get('avg_quality', 0):.0f}%</div>
-                    <div class="summary-period">Last 7 days</div>
-                </div>
-                <div class="summary-card">
-                    <div class="summary-title">Total Measurements</div>
-                    <div class="summary-value">{summary_30d.get('total_measurements', 0):,}</div>
-                    <div class="summary-period">Last 30 days</div>
-                </div>
-                <div class="summary-card">
-                    <div class="summary-title">Outages</div>
-                    <div class="summary-value {'good' if summary_30d.get('outage_count', 0) == 0 else 'bad'}">{summary_30d.get('outage_count', 0)}</div>
-                    <div class="summary-period">Last 30 days ({summary_30d.get('total_outage_seconds', 0)/3600:.1f}h total)</div>
-                </div>
-            </div>
-            
-            <h2>📊 Historical Trends</h2>
-            <div class="charts-grid">
-                <div class="chart-row">
-                    <div class="chart-container">
-                        <div class="chart-title">Speed Trends Over Time</div>
-                        <div class="chart-controls">
-                            <select id="speedPeriod">
-                                <option value="hour">Hourly</option>
-                                <option value="day">Daily</option>
-                            </select>
-                            <select id="speedDays">
-                                <option value="7">Last 7 days</option>
-                                <option value="14">Last 14 days</option>
-                                <option value="30">Last 30 days</option>
-                            </select>
-                        </div>
-                        <canvas id="speedTrendChart" width="400" height="250"></canvas>
-                    </div>
-                    
-                    <div class="chart-container">
-                        <div class="chart-title">Latency Trends</div>
-                        <div class="chart-controls">
-                            <select id="latencyPeriod">
-                                <option value="hour">Hourly</option>
-                                <option value="day">Daily</option>
-                            </select>
-                            <select id="latencyDays">
-                                <option value="7">Last 7 days</option>
-                                <option value="14">Last 14 days</option>
-                                <option value="30">Last 30 days</option>
-                            </select>
-                        </div>
-                        <canvas id="latencyTrendChart" width="400" height="250"></canvas>
-                    </div>
-                </div>
-                
-                <div class="chart-row">
-                    <div class="chart-container">
-                        <div class="chart-title">Performance by Hour of Day</div>
-                        <canvas id="hourlyPerformanceChart" width="400" height="250"></canvas>
-                    </div>
-                    
-                    <div class="chart-container">
-                        <div class="chart-title">Performance by Day of Week</div>
-                        <canvas id="weeklyPerformanceChart" width="400" height="250"></canvas>
-                    </div>
-                </div>
-            </div>
-            
-            <h2>📋 Performance Reports</h2>
-            <div class="reports-section">
-                <div class="report-controls">
-                    <select id="reportType">
-                        <option value="daily">Daily Reports</option>
-                        <option value="weekly">Weekly Reports</option>
-                        <option value="monthly">Monthly Reports</option>
-                    </select>
-                    <select id="reportDays">
-                        <option value="30">Last 30 days</option>
-                        <option value="60">Last 60 days</option>
-                        <option value="90">Last 90 days</option>
-                    </select>
-                    <button id="loadReports" class="refresh-btn">🔄 Load Reports</button>
-                </div>
-                <div id="reportsContainer" class="reports-container">
-                    <div class="loading">📊 Click "Load Reports" to view performance data</div>
-                </div>
-            </div>
-            
-            <h2>🔍 Advanced Analytics</h2>
-            <div class="analytics-section">
-                <div class="analytics-grid">
-                    <div class="analytics-card">
-                        <h3>⏰ Day vs Night Performance</h3>
-                        <div id="dayNightComparison" class="comparison-data">
-                            <div class="loading">Loading comparison...</div>
-                        </div>
-                    </div>
-                    
-                    <div class="analytics-card">
-                        <h3>🎯 Quality Distribution</h3>
-                        <div id="qualityDistribution" class="distribution-data">
-                            <div class="loading">Loading distribution...</div>
-                        </div>
-                    </div>
-                    
-                    <div class="analytics-card">
-                        <h3>📊 Speed Consistency</h3>
-                        <div id="speedConsistency" class="consistency-data">
-                            <div class="loading">Loading consistency...</div>
-                        </div>
-                    </div>
-                    
-                    <div class="analytics-card">
-                        <h3>⚡ Peak Performance Hours</h3>
-                        <div id="peakHours" class="peak-data">
-                            <div class="loading">Loading peak hours...</div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            
-            <h2>🚀 Speed Test Analytics</h2>
-            <div class="speedtest-section">
-                <div class="analytics-grid">
-                    <div class="analytics-card">
-                        <h3>📊 Speed Test Summary</h3>
-                        <div id="speedTestSummary" class="summary-data">
-                            <div class="loading">Loading summary...</div>
-                        </div>
-                    </div>
-                    
-                    <div class="analytics-card">
-                        <h3>📈 Speed Test Trends</h3>
-                        <div class="chart-container">
-                            <canvas id="speedTestTrendChart" width="400" height="200"></canvas>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="analytics-card" style="margin-top: 20px;">
-                    <h3>🚀 Quick Speed Test</h3>
-                    <div style="text-align: center; padding: 20px;">
-                        <p>Run a speed test directly from the analytics dashboard</p>
-                        <a href="/speedtest" class="test-button" style="display: inline-block; text-decoration: none; padding: 12px 30px; background: #667eea; color: white; border-radius: 25px; margin: 10px;">🚀 Launch Speed Test Interface</a>
-                    </div>
-                </div>
-            </div>
-            
-            <h2>💡 Performance Insights</h2>
-            <div class="insights-section">
-                <div id="performanceInsights" class="insights-container">
-                    <div class="loading">Loading insights...</div>
-                </div>
-            </div>
-            
-            <div id="loading" class="loading">📊 Loading analytics data...</div>
-            
-            <div style="text-align: center; margin-top: 30px; color: #666; font-size: 0.9em;">
-                Data collection started: {summary_30d.get('oldest_data', 'N/A')}<br>
-                Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}
-            </div>
-        </div>
+""".encode('utf-8')
 
-        <script>
-        // Chart configurations
-        const chartConfig = {{
-            responsive: true,
-            maintainAspectRatio: false,
-            scales: {{
-                y: {{
-                    beginAtZero: true,
-                    grid: {{ color: 'rgba(0,0,0,0.1)' }},
-                    ticks: {{ font: {{ size: 10 }} }}
-                }},
-                x: {{
-                    grid: {{ color: 'rgba(0,0,0,0.1)' }},
-                    ticks: {{ 
-                        font: {{ size: 10 }},
-                        maxTicksLimit: 12
-                    }}
-                }}
-            }},
-            plugins: {{
-                legend: {{ 
-                    display: true,
-                    position: 'top',
-                    labels: {{ font: {{ size: 11 }} }}
-                }}
-            }},
-            animation: {{ duration: 1000 }}
-        }};
-
-        // Initialize charts
-        let speedTrendChart, latencyTrendChart, hourlyChart, weeklyChart;
-        
-        function initializeCharts() {{
-            const speedCtx = document.getElementById('speedTrendChart').getContext('2d');
-            const latencyCtx = document.getElementById('latencyTrendChart').getContext('2d');
-            const hourlyCtx = document.getElementById('hourlyPerformanceChart').getContext('2d');
-            const weeklyCtx = document.getElementById('weeklyPerformanceChart').getContext('2d');
-            
-            speedTrendChart = new Chart(speedCtx, {{
-                type: 'line',
-                data: {{ labels: [], datasets: [] }},
-                options: chartConfig
-            }});
-            
-            latencyTrendChart = new Chart(latencyCtx, {{
-                type: 'line',
-                data: {{ labels: [], datasets: [] }},
-                options: chartConfig
-            }});
-            
-            hourlyChart = new Chart(hourlyCtx, {{
-                type: 'bar',
-                data: {{ labels: [], datasets: [] }},
-                options: chartConfig
-            }});
-            
-            weeklyChart = new Chart(weeklyCtx, {{
-                type: 'bar',
-                data: {{ labels: [], datasets: [] }},
-                options: chartConfig
-            }});
-        }}
-        
-        // Load trend data
-        async function loadTrendData(metric, period, days, chart) {{
-            try {{
-                const response = await fetch(`/api/historical/trends?metric=${{metric}}&period=${{period}}&days=${{days}}`);
-                const data = await response.json();
-                
-                if (!data.data || data.data.length === 0) {{
-                    // Show "no data" message in chart
-                    chart.data.labels = ['Collecting Data...'];
-                    chart.data.datasets = [{{
-                        label: `${{metric.replace('_', ' ').replace('mbps', 'Mbps').replace('ms', ' (ms)')}} - Data Collection Started`,
-                        data: [0],
-                        borderColor: '#cbd5e1',
-                        backgroundColor: 'rgba(203, 213, 225, 0.1)',
-                        tension: 0.4,
-                        fill: true
-                    }}];
-                    chart.update();
-                    return;
-                }}
-                
-                const labels = data.data.map(d => d.period);
-                const values = data.data.map(d => d.avg_value || 0);
-                
-                chart.data.labels = labels;
-                chart.data.datasets = [{{
-                    label: `${{metric.replace('_', ' ').replace('mbps', 'Mbps').replace('ms', ' (ms)')}}`,
-                    data: values,
-                    borderColor: metric.includes('download') ? 'rgb(34, 197, 94)' : 
-                                 metric.includes('upload') ? 'rgb(239, 68, 68)' :
-                                 metric.includes('latency') ? 'rgb(99, 132, 255)' : 'rgb(168, 85, 247)',
-                    backgroundColor: metric.includes('download') ? 'rgba(34, 197, 94, 0.1)' : 
-                                     metric.includes('upload') ? 'rgba(239, 68, 68, 0.1)' :
-                                     metric.includes('latency') ? 'rgba(99, 132, 255, 0.1)' : 'rgba(168, 85, 247, 0.1)',
-                    tension: 0.4,
-                    fill: true
-                }}];
-                
-                chart.update();
-            }} catch (error) {{
-                console.error('Error loading trend data:', error);
-                // Show error in chart
-                chart.data.labels = ['Error'];
-                chart.data.datasets = [{{
-                    label: `Error loading ${{metric}}`,
-                    data: [0],
-                    borderColor: '#ef4444',
-                    backgroundColor: 'rgba(239, 68, 68, 0.1)'
-                }}];
-                chart.update();
-            }}
-        }}
-        
-        // Load comparison data
-        async function loadComparisonData() {{
-            try {{
-                const response = await fetch('/api/historical/comparison?metric=download_mbps');
-                const data = await response.json();
-                
-                // Hourly performance
-                const hourlyLabels = data.hourly.map(d => `${{d.hour}}:00`);
-                const hourlyValues = data.hourly.map(d => d.avg_value);
-                
-                hourlyChart.data.labels = hourlyLabels;
-                hourlyChart.data.datasets = [{{
-                    label: 'Avg Download Speed (Mbps)',
-                    data: hourlyValues,
-                    backgroundColor: 'rgba(34, 197, 94, 0.8)',
-                    borderColor: 'rgb(34, 197, 94)',
-                    borderWidth: 1
-                }}];
-                hourlyChart.update();
-                
-                // Weekly performance
-                const weeklyLabels = data.weekly.map(d => d.day_name);
-                const weeklyValues = data.weekly.map(d => d.avg_value);
-                
-                weeklyChart.data.labels = weeklyLabels;
-                weeklyChart.data.datasets = [{{
-                    label: 'Avg Download Speed (Mbps)',
-                    data: weeklyValues,
-                    backgroundColor: 'rgba(99, 132, 255, 0.8)',
-                    borderColor: 'rgb(99, 132, 255)',
-                    borderWidth: 1
-                }}];
-                weeklyChart.update();
-                
-            }} catch (error) {{
-                console.error('Error loading comparison data:', error);
-            }}
-        }}
-        
-        // Initialize everything
-        document.addEventListener('DOMContentLoaded', function() {{
-            initializeCharts();
-            
-            // Load initial data
-            loadTrendData('download_mbps', 'hour', 7, speedTrendChart);
-            loadTrendData('latency_ms', 'hour', 7, latencyTrendChart);
-            loadComparisonData();
-            
-            // Hide loading indicator
-            document.getElementById('loading').style.display = 'none';
-            
-            // Event listeners for controls
-            document.getElementById('speedPeriod').addEventListener('change', function() {{
-                const period = this.value;
-                const days = document.getElementById('speedDays').value;
-                loadTrendData('download_mbps', period, days, speedTrendChart);
-            }});
-            
-            document.getElementById('speedDays').addEventListener('change', function() {{
-                const period = document.getElementById('speedPeriod').value;
-                const days = this.value;
-                loadTrendData('download_mbps', period, days, speedTrendChart);
-            }});
-            
-            document.getElementById('latencyPeriod').addEventListener('change', function() {{
-                const period = this.value;
-                const days = document.getElementById('latencyDays').value;
-                loadTrendData('latency_ms', period, days, latencyTrendChart);
-            }});
-            
-            document.getElementById('latencyDays').addEventListener('change', function() {{
-                const period = document.getElementById('latencyPeriod').value;
-                const days = this.value;
-                loadTrendData('latency_ms', period, days, latencyTrendChart);
-            }});
-            
-            // Reports functionality
-            document.getElementById('loadReports').addEventListener('click', async function() {{
-                const reportType = document.getElementById('reportType').value;
-                const days = document.getElementById('reportDays').value;
-                const container = document.getElementById('reportsContainer');
-                
-                try {{
-                    container.innerHTML = '<div class="loading">📊 Loading reports...</div>';
-                    
-                    const response = await fetch(`/api/historical/reports?type=${{reportType}}&days=${{days}}`);
-                    const data = await response.json();
-                    
-                    if (!data.success) {{
-                        throw new Error(data.error || 'Failed to load reports');
-                    }}
-                    
-                    renderReportsTable(data.data, reportType, container);
-                }} catch (error) {{
-                    container.innerHTML = `<div style="color: #ef4444; padding: 20px; text-align: center;">❌ Error loading reports: ${{error.message}}</div>`;
-                }}
-            }});
-            
-            function renderReportsTable(data, reportType, container) {{
-                if (!data || data.length === 0) {{
-                    container.innerHTML = '<div style="text-align: center; padding: 40px; color: #666;">📊 No report data available for the selected period</div>';
-                    return;
-                }}
-                
-                let headers, getRowData;
-                
-                if (reportType === 'daily') {{
-                    headers = ['Date', 'Avg Latency', 'Avg Download', 'Avg Upload', 'Quality', 'Outages', 'Grade'];
-                    getRowData = (item) => [
-                        item.date,
-                        `${{item.avg_latency_ms?.toFixed(0) || '0'}} ms`,
-                        `${{item.avg_download_mbps?.toFixed(1) || '0'}} Mbps`,
-                        `${{item.avg_upload_mbps?.toFixed(1) || '0'}} Mbps`,
-                        `${{item.avg_quality_score?.toFixed(0) || '0'}}%`,
-                        `${{item.outage_count || 0}} (${{item.total_outage_minutes || 0}}m)`,
-                        `<span class="grade-badge grade-${{item.performance_grade || 'F'}}">${{item.performance_grade || 'F'}}</span>`
-                    ];
-                }} else if (reportType === 'weekly') {{
-                    headers = ['Week Start', 'Week End', 'Days', 'Avg Latency', 'Avg Download', 'Avg Upload', 'Quality', 'Outages', 'Grade'];
-                    getRowData = (item) => [
-                        item.week_start,
-                        item.week_end,
-                        item.days_with_data,
-                        `${{item.avg_latency_ms?.toFixed(0) || '0'}} ms`,
-                        `${{item.avg_download_mbps?.toFixed(1) || '0'}} Mbps`,
-                        `${{item.avg_upload_mbps?.toFixed(1) || '0'}} Mbps`,
-                        `${{item.avg_quality_score?.toFixed(0) || '0'}}%`,
-                        `${{item.total_outages || 0}} (${{item.total_outage_minutes || 0}}m)`,
-                        `<span class="grade-badge grade-${{item.performance_grade || 'F'}}">${{item.performance_grade || 'F'}}</span>`
-                    ];
-                }} else {{ // monthly
-                    headers = ['Month', 'Days', 'Avg Latency', 'Avg Download', 'Avg Upload', 'Quality', 'Outages', 'Grade'];
-                    getRowData = (item) => [
-                        item.month,
-                        item.days_with_data,
-                        `${{item.avg_latency_ms?.toFixed(0) || '0'}} ms`,
-                        `${{item.avg_download_mbps?.toFixed(1) || '0'}} Mbps`,
-                        `${{item.avg_upload_mbps?.toFixed(1) || '0'}} Mbps`,
-                        `${{item.avg_quality_score?.toFixed(0) || '0'}}%`,
-                        `${{item.total_outages || 0}} (${{item.total_outage_minutes || 0}}m)`,
-                        `<span class="grade-badge grade-${{item.performance_grade || 'F'}}">${{item.performance_grade || 'F'}}</span>`
-                    ];
-                }}
-                
-                const tableHTML = `
-                    <table class="report-table">
-                        <thead>
-                            <tr>
-                                ${{headers.map(h => `<th>${{h}}</th>`).join('')}}
-                            </tr>
-                        </thead>
-                        <tbody>
-                            ${{data.map(item => `
-                                <tr>
-                                    ${{getRowData(item).map(cell => `<td>${{cell}}</td>`).join('')}}
-                                </tr>
-                            `).join('')}}
-                        </tbody>
-                    </table>
-                `;
-                
-                container.innerHTML = tableHTML;
-            }}
-            
-            // Load advanced analytics
-            async function loadAdvancedAnalytics() {{
-                try {{
-                    const response = await fetch('/api/historical/analytics?days=30');
-                    const data = await response.json();
-                    
-                    if (!data.success) {{
-                        throw new Error(data.error || 'Failed to load analytics');
-                    }}
-                    
-                    renderAdvancedAnalytics(data.data);
-                }} catch (error) {{
-                    console.error('Error loading advanced analytics:', error);
-                }}
-            }}
-            
-            function renderAdvancedAnalytics(analytics) {{
-                // Day vs Night comparison
-                const dayNightEl = document.getElementById('dayNightComparison');
-                if (analytics.day_vs_night && analytics.day_vs_night.day && analytics.day_vs_night.night) {{
-                    const day = analytics.day_vs_night.day;
-                    const night = analytics.day_vs_night.night;
-                    
-                    dayNightEl.innerHTML = `
-                        <div class="comparison-row">
-                            <span class="comparison-label">Download Speed</span>
-                            <span class="comparison-value">Day: ${{day.avg_download?.toFixed(1) || 0}} Mbps | Night: ${{night.avg_download?.toFixed(1) || 0}} Mbps</span>
-                        </div>
-                        <div class="comparison-row">
-                            <span class="comparison-label">Latency</span>
-                            <span class="comparison-value">Day: ${{day.avg_latency?.toFixed(0) || 0}} ms | Night: ${{night.avg_latency?.toFixed(0) || 0}} ms</span>
-                        </div>
-                        <div class="comparison-row">
-                            <span class="comparison-label">Quality Score</span>
-                            <span class="comparison-value">Day: ${{day.avg_quality?.toFixed(0) || 0}}% | Night: ${{night.avg_quality?.toFixed(0) || 0}}%</span>
-                        </div>
-                    `;
-                }} else {{
-                    dayNightEl.innerHTML = '<div style="color: #666; text-align: center; padding: 20px;">Insufficient data for comparison</div>';
-                }}
-                
-                // Quality distribution
-                const qualityEl = document.getElementById('qualityDistribution');
-                if (analytics.quality_distribution && analytics.quality_distribution.length > 0) {{
-                    const qualityHTML = analytics.quality_distribution.map(item => `
-                        <div class="comparison-row">
-                            <span class="metric-badge metric-${{item.quality_category}}">${{item.quality_category.charAt(0).toUpperCase() + item.quality_category.slice(1)}}</span>
-                            <span class="comparison-value">${{item.percentage}}% (${{item.count}} measurements)</span>
-                        </div>
-                    `).join('');
-                    qualityEl.innerHTML = qualityHTML;
-                }} else {{
-                    qualityEl.innerHTML = '<div style="color: #666; text-align: center; padding: 20px;">No quality data available</div>';
-                }}
-                
-                // Speed consistency
-                const consistencyEl = document.getElementById('speedConsistency');
-                if (analytics.speed_consistency) {{
-                    const consistency = analytics.speed_consistency;
-                    consistencyEl.innerHTML = `
-                        <div class="comparison-row">
-                            <span class="comparison-label">Average Speed</span>
-                            <span class="comparison-value">${{consistency.avg_download?.toFixed(1) || 0}} Mbps</span>
-                        </div>
-                        <div class="comparison-row">
-                            <span class="comparison-label">Speed Range</span>
-                            <span class="comparison-value">${{consistency.min_download?.toFixed(1) || 0}} - ${{consistency.max_download?.toFixed(1) || 0}} Mbps</span>
-                        </div>
-                        <div class="comparison-row">
-                            <span class="comparison-label">Consistency</span>
-                            <span class="metric-badge metric-${{consistency.consistency_rating === 'very_consistent' ? 'excellent' : consistency.consistency_rating === 'consistent' ? 'good' : 'fair'}}">${{consistency.consistency_rating?.replace('_', ' ') || 'Unknown'}}</span>
-                        </div>
-                    `;
-                }} else {{
-                    consistencyEl.innerHTML = '<div style="color: #666; text-align: center; padding: 20px;">No consistency data available</div>';
-                }}
-                
-                // Peak hours
-                const peakEl = document.getElementById('peakHours');
-                if (analytics.peak_hours && analytics.peak_hours.length > 0) {{
-                    const peakHTML = analytics.peak_hours.map((hour, index) => `
-                        <div class="comparison-row">
-                            <span class="comparison-label">#${{index + 1}} Peak: ${{hour.hour}}:00</span>
-                            <span class="comparison-value">${{hour.avg_download?.toFixed(1) || 0}} Mbps</span>
-                        </div>
-                    `).join('');
-                    peakEl.innerHTML = peakHTML;
-                }} else {{
-                    peakEl.innerHTML = '<div style="color: #666; text-align: center; padding: 20px;">No peak hour data available</div>';
-                }}
-            }}
-            
-            // Load performance insights
-            async function loadPerformanceInsights() {{
-                try {{
-                    const response = await fetch('/api/historical/insights?days=30');
-                    const data = await response.json();
-                    
-                    if (!data.success) {{
-                        throw new Error(data.error || 'Failed to load insights');
-                    }}
-                    
-                    renderPerformanceInsights(data.data);
-                }} catch (error) {{
-                    console.error('Error loading performance insights:', error);
-                }}
-            }}
-            
-            function renderPerformanceInsights(insights) {{
-                const insightsEl = document.getElementById('performanceInsights');
-                
-                if (!insights || insights.length === 0) {{
-                    insightsEl.innerHTML = '<div style="background: white; padding: 30px; border-radius: 8px; text-align: center; color: #10b981;"><strong>🎉 Great Performance!</strong><br>No significant performance issues detected in the analyzed period.</div>';
-                    return;
-                }}
-                
-                const insightsHTML = insights.map(insight => `
-                    <div class="insight-item insight-${{insight.severity}}">
-                        <div class="insight-title">${{insight.title}}</div>
-                        <div class="insight-description">${{insight.description}}</div>
-                        <div class="insight-recommendation">💡 ${{insight.recommendation}}</div>
-                    </div>
-                `).join('');
-                
-                insightsEl.innerHTML = insightsHTML;
-            }}
-            
-            // Load speed test analytics
-            let speedTestTrendChart;
-            
-            async function loadSpeedTestAnalytics() {{
-                try {{
-                    // Load speed test summary
-                    const summaryResponse = await fetch('/api/speedtest/summary?days=30');
-                    const summaryData = await summaryResponse.json();
-                    
-                    if (summaryData.success) {{
-                        renderSpeedTestSummary(summaryData.data);
-                    }}
-                    
-                    // Load speed test trends
-                    const trendsResponse = await fetch('/api/speedtest/trends?days=30');
-                    const trendsData = await trendsResponse.json();
-                    
-                    if (trendsData.success) {{
-                        renderSpeedTestTrends(trendsData.data);
-                    }}
-                }} catch (error) {{
-                    console.error('Error loading speed test analytics:', error);
-                }}
-            }}
-            
-            function renderSpeedTestSummary(data) {{
-                const summaryEl = document.getElementById('speedTestSummary');
-                
-                if (!data || data.total_tests === 0) {{
-                    summaryEl.innerHTML = '<div style="text-align: center; padding: 20px; color: #666;">No speed tests available. <a href="/speedtest" style="color: #667eea;">Run your first test →</a></div>';
-                    return;
-                }}
-                
-                summaryEl.innerHTML = `
-                    <div class="comparison-row">
-                        <span class="comparison-label">Total Tests</span>
-                        <span class="comparison-value">${{data.total_tests || 0}}</span>
-                    </div>
-                    <div class="comparison-row">
-                        <span class="comparison-label">Success Rate</span>
-                        <span class="comparison-value">${{((data.completed_tests / data.total_tests) * 100).toFixed(1)}}%</span>
-                    </div>
-                    <div class="comparison-row">
-                        <span class="comparison-label">Avg Download</span>
-                        <span class="comparison-value">${{(data.avg_download || 0).toFixed(1)}} Mbps</span>
-                    </div>
-                    <div class="comparison-row">
-                        <span class="comparison-label">Max Download</span>
-                        <span class="comparison-value">${{(data.max_download || 0).toFixed(1)}} Mbps</span>
-                    </div>
-                    <div class="comparison-row">
-                        <span class="comparison-label">Avg Upload</span>
-                        <span class="comparison-value">${{(data.avg_upload || 0).toFixed(1)}} Mbps</span>
-                    </div>
-                `;
-            }}
-            
-            function renderSpeedTestTrends(data) {{
-                const ctx = document.getElementById('speedTestTrendChart').getContext('2d');
-                
-                if (!data || data.length === 0) {{
-                    // Show "no data" message
-                    ctx.font = '16px Arial';
-                    ctx.fillStyle = '#666';
-                    ctx.textAlign = 'center';
-                    ctx.fillText('No speed test data available', ctx.canvas.width / 2, ctx.canvas.height / 2);
-                    return;
-                }}
-                
-                const labels = data.map(d => d.date);
-                const downloadData = data.map(d => d.avg_download || 0);
-                const uploadData = data.map(d => d.avg_upload || 0);
-                
-                speedTestTrendChart = new Chart(ctx, {{
-                    type: 'line',
-                    data: {{
-                        labels: labels,
-                        datasets: [{{
-                            label: 'Download Speed (Mbps)',
-                            data: downloadData,
-                            borderColor: 'rgb(34, 197, 94)',
-                            backgroundColor: 'rgba(34, 197, 94, 0.1)',
-                            tension: 0.4,
-                            fill: true
-                        }}, {{
-                            label: 'Upload Speed (Mbps)',
-                            data: uploadData,
-                            borderColor: 'rgb(239, 68, 68)',
-                            backgroundColor: 'rgba(239, 68, 68, 0.1)',
-                            tension: 0.4,
-                            fill: true
-                        }}]
-                    }},
-                    options: {{
-                        responsive: true,
-                        plugins: {{
-                            legend: {{
-                                display: true,
-                                position: 'top'
-                            }}
-                        }},
-                        scales: {{
-                            y: {{
-                                beginAtZero: true,
-                                title: {{
-                                    display: true,
-                                    text: 'Speed (Mbps)'
-                                }}
-                            }},
-                            x: {{
-                                title: {{
-                                    display: true,
-                                    text: 'Date'
-                                }}
-                            }}
-                        }}
-                    }}
-                }});
-            }}
-            
-            // Load advanced analytics when page loads
-            setTimeout(() => {{
-                loadAdvancedAnalytics();
-                loadPerformanceInsights();
-                loadSpeedTestAnalytics();
-            }}, 1500);
-        }});
-        </script>
-        </body>
-        </html>
-        """
-    except Exception as e:
-        return f"""
-        <html>
-        <head><title>Analytics Error</title></head>
-        <body style="font-family: Arial, sans-serif; margin: 40px;">
-        <div style="background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-            <h1 style="color: #ef4444;">⚠️ Analytics Dashboard Error</h1>
-            <p style="color: #666;">Unable to load analytics data</p>
-            <div style="background: #fee; padding: 15px; border-radius: 5px; margin: 20px 0;">
-                <strong>Error details:</strong><br>
-                <code style="color: #c00;">{str(e)}</code>
-            </div>
-            <p><a href="/" style="color: #667eea;">← Back to Monitor</a></p>
-        </div>
+_INDEX_BODY = app.jinja_env.get_template('index.html')
+
+# Dashboard notices - fixed markup, so only the choice between them is made per request
+_NOTICE_REAL = Markup('<div class="success-notice"><span class="notice-icon">✅</span><strong>Real Speed Data:</strong> Showing actual measured speeds from recent high-usage periods!</div>')
+_NOTICE_LOW = Markup('<div class="info-notice"><span class="notice-icon">ℹ️</span><strong>Low Activity Detected:</strong> The speeds shown reflect current low usage. <a href="/speedtest" class="speed-test-btn">Run Speed Test →</a></div>')
+_NOTICE_NONE = Markup('')
+
+_INDEX_TAIL = """
+        <script src="/static/dashboard.js" defer></script>
         </body>
         </html>
-        """
+        """.encode('utf-8')
+
+# Gzip variant of the page: head and tail are deflated once at import and spliced around the
+# freshly deflated body into a single gzip member (each segment ends on a full flush)
+_GZIP_HEADER = b'\x1f\x8b\x08\x00\x00\x00\x00\x00\x00\xff'
+
+def _deflate_fragment(data, mode=zlib.Z_FULL_FLUSH, level=9):
+    """Raw deflate data as a self-contained segment of a larger stream"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush(mode)
+
+_INDEX_HEAD_DEFLATED = _deflate_fragment(_INDEX_HEAD)
+_INDEX_TAIL_DEFLATED = _deflate_fragment(_INDEX_TAIL, zlib.Z_FINISH)
+_INDEX_HEAD_CRC = zlib.crc32(_INDEX_HEAD)
+
+def gzip_index_page(body):
+    """Gzip the dashboard page, compressing only the per-request body"""
+    crc = zlib.crc32(_INDEX_TAIL, zlib.crc32(body, _INDEX_HEAD_CRC))
+    size = len(_INDEX_HEAD) + len(body) + len(_INDEX_TAIL)
+    return b''.join((_GZIP_HEADER, _INDEX_HEAD_DEFLATED, _deflate_fragment(body, level=6),
+                     _INDEX_TAIL_DEFLATED, struct.pack('<II', crc, size & 0xffffffff)))
+
+# Dashboard rating tables: (comparison, ((limit, css_class), ...), default) - first limit passed wins
+DOWNLOAD_RATING = (operator.gt, ((50, 'good'), (20, 'warning')), 'bad')
+UPLOAD_RATING = (operator.gt, ((10, 'good'), (5, 'warning')), 'bad')
+LATENCY_RATING = (operator.lt, ((50, 'good'), (100, 'warning')), 'bad')
+OBSTRUCTION_RATING = (operator.lt, ((1, 'good'), (5, 'warning')), 'bad')
+QUALITY_RATING = (operator.ge, ((90, 'quality-excellent'), (75, 'quality-good'), (50, 'quality-fair')), 'quality-poor')
+
+def rating_class(value, rating):
+    """CSS class for a metric value from its rating table"""
+    passes, thresholds, default = rating
+    for limit, css_class in thresholds:
+        if passes(value, limit):
+            return css_class
+    return default
+
+# Decimal places the dashboard shows its float readings at - finer changes don't change the page
+INDEX_DISPLAY_PRECISION = {'downlink_mbps': 1, 'uplink_mbps': 1, 'latency': 0, 'quality_score': 0,
+                           'fraction_obstructed': 1}
+
+def index_etag(context):
+    """ETag over every value the dashboard renders (but its timestamp), at the precision the page shows them"""
+    key = tuple((name, round(value, INDEX_DISPLAY_PRECISION[name]) if name in INDEX_DISPLAY_PRECISION else value)
+                for name, value in context.items() if name != 'last_updated')
+    return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=8).hexdigest()
 
 @app.route('/')
 def index():
-    try:
-        # Get the status using the working temp3 implementation
-        status = starlink_grpc.get_status()
-        
-        # Get speed data
-        speed_data = get_speed_data()
-        
-        if speed_data:
-            downlink_mbps = speed_data['download_mbps']
-            uplink_mbps = speed_data['upload_mbps']
-            peak_down = speed_data['peak_download']
-            peak_up = speed_data['peak_upload']
-            speed_note = speed_data['type']
-            has_real_data = 'Active usage' in speed_note
-        else:
-            downlink_mbps = uplink_mbps = peak_down = peak_up = 0
-            speed_note = "No data available"
-            has_real_data = False
-        
-        # Get connection state from device_state
-        if hasattr(status, 'device_state') and hasattr(status.device_state, 'uptime_s'):
-            uptime = status.device_state.uptime_s
-            state = "CONNECTED"
-        else:
-            uptime = 0
-            state = "UNKNOWN"
-        
-        # Format uptime
-        uptime_str = f"{uptime // 3600}h {(uptime % 3600) // 60}m" if uptime > 0 else "N/A"
-        
-        # Get latency
-        latency = status.pop_ping_latency_ms if hasattr(status, 'pop_ping_latency_ms') else 0
-        
-        # Get obstruction info
-        fraction_obstructed = 0
-        if hasattr(status, 'obstruction_stats') and hasattr(status.obstruction_stats, 'fraction_obstructed'):
-            fraction_obstructed = status.obstruction_stats.fraction_obstructed * 100
-        
-        # Get device info
-        hardware_version = ""
-        software_version = ""
-        
-        # Try to get account name from environment or use default
-        account_name = os.environ.get('STARLINK_ACCOUNT_NAME', 'Starlink User')
-        dish_id = ""
-        
-        if hasattr(status, 'device_info'):
-            hardware_version = status.device_info.hardware_version if hasattr(status.device_info, 'hardware_version') else ""
-            software_version = status.device_info.software_version if hasattr(status.device_info, 'software_version') else ""
-            
-            # Try to get dish ID or account identifier if not set via environment
-            if account_name == 'Starlink User':
-                if hasattr(status.device_info, 'id'):
-                    dish_id = status.device_info.id
-                    account_name = f"Starlink-{dish_id[:8]}" if len(dish_id) > 8 else f"Starlink-{dish_id}"
-                elif hasattr(status.device_info, 'dish_id'):
-                    dish_id = status.device_info.dish_id
-                    account_name = f"Starlink-{dish_id[:8]}"
-        
-        # Get GPS status and location
-        gps_valid = False
-        gps_sats = 0
-        latitude = 0.0
-        longitude = 0.0
-        altitude = 0.0
-        
-        # Check for manually set location from environment
-        manual_location = os.environ.get('STARLINK_LOCATION', '')
-        manual_lat = float(os.environ.get('STARLINK_LATITUDE', '0'))
-        manual_lon = float(os.environ.get('STARLINK_LONGITUDE', '0'))
-        
-        location_str = "Location unavailable"
-        
-        if hasattr(status, 'gps_stats'):
-            gps_valid = status.gps_stats.gps_valid if hasattr(status.gps_stats, 'gps_valid') else False
-            gps_sats = status.gps_stats.gps_sats if hasattr(status.gps_stats, 'gps_sats') else 0
-            
-            # Debug: Log available GPS fields
-            # app.logger.info(f"GPS Stats fields: {dir(status.gps_stats)}")
-            
-            # Try to get GPS coordinates - check different possible field names
-            if hasattr(status.gps_stats, 'latitude'):
-                latitude = status.gps_stats.latitude
-            elif hasattr(status.gps_stats, 'lat'):
-                latitude = status.gps_stats.lat
-                
-            if hasattr(status.gps_stats, 'longitude'):
-                longitude = status.gps_stats.longitude
-            elif hasattr(status.gps_stats, 'lon'):
-                longitude = status.gps_stats.lon
-            elif hasattr(status.gps_stats, 'lng'):
-                longitude = status.gps_stats.lng
-                
-            if hasattr(status.gps_stats, 'altitude'):
-                altitude = status.gps_stats.altitude
-            elif hasattr(status.gps_stats, 'alt'):
-                altitude = status.gps_stats.alt
-                
-            # Format location string if we have valid coordinates
-            if gps_valid and (latitude != 0 or longitude != 0):
-                # Try to get human-readable location
-                city_location = reverse_geocode(latitude, longitude)
-                if city_location:
-                    location_str = city_location
-                    # Add coordinates as tooltip or secondary info
-                    location_str += f" ({latitude:.4f}°, {longitude:.4f}°)"
-                else:
-                    # Fallback to coordinates only
-                    location_str = f"{latitude:.6f}°, {longitude:.6f}°"
-                
-                if altitude > 0:
-                    location_str += f" • {altitude:.0f}m altitude"
-        
-        # Use manual location if GPS not available but manual location is set
-        if location_str == "Location unavailable":
-            if manual_location:
-                location_str = manual_location
-            elif manual_lat != 0 and manual_lon != 0:
-                latitude = manual_lat
-                longitude = manual_lon
-                # Try to get human-readable location
-                city_location = reverse_geocode(latitude, longitude)
-                if city_location:
-                    location_str = city_location
-                    location_str += f" ({latitude:.4f}°, {longitude:.4f}°)"
-                else:
-                    location_str = f"{latitude:.6f}°, {longitude:.6f}°"
-        
-        # Get SNR status
-        snr_above_noise = status.is_snr_above_noise_floor if hasattr(status, 'is_snr_above_noise_floor') else False
-        
-        # Get Ethernet speed
-        eth_speed = status.eth_speed_mbps if hasattr(status, 'eth_speed_mbps') else 0
-        
-        # Calculate quality score
-        quality_score = calculate_quality_score(latency, downlink_mbps, uplink_mbps, fraction_obstructed, snr_above_noise)
-        
-        return f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Starlink Speed Monitor</title>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1">
-            <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-            <style>
-                body {{
-                    font-family: 'Segoe UI', Tahoma, Arial, sans-serif; 
-                    margin: 0; 
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: #333;
-                }}
-                .container {{
-                    max-width: 1200px; 
-                    margin: 20px auto; 
-                    background: white; 
-                    padding: 30px; 
-                    border-radius: 15px; 
-                    box-shadow: 0 10px 40px rgba(0,0,0,0.2);
-                }}
-                h1 {{
-                    color: #333; 
-                    margin-bottom: 30px; 
-                    display: flex; 
-                    align-items: center;
-                }}
-                .emoji {{ margin-right: 10px; font-size: 1.2em; }}
-                
-                /* Navigation */
-                .main-nav {{
-                    background: rgba(255, 255, 255, 0.95);
-                    border-radius: 12px;
-                    padding: 20px 30px;
-                    margin-bottom: 30px;
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-                    backdrop-filter: blur(10px);
-                }}
-                .nav-brand {{
-                    display: flex;
-                    align-items: center;
-                    gap: 10px;
-                }}
-                .nav-logo {{
-                    font-size: 1.5em;
-                }}
-                .nav-title {{
-                    font-size: 1.2em;
-                    font-weight: 600;
-                    color: #333;
-                }}
-                .nav-links {{
-                    display: flex;
-                    gap: 8px;
-                }}
-                .nav-link {{
-                    display: flex;
-                    align-items: center;
-                    gap: 8px;
-                    padding: 12px 20px;
-                    border-radius: 8px;
-                    text-decoration: none;
-                    color: #666;
-                    font-weight: 500;
-                    transition: all 0.2s ease;
-                    background: transparent;
-                }}
-                .nav-link:hover {{
-                    background: #f0f4ff;
-                    color: #4f46e5;
-                    transform: translateY(-1px);
-                }}
-                .nav-link.active {{
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: white;
-                    box-shadow: 0 4px 15px rgba(102, 126, 234, 0.3);
-                }}
-                .nav-link.active:hover {{
-                    transform: translateY(-2px);
-                    box-shadow: 0 6px 20px rgba(102, 126, 234, 0.4);
-                }}
-                .nav-icon {{
-                    font-size: 1.1em;
-                }}
-                .nav-text {{
-                    font-size: 0.95em;
-                }}
-                
-                /* Stats Grid */
-                .stats-grid {{ 
-                    display: grid; 
-                    grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); 
-                    gap: 20px; 
-                    margin-bottom: 30px;
-                }}
-                .stat {{
-                    padding: 15px; 
-                    background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%); 
-                    border-radius: 10px;
-                    text-align: center;
-                }}
-                .stat-label {{ font-size: 0.9em; color: #666; margin-bottom: 5px; }}
-                .stat-value {{ font-size: 1.8em; font-weight: bold; color: #333; }}
-                .stat-unit {{ font-size: 0.7em; color: #666; margin-left: 5px; }}
-                .stat-note {{ font-size: 0.7em; color: #999; margin-top: 5px; }}
-                
-                /* Quality Score Styling */
-                .quality-excellent {{ color: #10b981; }}
-                .quality-good {{ color: #3b82f6; }}
-                .quality-fair {{ color: #f59e0b; }}
-                .quality-poor {{ color: #ef4444; }}
-                
-                /* Charts Grid */
-                .charts-grid {{
-                    display: grid;
-                    grid-template-columns: 1fr 1fr;
-                    gap: 20px;
-                    margin-bottom: 30px;
-                }}
-                .chart-container {{
-                    background: #f8f9fa;
-                    padding: 20px;
-                    border-radius: 10px;
-                    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-                }}
-                .chart-title {{
-                    font-size: 1.1em;
-                    font-weight: bold;
-                    color: #333;
-                    margin-bottom: 15px;
-                    text-align: center;
-                }}
-                
-                /* Responsive */
-                @media (max-width: 768px) {{
-                    .main-nav {{
-                        flex-direction: column;
-                        gap: 20px;
-                        padding: 20px;
-                    }}
-                    .nav-brand {{
-                        justify-content: center;
-                    }}
-                    .nav-links {{
-                        justify-content: center;
-                        flex-wrap: wrap;
-                    }}
-                    .nav-link {{
-                        padding: 10px 16px;
-                    }}
-                    .nav-text {{
-                        font-size: 0.85em;
-                    }}
-                    .charts-grid {{
-                        grid-template-columns: 1fr;
-                    }}
-                    .container {{
-                        margin: 10px;
-                        padding: 20px;
-                    }}
-                    .stats-grid {{
-                        grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-                    }}
-                    h1 {{
-                        font-size: 1.5em;
-                        flex-direction: column;
-                        text-align: center;
-                    }}
-                }}
-                
-                @media (max-width: 480px) {{
-                    .nav-text {{
-                        display: none;
-                    }}
-                    .nav-link {{
-                        padding: 12px;
-                    }}
-                    .stats-grid {{
-                        grid-template-columns: 1fr 1fr;
-                    }}
-                    .container {{
-                        margin: 5px;
-                        padding: 15px;
-                    }}
-                }}
-                
-                /* Status indicators */
-                .status-indicator {{
-                    display: inline-block; 
-                    width: 12px; 
-                    height: 12px; 
-                    border-radius: 50%; 
-                    margin-right: 8px; 
-                    animation: pulse 2s infinite;
-                }}
-                .status-connected {{ background: #10b981; }}
-                .status-disconnected {{ background: #ef4444; }}
-                @keyframes pulse {{ 0% {{ opacity: 1; }} 50% {{ opacity: 0.5; }} 100% {{ opacity: 1; }} }}
-                
-                .good {{ color: #10b981; }}
-                .warning {{ color: #f59e0b; }}
-                .bad {{ color: #ef4444; }}
-                
-                .info-section {{
-                    margin-top: 30px; 
-                    padding: 15px; 
-                    background: #f8f9fa; 
-                    border-radius: 10px;
-                    font-size: 0.9em;
-                }}
-                .info-item {{
-                    display: flex; 
-                    justify-content: space-between; 
-                    padding: 8px 0; 
-                    border-bottom: 1px solid #e0e0e0;
-                }}
-                .info-item:first-child {{
-                    padding-top: 0;
-                    font-weight: 600;
-                    color: #4f46e5;
-                }}
-                .info-item:first-child strong {{
-                    color: #4f46e5;
-                }}
-                .info-item:last-child {{ border-bottom: none; }}
-                .info-item a {{
-                    color: #4f46e5;
-                    text-decoration: none;
-                    transition: opacity 0.2s;
-                }}
-                .info-item a:hover {{
-                    opacity: 0.8;
-                    text-decoration: underline;
-                }}
-                .timestamp {{
-                    text-align: center; 
-                    color: #666; 
-                    font-size: 0.9em; 
-                    margin-top: 20px;
-                }}
-                
-                .success-notice {{ 
-                    background: #d1fae5; 
-                    border: 1px solid #10b981; 
-                    border-radius: 8px; 
-                    padding: 12px; 
-                    margin-bottom: 20px; 
-                    color: #065f46; 
-                }}
-                .info-notice {{ 
-                    background: #fef3c7; 
-                    border: 1px solid #fbbf24; 
-                    border-radius: 8px; 
-                    padding: 12px; 
-                    margin-bottom: 20px; 
-                    color: #92400e; 
-                }}
-                .notice-icon {{ display: inline-block; margin-right: 8px; }}
-                .speed-test-btn {{ 
-                    background: #667eea; 
-                    color: white; 
-                    padding: 10px 20px; 
-                    border-radius: 5px; 
-                    text-decoration: none; 
-                    display: inline-block; 
-                    margin-top: 10px; 
-                }}
-            </style>
-        </head>
-        <body>
-        <div class="container">
-            <h1>
-                <span class="emoji">🛰️</span>
-                Starlink Speed Monitor - Interactive Dashboard
-                <span style="margin-left: auto;">
-                    <span class="status-indicator {'status-connected' if state == 'CONNECTED' else 'status-disconnected'}"></span>
-                    <span style="font-size: 0.5em; color: #666;">{state}</span>
-                </span>
-            </h1>
-            
-            <nav class="main-nav">
-                <div class="nav-brand">
-                    <span class="nav-logo">🛰️</span>
-                    <span class="nav-title">Starlink Monitor</span>
-                </div>
-                <div class="nav-links">
-                    <a href="/" class="nav-link active">
-                        <span class="nav-icon">📊</span>
-                        <span class="nav-text">Live Monitor</span>
-                    </a>
-                    <a href="/speedtest" class="nav-link">
-                        <span class="nav-icon">⚡</span>
-                        <span class="nav-text">Speed Test</span>
-                    </a>
-                    <a href="/analytics" class="nav-link">
-                        <span class="nav-icon">📈</span>
-                        <span class="nav-text">Analytics</span>
-                    </a>
-                    <a href="/advanced" class="nav-link">
-                        <span class="nav-icon">🔬</span>
-                        <span class="nav-text">Advanced</span>
-                    </a>
-                </div>
-            </nav>
-            
-            {f'<div class="success-notice"><span class="notice-icon">✅</span><strong>Real Speed Data:</strong> Showing actual measured speeds from recent high-usage periods!</div>' if has_real_data else ''}
-            
-            {f'<div class="info-notice"><span class="notice-icon">ℹ️</span><strong>Low Activity Detected:</strong> The speeds shown reflect current low usage. <a href="/speedtest" class="speed-test-btn">Run Speed Test →</a></div>' if not has_real_data and downlink_mbps < 5 else ''}
+    # Latest status and speed data from the background poller
+    status, speed_data = dish_poller.get()
+    
+    if speed_data:
+        downlink_mbps = speed_data['download_mbps']
+        uplink_mbps = speed_data['upload_mbps']
+        peak_down = speed_data['peak_download']
+        peak_up = speed_data['peak_upload']
+        speed_note = speed_data['type']
+        has_real_data = 'Active usage' in speed_note
+    else:
+        downlink_mbps = uplink_mbps = peak_down = peak_up = 0
+        speed_note = "No data available"
+        has_real_data = False
+    
+    # Get connection state from device_state (unset fields read as protobuf defaults)
+    uptime = status.device_state.uptime_s
+    state = "CONNECTED" if status.HasField('device_state') else "UNKNOWN"
+    
+    # Format uptime
+    if uptime > 0:
+        hours, remainder = divmod(uptime, 3600)
+        uptime_str = f"{hours}h {remainder // 60}m"
+    else:
+        uptime_str = "N/A"
+    
+    # Get latency
+    latency = status.pop_ping_latency_ms
+    
+    # Get obstruction info
+    fraction_obstructed = status.obstruction_stats.fraction_obstructed * 100
+    
+    # Get device info
+    device_info = status.device_info
+    hardware_version = device_info.hardware_version
+    software_version = device_info.software_version
+    
+    # Try to get account name from environment, else from the dish ID
+    account_name = os.environ.get('STARLINK_ACCOUNT_NAME', 'Starlink User')
+    if account_name == 'Starlink User' and device_info.id:
+        account_name = f"Starlink-{device_info.id[:8]}"
+    
+    # Get GPS status and location
+    gps_valid = False
+    gps_sats = 0
+    latitude = 0.0
+    longitude = 0.0
+    altitude = 0.0
+    
+    # Check for manually set location from environment
+    manual_location = os.environ.get('STARLINK_LOCATION', '')
+    manual_lat = float(os.environ.get('STARLINK_LATITUDE', '0'))
+    manual_lon = float(os.environ.get('STARLINK_LONGITUDE', '0'))
+    
+    location_str = "Location unavailable"
+    
+    gps_stats = status.gps_stats
+    if status.HasField('gps_stats'):
+        gps_valid = gps_stats.gps_valid
+        gps_sats = gps_stats.gps_sats
+        
+        # Coordinates aren't part of every firmware's GPS stats - check different possible field names
+        latitude = getattr(gps_stats, 'latitude', None)
+        if latitude is None:
+            latitude = getattr(gps_stats, 'lat', 0.0)
             
-            <!-- Stats Grid -->
-            <div class="stats-grid">
-                <div class="stat">
-                    <div class="stat-label">Download Speed</div>
-                    <div class="stat-value {'good' if downlink_mbps > 50 else 'warning' if downlink_mbps > 20 else 'bad'}">
-                        {downlink_mbps:.1f}<span class="stat-unit">Mbps</span>
-                    </div>
-                    <div class="stat-note">{speed_note}</div>
-                </div>
-                
-                <div class="stat">
-                    <div class="stat-label">Upload Speed</div>
-                    <div class="stat-value {'good' if uplink_mbps > 10 else 'warning' if uplink_mbps > 5 else 'bad'}">
-                        {uplink_mbps:.1f}<span class="stat-unit">Mbps</span>
-                    </div>
-                    <div class="stat-note">{speed_note}</div>
-                </div>
-                
-                <div class="stat">
-                    <div class="stat-label">Latency</div>
-                    <div class="stat-value {'good' if latency < 50 else 'warning' if latency < 100 else 'bad'}">
-                        {latency:.0f}<span class="stat-unit">ms</span>
-                    </div>
-                    <div class="stat-note">To Starlink POP</div>
-                </div>
-                
-                <div class="stat">
-                    <div class="stat-label">Connection Quality</div>
-                    <div class="stat-value {'quality-excellent' if quality_score >= 90 else 'quality-good' if quality_score >= 75 else 'quality-fair' if quality_score >= 50 else 'quality-poor'}">
-                        {quality_score:.0f}<span class="stat-unit">%</span>
-                    </div>
-                    <div class="stat-note">Overall Score</div>
-                </div>
-                
-                <div class="stat">
-                    <div class="stat-label">Obstruction</div>
-                    <div class="stat-value {'good' if fraction_obstructed < 1 else 'warning' if fraction_obstructed < 5 else 'bad'}">
-                        {fraction_obstructed:.1f}<span class="stat-unit">%</span>
-                    </div>
-                    <div class="stat-note">Sky blocked</div>
-                </div>
-            </div>
+        longitude = getattr(gps_stats, 'longitude', None)
+        if longitude is None:
+            longitude = getattr(gps_stats, 'lon', None)
+        if longitude is None:
+            longitude = getattr(gps_stats, 'lng', 0.0)
             
-            <!-- Charts Grid -->
-            <div class="charts-grid">
-                <div class="chart-container">
-                    <div class="chart-title">📊 Network Latency (Last 5 Minutes)</div>
-                    <canvas id="latencyChart" width="400" height="200"></canvas>
-                </div>
-                
-                <div class="chart-container">
-                    <div class="chart-title">⚡ Speed Trends (Mbps)</div>
-                    <canvas id="speedChart" width="400" height="200"></canvas>
-                </div>
-                
-                <div class="chart-container">
-                    <div class="chart-title">🎯 Connection Quality Score</div>
-                    <canvas id="qualityChart" width="400" height="200"></canvas>
-                </div>
-                
-                <div class="chart-container">
-                    <div class="chart-title">🚧 Obstruction Levels (%)</div>
-                    <canvas id="obstructionChart" width="400" height="200"></canvas>
-                </div>
-            </div>
+        altitude = getattr(gps_stats, 'altitude', None)
+        if altitude is None:
+            altitude = getattr(gps_stats, 'alt', 0.0)
             
-            <div class="info-section">
-                <div class="info-item">
-                    <span>Account Name</span>
-                    <strong>{account_name}</strong>
-                </div>
-                <div class="info-item">
-                    <span>Connection Uptime</span>
-                    <strong>{uptime_str}</strong>
-                </div>
-                <div class="info-item">
-                    <span>Ethernet Link Speed</span>
-                    <strong>{eth_speed} Mbps</strong>
-                </div>
-                <div class="info-item">
-                    <span>SNR Above Noise Floor</span>
-                    <strong>{'✅ Yes' if snr_above_noise else '❌ No'}</strong>
-                </div>
-                <div class="info-item">
-                    <span>GPS Status</span>
-                    <strong>{'✅ Valid' if gps_valid else '❌ Invalid'} ({gps_sats} satellites)</strong>
-                </div>
-                <div class="info-item">
-                    <span>Location</span>
-                    <strong>
-                        {f'<a href="https://www.google.com/maps?q={latitude},{longitude}" target="_blank" style="color: #4f46e5; text-decoration: none;">{location_str} 🗺️</a>' if (latitude != 0 and longitude != 0) else location_str}
-                    </strong>
-                </div>
-                <div class="info-item">
-                    <span>Hardware Version</span>
-                    <strong>{hardware_version}</strong>
-                </div>
-                <div class="info-item">
-                    <span>Software Version</span>
-                    <strong>{software_version}</strong>
-                </div>
-            </div>
+        # Format location string if we have valid coordinates
+        if gps_valid and (latitude != 0 or longitude != 0):
+            # Try to get human-readable location
+            city_location = reverse_geocode(latitude, longitude)
+            if city_location:
+                location_str = city_location
+                # Add coordinates as tooltip or secondary info
+                location_str += f" ({latitude:.4f}°, {longitude:.4f}°)"
+            else:
+                # Fallback to coordinates only
+                location_str = f"{latitude:.6f}°, {longitude:.6f}°"
             
-            <div class="timestamp">Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}</div>
-        </div>
-
-        <script>
-        // Chart configurations
-        const chartConfig = {{
-            responsive: true,
-            maintainAspectRatio: true,
-            scales: {{
-                y: {{
-                    beginAtZero: true,
-                    grid: {{ color: 'rgba(0,0,0,0.1)' }},
-                    ticks: {{ font: {{ size: 10 }} }}
-                }},
-                x: {{
-                    grid: {{ color: 'rgba(0,0,0,0.1)' }},
-                    ticks: {{ 
-                        font: {{ size: 10 }},
-                        maxTicksLimit: 10
-                    }}
-                }}
-            }},
-            plugins: {{
-                legend: {{ 
-                    display: true,
-                    position: 'top',
-                    labels: {{ font: {{ size: 11 }} }}
-                }}
-            }},
-            animation: {{ duration: 0 }}
-        }};
-
-        // Initialize charts
-        const latencyCtx = document.getElementById('latencyChart').getContext('2d');
-        const speedCtx = document.getElementById('speedChart').getContext('2d');
-        const qualityCtx = document.getElementById('qualityChart').getContext('2d');
-        const obstructionCtx = document.getElementById('obstructionChart').getContext('2d');
-
-        const latencyChart = new Chart(latencyCtx, {{
-            type: 'line',
-            data: {{
-                labels: [],
-                datasets: [{{
-                    label: 'Latency (ms)',
-                    data: [],
-                    borderColor: 'rgb(99, 132, 255)',
-                    backgroundColor: 'rgba(99, 132, 255, 0.2)',
-                    tension: 0.4,
-                    fill: true
-                }}]
-            }},
-            options: {{
-                ...chartConfig,
-                scales: {{
-                    ...chartConfig.scales,
-                    y: {{
-                        ...chartConfig.scales.y,
-                        suggestedMax: 100
-                    }}
-                }}
-            }}
-        }});
-
-        const speedChart = new Chart(speedCtx, {{
-            type: 'line',
-            data: {{
-                labels: [],
-                datasets: [{{
-                    label: 'Download (Mbps)',
-                    data: [],
-                    borderColor: 'rgb(34, 197, 94)',
-                    backgroundColor: 'rgba(34, 197, 94, 0.1)',
-                    tension: 0.4
-                }}, {{
-                    label: 'Upload (Mbps)',
-                    data: [],
-                    borderColor: 'rgb(239, 68, 68)',
-                    backgroundColor: 'rgba(239, 68, 68, 0.1)',
-                    tension: 0.4
-                }}]
-            }},
-            options: chartConfig
-        }});
-
-        const qualityChart = new Chart(qualityCtx, {{
-            type: 'line',
-            data: {{
-                labels: [],
-                datasets: [{{
-                    label: 'Quality Score (%)',
-                    data: [],
-                    borderColor: 'rgb(168, 85, 247)',
-                    backgroundColor: 'rgba(168, 85, 247, 0.2)',
-                    tension: 0.4,
-                    fill: true
-                }}]
-            }},
-            options: {{
-                ...chartConfig,
-                scales: {{
-                    ...chartConfig.scales,
-                    y: {{
-                        ...chartConfig.scales.y,
-                        min: 0,
-                        max: 100
-                    }}
-                }}
-            }}
-        }});
-
-        const obstructionChart = new Chart(obstructionCtx, {{
-            type: 'bar',
-            data: {{
-                labels: [],
-                datasets: [{{
-                    label: 'Obstruction (%)',
-                    data: [],
-                    backgroundColor: 'rgba(245, 158, 11, 0.8)',
-                    borderColor: 'rgb(245, 158, 11)',
-                    borderWidth: 1
-                }}]
-            }},
-            options: {{
-                ...chartConfig,
-                scales: {{
-                    ...chartConfig.scales,
-                    y: {{
-                        ...chartConfig.scales.y,
-                        suggestedMax: 10
-                    }}
-                }}
-            }}
-        }});
-
-        // Function to update charts
-        function updateCharts() {{
-            fetch('/api/current-stats')
-                .then(response => response.json())
-                .then(data => {{
-                    if (data.error) {{
-                        console.error('API Error:', data.error);
-                        return;
-                    }}
-                    
-                    // Add new data point
-                    const timestamp = data.timestamp;
-                    
-                    // Update latency chart
-                    latencyChart.data.labels.push(timestamp);
-                    latencyChart.data.datasets[0].data.push(data.latency);
-                    
-                    // Update speed chart
-                    speedChart.data.labels.push(timestamp);
-                    speedChart.data.datasets[0].data.push(data.download_mbps);
-                    speedChart.data.datasets[1].data.push(data.upload_mbps);
-                    
-                    // Update quality chart
-                    qualityChart.data.labels.push(timestamp);
-                    qualityChart.data.datasets[0].data.push(data.quality_score);
-                    
-                    // Update obstruction chart
-                    obstructionChart.data.labels.push(timestamp);
-                    obstructionChart.data.datasets[0].data.push(data.obstruction_pct);
-                    
-                    // Keep only last 50 data points
-                    const maxPoints = 50;
-                    [latencyChart, speedChart, qualityChart, obstructionChart].forEach(chart => {{
-                        if (chart.data.labels.length > maxPoints) {{
-                            chart.data.labels.shift();
-                            chart.data.datasets.forEach(dataset => dataset.data.shift());
-                        }}
-                        chart.update('none'); // Update without animation
-                    }});
-                }})
-                .catch(error => console.error('Error updating charts:', error));
-        }}
-
-        // Initial chart update
-        updateCharts();
-        
-        // Update charts every 5 seconds
-        setInterval(updateCharts, 5000);
-        
-        // Refresh page every 5 minutes to prevent memory leaks
-        setTimeout(function(){{ location.reload(); }}, 300000);
-        </script>
-        </body>
-        </html>
-        """
-    except Exception as e:
-        return f"""
-        <html>
-        <head><title>Starlink Monitor - Error</title></head>
-        <body style="font-family: Arial, sans-serif; margin: 40px;">
-        <div style="background: white; padding: 30px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-            <h1 style="color: #ef4444;">⚠️ Starlink Monitor - Connection Error</h1>
-            <p style="color: #666;">Unable to connect to Starlink dish</p>
-            <div style="background: #fee; padding: 15px; border-radius: 5px; margin: 20px 0;">
-                <strong>Error details:</strong><br>
-                <code style="color: #c00;">{str(e)}</code>
-            </div>
-            <p style="color: #666;">Please ensure:</p>
-            <ul style="color: #666;">
-                <li>Your Starlink dish is powered on and connected</li>
-                <li>The dish is accessible at IP address 192.168.100.1</li>
-                <li>Your network configuration allows access to the dish</li>
-            </ul>
-            <p style="color: #999; font-size: 0.9em;">This page will automatically retry in 30 seconds...</p>
-        </div>
-        <script>
-        setTimeout(function(){{ location.reload(); }}, 30000);
-        </script>
-        </body>
-        </html>
-        """
+            if altitude > 0:
+                location_str += f" • {altitude:.0f}m altitude"
+    
+    # Use manual location if GPS not available but manual location is set
+    if location_str == "Location unavailable":
+        if manual_location:
+            location_str = manual_location
+        elif manual_lat != 0 and manual_lon != 0:
+            latitude = manual_lat
+            longitude = manual_lon
+            # Try to get human-readable location
+            city_location = reverse_geocode(latitude, longitude)
+            if city_location:
+                location_str = city_location
+                location_str += f" ({latitude:.4f}°, {longitude:.4f}°)"
+            else:
+                location_str = f"{latitude:.6f}°, {longitude:.6f}°"
+    
+    # Get SNR status
+    snr_above_noise = status.is_snr_above_noise_floor
+    
+    # Get Ethernet speed
+    eth_speed = status.eth_speed_mbps
+    
+    # Calculate quality score
+    quality_score = calculate_quality_score(latency, downlink_mbps, uplink_mbps, fraction_obstructed, snr_above_noise)
+    
+    context = {
+        'state': state,
+        'state_class': 'status-connected' if state == 'CONNECTED' else 'status-disconnected',
+        'notice': _NOTICE_REAL if has_real_data else (_NOTICE_LOW if downlink_mbps < 5 else _NOTICE_NONE),
+        'downlink_mbps': downlink_mbps,
+        'download_class': rating_class(downlink_mbps, DOWNLOAD_RATING),
+        'uplink_mbps': uplink_mbps,
+        'upload_class': rating_class(uplink_mbps, UPLOAD_RATING),
+        'speed_note': speed_note,
+        'latency': latency,
+        'latency_class': rating_class(latency, LATENCY_RATING),
+        'quality_score': quality_score,
+        'quality_class': rating_class(quality_score, QUALITY_RATING),
+        'fraction_obstructed': fraction_obstructed,
+        'obstruction_class': rating_class(fraction_obstructed, OBSTRUCTION_RATING),
+        'account_name': account_name,
+        'uptime_str': uptime_str,
+        'eth_speed': eth_speed,
+        'snr_label': '✅ Yes' if snr_above_noise else '❌ No',
+        'gps_label': '✅ Valid' if gps_valid else '❌ Invalid',
+        'gps_sats': gps_sats,
+        'location_str': location_str,
+        'latitude': latitude,
+        'longitude': longitude,
+        'hardware_version': hardware_version,
+        'software_version': software_version,
+        'last_updated': time.strftime('%Y-%m-%d %H:%M:%S'),
+    }
+    
+    # The reading only changes every poll interval, so let the browser reuse it until then
+    cache_control = f'max-age={dish_poller.interval}'
+    
+    # Skip rendering entirely if the browser already has a page showing the same values
+    etag = index_etag(context)
+    if etag in request.if_none_match:
+        response = make_response('', 304)
+        response.headers['Cache-Control'] = cache_control
+        response.set_etag(etag)
+        return response
+    
+    body = _INDEX_BODY.render(context).encode('utf-8')
+    if preferred_encoding() == 'gzip':
+        response = Response(gzip_index_page(body), mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        # Brotli (or no compression) is left to compress_response
+        response = Response(_INDEX_HEAD + body + _INDEX_TAIL, mimetype='text/html')
+    response.headers['Cache-Control'] = cache_control
+    response.set_etag(etag)
+    return response
 
 @app.route('/advanced')
 def advanced_monitoring():
     """Advanced Monitoring Dashboard"""
-    try:
-        return f"""
-        <!DOCTYPE html>
-        <html lang="en">
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>🔬 Advanced Monitoring - Starlink Monitor</title>
-            <meta http-equiv="refresh" content="30">
-            <style>
-                * {{
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }}
-                
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    color: #333;
-                    min-height: 100vh;
-                    padding: 20px;
-                }}
-                
-                .container {{
-                    max-width: 1400px;
-                    margin: 0 auto;
-                    background: rgba(255, 255, 255, 0.95);
-                    border-radius: 20px;
-                    padding: 30px;
-                    box-shadow: 0 20px 60px rgba(0, 0, 0, 0.1);
-                }}
-                
-                h1 {{
-                    text-align: center;
-                    color: #2c3e50;
-                    margin-bottom: 30px;
-                    font-size: 2.5em;
-                    text-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                }}
-                
-                /* Navigation Styles */
-                .main-nav {{
-                    display: flex;
-                    justify-content: space-between;
-                    align-items: center;
-                    background: rgba(255, 255, 255, 0.9);
-                    border-radius: 15px;
-                    padding: 15px 25px;
-                    margin: 25px 0;
-                    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-                    backdrop-filter: blur(10px);
-                }}
-                
-                .nav-brand {{
-                    display: flex;
-                    align-items: center;
-                    gap: 10px;
-                    font-weight: 600;
-                    color: #2c3e50;
-                }}
-                
-                .nav-logo {{
-                    font-size: 1.5em;
-                }}
-                
-                .nav-links {{
-                    display: flex;
-                    gap: 5px;
-                }}
-                
-                .nav-link {{
-                    display: flex;
-                    align-items: center;
-                    gap: 8px;
-                    padding: 12px 20px;
-                    text-decoration: none;
-                    color: #666;
-                    border-radius: 10px;
-                    transition: all 0.3s ease;
-                    font-weight: 500;
-                }}
-                
-                .nav-link:hover {{
-                    background: rgba(103, 126, 234, 0.1);
-                    color: #667eea;
-                    transform: translateY(-1px);
-                }}
-                
-                .nav-link.active {{
-                    background: linear-gradient(135deg, #667eea, #764ba2);
-                    color: white;
-                    box-shadow: 0 4px 15px rgba(103, 126, 234, 0.3);
-                }}
-                
-                .nav-icon {{
-                    font-size: 1.1em;
-                }}
-                
-                /* Advanced Monitoring Styles */
-                .advanced-grid {{
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
-                    gap: 25px;
-                    margin: 30px 0;
-                }}
-                
-                .advanced-card {{
-                    background: rgba(255, 255, 255, 0.9);
-                    border-radius: 15px;
-                    padding: 25px;
-                    box-shadow: 0 8px 32px rgba(0,0,0,0.1);
-                    backdrop-filter: blur(10px);
-                    transition: transform 0.3s ease;
-                }}
-                
-                .advanced-card:hover {{
-                    transform: translateY(-2px);
-                }}
-                
-                .advanced-card h3 {{
-                    color: #2c3e50;
-                    margin-bottom: 20px;
-                    font-size: 1.3em;
-                    display: flex;
-                    align-items: center;
-                    gap: 10px;
-                }}
-                
-                .loading {{
-                    text-align: center;
-                    color: #666;
-                    font-style: italic;
-                    padding: 20px;
-                }}
-                
-                .error {{
-                    color: #e74c3c;
-                    background: rgba(231, 76, 60, 0.1);
-                    padding: 15px;
-                    border-radius: 8px;
-                    border-left: 4px solid #e74c3c;
-                }}
-                
-                .info-notice {{
-                    background: rgba(52, 152, 219, 0.1);
-                    border-left: 4px solid #3498db;
-                    padding: 15px;
-                    margin: 20px 0;
-                    border-radius: 8px;
-                    color: #2980b9;
-                }}
-                
-                .weather-setup {{
-                    background: rgba(241, 196, 15, 0.1);
-                    border-left: 4px solid #f1c40f;
-                    padding: 20px;
-                    margin: 20px 0;
-                    border-radius: 8px;
-                    color: #f39c12;
-                }}
-                
-                .setup-code {{
-                    background: rgba(0,0,0,0.1);
-                    padding: 10px;
-                    border-radius: 5px;
-                    font-family: monospace;
-                    margin: 10px 0;
-                    font-size: 0.9em;
-                }}
-                
-                /* Responsive */
-                @media (max-width: 768px) {{
-                    body {{ padding: 10px; }}
-                    .container {{ padding: 20px; }}
-                    h1 {{ font-size: 2em; }}
-                    .nav-links {{ flex-wrap: wrap; gap: 5px; }}
-                    .nav-text {{ display: none; }}
-                    .advanced-grid {{ grid-template-columns: 1fr; }}
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <h1>🔬 Advanced Monitoring</h1>
-                
-                <nav class="main-nav">
-                    <div class="nav-brand">
-                        <span class="nav-logo">🛰️</span>
-                        <span class="nav-title">Starlink Monitor</span>
-                    </div>
-                    <div class="nav-links">
-                        <a href="/" class="nav-link">
-                            <span class="nav-icon">📊</span>
-                            <span class="nav-text">Live Monitor</span>
-                        </a>
-                        <a href="/speedtest" class="nav-link">
-                            <span class="nav-icon">⚡</span>
-                            <span class="nav-text">Speed Test</span>
-                        </a>
-                        <a href="/analytics" class="nav-link">
-                            <span class="nav-icon">📈</span>
-                            <span class="nav-text">Analytics</span>
-                        </a>
-                        <a href="/advanced" class="nav-link active">
-                            <span class="nav-icon">🔬</span>
-                            <span class="nav-text">Advanced</span>
-                        </a>
-                    </div>
-                </nav>
-                
-                <div class="info-notice">
-                    <strong>🔬 Advanced Monitoring:</strong> Deep insights into outages, weather correlation, and peak performance patterns.
-                </div>
-                
-                <div class="weather-setup">
-                    <strong>⚡ Enable Weather Correlation:</strong> To get weather impact analysis, add these to your docker-compose.yml:
-                    <div class="setup-code">
-environment:<br>
-&nbsp;&nbsp;- WEATHER_API_KEY=your_openweathermap_key<br>
-&nbsp;&nbsp;- STARLINK_LATITUDE=your_latitude<br>
-&nbsp;&nbsp;- STARLINK_LONGITUDE=your_longitude
-                    </div>
-                    Get a free API key at <a href="https://openweathermap.org/api" target="_blank" style="color: #e67e22;">OpenWeatherMap</a>
-                </div>
-                
-                <div class="advanced-grid">
-                    <div class="advanced-card">
-                        <h3>🚨 Outage Analysis</h3>
-                        <div id="outageAnalysis" class="loading">Loading outage data...</div>
-                    </div>
-                    
-                    <div class="advanced-card">
-                        <h3>🌤️ Weather Impact</h3>
-                        <div id="weatherImpact" class="loading">Loading weather correlation...</div>
-                    </div>
-                    
-                    <div class="advanced-card">
-                        <h3>⚡ Peak Performance</h3>
-                        <div id="peakAnalysis" class="loading">Loading performance patterns...</div>
-                    </div>
-                    
-                    <div class="advanced-card">
-                        <h3>🔮 Weather Forecast</h3>
-                        <div id="weatherForecast" class="loading">Loading weather forecast...</div>
-                    </div>
-                </div>
-            </div>
-            
-            <script>
-                // Load advanced monitoring data
-                async function loadAdvancedData() {{
-                    try {{
-                        // Load outage analysis
-                        const outageResponse = await fetch('/api/advanced/outage-analysis?days=30');
-                        const outageData = await outageResponse.json();
-                        displayOutageAnalysis(outageData);
-                        
-                        // Load weather impact
-                        const weatherResponse = await fetch('/api/advanced/weather-impact?days=7');
-                        const weatherData = await weatherResponse.json();
-                        displayWeatherImpact(weatherData);
-                        
-                        // Load peak analysis
-                        const peakResponse = await fetch('/api/advanced/peak-analysis?days=7');
-                        const peakData = await peakResponse.json();
-                        displayPeakAnalysis(peakData);
-                        
-                        // Load weather forecast
-                        const forecastResponse = await fetch('/api/advanced/weather-forecast');
-                        const forecastData = await forecastResponse.json();
-                        displayWeatherForecast(forecastData);
-                        
-                    }} catch (error) {{
-                        console.error('Error loading advanced data:', error);
-                    }}
-                }}
-                
-                function displayOutageAnalysis(data) {{
-                    const container = document.getElementById('outageAnalysis');
-                    if (data.error) {{
-                        container.innerHTML = `<div class="error">Error: ${{data.error}}</div>`;
-                        return;
-                    }}
-                    
-                    const stats = data.statistics || {{}};
-                    container.innerHTML = `
-                        <div><strong>Total Outages:</strong> ${{stats.total_outages || 0}}</div>
-                        <div><strong>Total Duration:</strong> ${{Math.round((stats.total_duration_seconds || 0) / 60)}} minutes</div>
-                        <div><strong>Average Duration:</strong> ${{Math.round((stats.avg_duration_seconds || 0) / 60)}} minutes</div>
-                        <div><strong>Longest Outage:</strong> ${{Math.round((stats.longest_duration_seconds || 0) / 60)}} minutes</div>
-                        ${{stats.critical_outages ? `<div style="color: #e74c3c;"><strong>Critical Outages:</strong> ${{stats.critical_outages}}</div>` : ''}}
-                    `;
-                }}
-                
-                function displayWeatherImpact(data) {{
-                    const container = document.getElementById('weatherImpact');
-                    if (data.error) {{
-                        container.innerHTML = `<div class="error">Weather service not configured</div>`;
-                        return;
-                    }}
-                    
-                    const insights = data.weather_insights || [];
-                    if (insights.length === 0) {{
-                        container.innerHTML = '<div>No weather correlation data available yet</div>';
-                        return;
-                    }}
-                    
-                    const impactHTML = insights.map(insight => `
-                        <div style="margin: 10px 0; padding: 10px; background: rgba(0,0,0,0.05); border-radius: 5px;">
-                            <strong>${{insight.condition}}:</strong> 
-                            <span style="color: ${{insight.impact === 'negative' ? '#e74c3c' : '#27ae60'}}">
-                                ${{insight.quality_score}}% quality
-                            </span>
-                            <br><small>${{insight.recommendation}}</small>
-                        </div>
-                    `).join('');
-                    
-                    container.innerHTML = impactHTML || '<div>Analyzing weather patterns...</div>';
-                }}
-                
-                function displayPeakAnalysis(data) {{
-                    const container = document.getElementById('peakAnalysis');
-                    if (data.error) {{
-                        container.innerHTML = `<div class="error">Error: ${{data.error}}</div>`;
-                        return;
-                    }}
-                    
-                    const bestHours = data.best_hours || [];
-                    const worstHours = data.worst_hours || [];
-                    
-                    let html = '';
-                    if (bestHours.length > 0) {{
-                        const best = bestHours[0];
-                        html += `<div style="color: #27ae60;"><strong>Best Hour:</strong> ${{best.hour}}:00 (${{Math.round(best.avg_quality || 0)}}% quality)</div>`;
-                    }}
-                    if (worstHours.length > 0) {{
-                        const worst = worstHours[0];
-                        html += `<div style="color: #e74c3c;"><strong>Worst Hour:</strong> ${{worst.hour}}:00 (${{Math.round(worst.avg_quality || 0)}}% quality)</div>`;
-                    }}
-                    
-                    const weekdayAvg = data.weekday_avg_quality || 0;
-                    const weekendAvg = data.weekend_avg_quality || 0;
-                    if (weekdayAvg > 0 || weekendAvg > 0) {{
-                        html += `<div style="margin-top: 15px;"><strong>Weekday vs Weekend:</strong></div>`;
-                        html += `<div>Weekdays: ${{Math.round(weekdayAvg)}}% quality</div>`;
-                        html += `<div>Weekends: ${{Math.round(weekendAvg)}}% quality</div>`;
-                    }}
-                    
-                    container.innerHTML = html || '<div>Analyzing performance patterns...</div>';
-                }}
-                
-                function displayWeatherForecast(data) {{
-                    const container = document.getElementById('weatherForecast');
-                    if (data.error) {{
-                        container.innerHTML = `<div class="error">Weather forecast not available</div>`;
-                        return;
-                    }}
-                    
-                    const forecast = data.forecast || [];
-                    const warnings = data.warnings || [];
-                    
-                    let html = `<div><strong>Impact Prediction:</strong> ${{data.impact_prediction || 'Good conditions expected'}}</div>`;
-                    
-                    if (warnings.length > 0) {{
-                        html += '<div style="margin-top: 15px;"><strong>Warnings:</strong></div>';
-                        warnings.forEach(warning => {{
-                            html += `<div style="color: #e67e22; margin: 5px 0;"><strong>${{warning.time}}:</strong> ${{warning.warning}}</div>`;
-                        }});
-                    }}
-                    
-                    if (forecast.length > 0) {{
-                        const next = forecast[0];
-                        html += `<div style="margin-top: 15px;"><strong>Current:</strong> ${{next.weather_condition || 'Unknown'}} ${{Math.round(next.temperature_c || 0)}}°C</div>`;
-                    }}
-                    
-                    container.innerHTML = html || '<div>Weather forecast not available</div>';
-                }}
-                
-                // Load data on page load
-                loadAdvancedData();
-                
-                // Refresh data every 30 seconds
-                setInterval(loadAdvancedData, 30000);
-            </script>
-        </body>
-        </html>
-        """
-    except Exception as e:
-        return f"<h1>Error loading Advanced Monitoring dashboard: {str(e)}</h1>", 500
+    # Static page streamed from disk - all of its data is loaded from the advanced monitoring API
+    response = app.send_static_file('advanced.html')
+    response.headers['Cache-Control'] = 'public, max-age=3600'
+    return response
 
 # Advanced Monitoring API Endpoints
 @app.route('/api/advanced/outage-analysis')
@@ -2,93 +2,78 @@ from flask import Flask, jsonify
 import sys
 import os
 import time
-import statistics
 import json
-from datetime import datetime, timedelta
-from collections import deque
+import numpy as np
 
 # Add temp3 directory to path to use the working implementation
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'temp3'))
 import starlink_grpc
 
+import throughput
+from quality import calculate_quality_score, quality_scores
+from json_provider import JSONProvider
+
 app = Flask(__name__)
+app.json = JSONProvider(app)
+
+# (epoch second, formatted HH:MM:SS) - replaced as a whole, so readers never need a lock
+_clock_cache = (None, '')
+
+def clock_time():
+    """Current local time as HH:MM:SS, formatted at most once per second"""
+    global _clock_cache
+    now = time.time()
+    second = int(now)
+    cached_second, text = _clock_cache
+    if second != cached_second:
+        text = time.strftime('%H:%M:%S', time.localtime(now))
+        _clock_cache = (second, text)
+    return text
 
 # In-memory storage for historical data (in production, use Redis/database)
 class DataStore:
+    # Series stored as rows of one ring buffer, one column per point. Quality scores are
+    # derived from the other rows on read, in one vectorized pass over the whole window.
+    SERIES = ('latency', 'download_speeds', 'upload_speeds', 'obstruction', 'snr_above_noise')
+    
     def __init__(self, max_points=300):  # Store 5 minutes at 1-second intervals
         self.max_points = max_points
-        self.timestamps = deque(maxlen=max_points)
-        self.latency_data = deque(maxlen=max_points)
-        self.download_speeds = deque(maxlen=max_points)
-        self.upload_speeds = deque(maxlen=max_points)
-        self.obstruction_data = deque(maxlen=max_points)
-        self.quality_scores = deque(maxlen=max_points)
+        self.timestamps = [None] * max_points
+        # float32 matches the dish's own precision and halves the bytes each chart read walks
+        self.values = np.zeros((len(self.SERIES), max_points), dtype=np.float32)
+        self.head = 0  # Next slot to write - the oldest point once the buffer is full
+        self.filled = 0
     
-    def add_data_point(self, latency, download_mbps, upload_mbps, obstruction_pct, quality_score):
-        now = datetime.now()
-        self.timestamps.append(now.strftime('%H:%M:%S'))
-        self.latency_data.append(latency)
-        self.download_speeds.append(download_mbps)
-        self.upload_speeds.append(upload_mbps)
-        self.obstruction_data.append(obstruction_pct)
-        self.quality_scores.append(quality_score)
+    def add_data_point(self, latency, download_mbps, upload_mbps, obstruction_pct, snr_above_noise):
+        self.timestamps[self.head] = clock_time()
+        self.values[:, self.head] = (latency, download_mbps, upload_mbps, obstruction_pct, snr_above_noise)
+        self.head = (self.head + 1) % self.max_points
+        self.filled = min(self.filled + 1, self.max_points)
     
     def get_chart_data(self):
+        head = self.head
+        if self.filled < self.max_points:
+            timestamps = self.timestamps[:head]
+            values = self.values[:, :head]
+        else:
+            # Unwrap the ring so points come out oldest first
+            timestamps = self.timestamps[head:] + self.timestamps[:head]
+            values = np.concatenate((self.values[:, head:], self.values[:, :head]), axis=1)
+        
+        # Rows go to the JSON provider as arrays - no intermediate Python lists
+        latency, download_speeds, upload_speeds, obstruction, snr_above_noise = values
         return {
-            'timestamps': list(self.timestamps),
-            'latency': list(self.latency_data),
-            'download_speeds': list(self.download_speeds),
-            'upload_speeds': list(self.upload_speeds),
-            'obstruction': list(self.obstruction_data),
-            'quality_scores': list(self.quality_scores)
+            'timestamps': timestamps,
+            'latency': latency,
+            'download_speeds': download_speeds,
+            'upload_speeds': upload_speeds,
+            'obstruction': obstruction,
+            'quality_scores': quality_scores(latency, download_speeds, upload_speeds, obstruction, snr_above_noise != 0)
         }
 
 # Global data store
 data_store = DataStore()
 
-def calculate_quality_score(latency, download_mbps, upload_mbps, obstruction_pct, snr_good):
-    """Calculate connection quality score (0-100)"""
-    score = 100
-    
-    # Latency impact (0-30 points)
-    if latency > 100:
-        score -= 30
-    elif latency > 75:
-        score -= 20
-    elif latency > 50:
-        score -= 10
-    
-    # Speed impact (0-25 points each)
-    if download_mbps < 10:
-        score -= 25
-    elif download_mbps < 25:
-        score -= 15
-    elif download_mbps < 50:
-        score -= 5
-    
-    if upload_mbps < 3:
-        score -= 25
-    elif upload_mbps < 8:
-        score -= 15
-    elif upload_mbps < 15:
-        score -= 5
-    
-    # Obstruction impact (0-20 points)
-    if obstruction_pct > 10:
-        score -= 20
-    elif obstruction_pct > 5:
-        score -= 15
-    elif obstruction_pct > 1:
-        score -= 10
-    elif obstruction_pct > 0.1:
-        score -= 5
-    
-    # SNR impact (0-10 points)
-    if not snr_good:
-        score -= 10
-    
-    return max(0, min(100, score))
-
 def get_speed_data():
     """Get speed data - try multiple approaches to find actual speeds"""
     try:
@@ -102,34 +87,32 @@ def get_speed_data():
             uplink_data = data.get('uplink_throughput_bps', [])
             
             if downlink_data and uplink_data:
-                # Look for significant activity in the last 5 minutes
-                active_downlink = [x for x in downlink_data if x > 1e6]  # > 1 Mbps
-                active_uplink = [x for x in uplink_data if x > 1e6]      # > 1 Mbps
-                
-                # Also get recent activity regardless of threshold
-                recent_downlink = [x for x in downlink_data[-60:] if x > 0]
-                recent_uplink = [x for x in uplink_data[-60:] if x > 0]
+                # Significant activity (> 1 Mbps) and any activity in the last minute, in one pass
+                (active_dl_sum, active_dl_count, active_dl_peak,
+                 active_ul_sum, active_ul_count, active_ul_peak,
+                 recent_dl_sum, recent_dl_count, recent_dl_peak,
+                 recent_ul_sum, recent_ul_count, recent_ul_peak) = throughput.summarize(
+                    np.asarray(downlink_data, dtype=np.float32),
+                    np.asarray(uplink_data, dtype=np.float32))
                 
                 result = {}
                 
-                if active_downlink and active_uplink:
+                if active_dl_count and active_ul_count:
                     # We found periods of high activity
-                    result['download_mbps'] = statistics.mean(active_downlink) / 1e6
-                    result['upload_mbps'] = statistics.mean(active_uplink) / 1e6
-                    result['peak_download'] = max(active_downlink) / 1e6
-                    result['peak_upload'] = max(active_uplink) / 1e6
-                    result['type'] = f"Active usage (last 5min, {len(active_downlink)} samples)"
+                    result['download_mbps'] = active_dl_sum / active_dl_count / 1e6
+                    result['upload_mbps'] = active_ul_sum / active_ul_count / 1e6
+                    result['peak_download'] = active_dl_peak / 1e6
+                    result['peak_upload'] = active_ul_peak / 1e6
+                    result['type'] = f"Active usage (last 5min, {active_dl_count} samples)"
                     return result
                 
-                elif recent_downlink and recent_uplink:
+                elif recent_dl_count and recent_ul_count:
                     # Use recent data even if low
-                    avg_down = statistics.mean(recent_downlink)
-                    avg_up = statistics.mean(recent_uplink)
-                    result['download_mbps'] = avg_down / 1e6
-                    result['upload_mbps'] = avg_up / 1e6
-                    result['peak_download'] = max(recent_downlink) / 1e6
-                    result['peak_upload'] = max(recent_uplink) / 1e6
-                    result['type'] = f"Recent activity ({len(recent_downlink)} samples)"
+                    result['download_mbps'] = recent_dl_sum / recent_dl_count / 1e6
+                    result['upload_mbps'] = recent_ul_sum / recent_ul_count / 1e6
+                    result['peak_download'] = recent_dl_peak / 1e6
+                    result['peak_upload'] = recent_ul_peak / 1e6
+                    result['type'] = f"Recent activity ({recent_dl_count} samples)"
                     return result
     
     except Exception as e:
@@ -183,7 +166,7 @@ def current_stats():
         quality_score = calculate_quality_score(latency, downlink_mbps, uplink_mbps, fraction_obstructed, snr_above_noise)
         
         # Add to data store
-        data_store.add_data_point(latency, downlink_mbps, uplink_mbps, fraction_obstructed, quality_score)
+        data_store.add_data_point(latency, downlink_mbps, uplink_mbps, fraction_obstructed, snr_above_noise)
         
         return jsonify({
             'latency': round(latency, 1),
@@ -191,7 +174,7 @@ def current_stats():
             'upload_mbps': round(uplink_mbps, 1),
             'obstruction_pct': round(fraction_obstructed, 2),
             'quality_score': round(quality_score, 0),
-            'timestamp': datetime.now().strftime('%H:%M:%S')
+            'timestamp': clock_time()
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -3,26 +3,34 @@ import time
 from datetime import datetime, timedelta
 from typing import Optional
 import logging
+import numpy as np
 from database import StarlinkDatabase
 from weather_service import WeatherService
+import throughput
+from quality import calculate_quality_score
 import sys
 import os
 
-# Add temp3 directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(__file__)), 'temp3'))
+# Add temp3 directory to path (once - app and collector both import it)
+TEMP3_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'temp3')
+if TEMP3_DIR not in sys.path:
+    sys.path.insert(0, TEMP3_DIR)
 import starlink_grpc
 
 class DataCollector:
-    def __init__(self, db: StarlinkDatabase, collection_interval: int = 60):
+    def __init__(self, db: StarlinkDatabase, collection_interval: int = 60,
+                 context: Optional[starlink_grpc.ChannelContext] = None):
         """
         Initialize the data collector
         
         Args:
             db: Database instance
             collection_interval: How often to collect data (seconds)
+            context: Shared dish channel to reuse; a new channel per call if not set
         """
         self.db = db
         self.collection_interval = collection_interval
+        self.context = context
         self.running = False
         self.thread: Optional[threading.Thread] = None
         self.last_connection_state = True
@@ -49,55 +57,11 @@ class DataCollector:
         logging.basicConfig(level=logging.INFO)
         self.logger = logging.getLogger(__name__)
     
-    def calculate_quality_score(self, latency: float, download_mbps: float, upload_mbps: float, 
-                               obstruction_pct: float, snr_good: bool) -> int:
-        """Calculate connection quality score (0-100)"""
-        score = 100
-        
-        # Latency impact (0-30 points)
-        if latency > 100:
-            score -= 30
-        elif latency > 75:
-            score -= 20
-        elif latency > 50:
-            score -= 10
-        
-        # Speed impact (0-25 points each)
-        if download_mbps < 10:
-            score -= 25
-        elif download_mbps < 25:
-            score -= 15
-        elif download_mbps < 50:
-            score -= 5
-        
-        if upload_mbps < 3:
-            score -= 25
-        elif upload_mbps < 8:
-            score -= 15
-        elif upload_mbps < 15:
-            score -= 5
-        
-        # Obstruction impact (0-20 points)
-        if obstruction_pct > 10:
-            score -= 20
-        elif obstruction_pct > 5:
-            score -= 15
-        elif obstruction_pct > 1:
-            score -= 10
-        elif obstruction_pct > 0.1:
-            score -= 5
-        
-        # SNR impact (0-10 points)
-        if not snr_good:
-            score -= 10
-        
-        return max(0, min(100, score))
-    
-    def get_speed_data(self):
-        """Get speed data using the same logic as the main app"""
+    def get_speed_data(self, status=None):
+        """Get speed data using the same logic as the main app (reusing status if already fetched)"""
         try:
             # Try bulk history for recent high activity
-            bulk_data = starlink_grpc.history_bulk_data(300)  # Last 5 minutes
+            bulk_data = starlink_grpc.history_bulk_data(300, context=self.context)  # Last 5 minutes
             
             if bulk_data and len(bulk_data) > 1:
                 data = bulk_data[1]
@@ -106,35 +70,36 @@ class DataCollector:
                 uplink_data = data.get('uplink_throughput_bps', [])
                 
                 if downlink_data and uplink_data:
-                    # Look for significant activity
-                    active_downlink = [x for x in downlink_data if x > 1e6]
-                    active_uplink = [x for x in uplink_data if x > 1e6]
-                    
-                    # Also get recent activity
-                    recent_downlink = [x for x in downlink_data[-60:] if x > 0]
-                    recent_uplink = [x for x in uplink_data[-60:] if x > 0]
+                    # Significant activity (> 1 Mbps) and any activity in the last minute, in one pass
+                    (active_dl_sum, active_dl_count, _,
+                     active_ul_sum, active_ul_count, _,
+                     recent_dl_sum, recent_dl_count, _,
+                     recent_ul_sum, recent_ul_count, _) = throughput.summarize(
+                        np.asarray(downlink_data, dtype=np.float32),
+                        np.asarray(uplink_data, dtype=np.float32))
                     
-                    if active_downlink and active_uplink:
+                    if active_dl_count and active_ul_count:
                         # Use high activity data
                         return {
-                            'download_mbps': sum(active_downlink) / len(active_downlink) / 1e6,
-                            'upload_mbps': sum(active_uplink) / len(active_uplink) / 1e6
+                            'download_mbps': active_dl_sum / active_dl_count / 1e6,
+                            'upload_mbps': active_ul_sum / active_ul_count / 1e6
                         }
-                    elif recent_downlink and recent_uplink:
+                    elif recent_dl_count and recent_ul_count:
                         # Use recent data
                         return {
-                            'download_mbps': sum(recent_downlink) / len(recent_downlink) / 1e6,
-                            'upload_mbps': sum(recent_uplink) / len(recent_uplink) / 1e6
+                            'download_mbps': recent_dl_sum / recent_dl_count / 1e6,
+                            'upload_mbps': recent_ul_sum / recent_ul_count / 1e6
                         }
         except Exception as e:
             self.logger.warning(f"Error getting bulk speed data: {e}")
         
         # Fallback to instantaneous
         try:
-            status = starlink_grpc.get_status()
+            if status is None:
+                status = starlink_grpc.get_status(context=self.context)
             return {
-                'download_mbps': status.downlink_throughput_bps / 1e6 if hasattr(status, 'downlink_throughput_bps') else 0,
-                'upload_mbps': status.uplink_throughput_bps / 1e6 if hasattr(status, 'uplink_throughput_bps') else 0
+                'download_mbps': status.downlink_throughput_bps / 1e6,
+                'upload_mbps': status.uplink_throughput_bps / 1e6
             }
         except Exception as e:
             self.logger.error(f"Error getting instantaneous speed data: {e}")
@@ -144,36 +109,29 @@ class DataCollector:
         """Collect a single data point and store it"""
         try:
             # Get status data
-            status = starlink_grpc.get_status()
-            speed_data = self.get_speed_data()
+            status = starlink_grpc.get_status(context=self.context)
+            speed_data = self.get_speed_data(status)
             
             # Extract metrics
             timestamp = datetime.now()
-            latency_ms = status.pop_ping_latency_ms if hasattr(status, 'pop_ping_latency_ms') else 0
+            latency_ms = status.pop_ping_latency_ms
             download_mbps = speed_data['download_mbps']
             upload_mbps = speed_data['upload_mbps']
             
             # Obstruction info
-            obstruction_pct = 0
-            if hasattr(status, 'obstruction_stats') and hasattr(status.obstruction_stats, 'fraction_obstructed'):
-                obstruction_pct = status.obstruction_stats.fraction_obstructed * 100
+            obstruction_pct = status.obstruction_stats.fraction_obstructed * 100
             
             # Other metrics
-            snr_above_noise = status.is_snr_above_noise_floor if hasattr(status, 'is_snr_above_noise_floor') else False
-            uptime_seconds = 0
-            if hasattr(status, 'device_state') and hasattr(status.device_state, 'uptime_s'):
-                uptime_seconds = status.device_state.uptime_s
+            snr_above_noise = status.is_snr_above_noise_floor
+            uptime_seconds = status.device_state.uptime_s
             
-            gps_valid = False
-            gps_satellites = 0
-            if hasattr(status, 'gps_stats'):
-                gps_valid = status.gps_stats.gps_valid if hasattr(status.gps_stats, 'gps_valid') else False
-                gps_satellites = status.gps_stats.gps_sats if hasattr(status.gps_stats, 'gps_sats') else 0
+            gps_valid = status.gps_stats.gps_valid
+            gps_satellites = status.gps_stats.gps_sats
             
-            eth_speed_mbps = status.eth_speed_mbps if hasattr(status, 'eth_speed_mbps') else 0
+            eth_speed_mbps = status.eth_speed_mbps
             
             # Calculate quality score
-            quality_score = self.calculate_quality_score(
+            quality_score = calculate_quality_score(
                 latency_ms, download_mbps, upload_mbps, obstruction_pct, snr_above_noise
             )
             
@@ -223,6 +181,24 @@ class DataCollector:
             
             self.last_connection_state = connection_ok
             
+            # Performance events are stored along with the data point
+            events = []
+            if quality_score < 50:
+                events.append(('poor_performance', {
+                    'quality_score': quality_score,
+                    'latency_ms': latency_ms,
+                    'download_mbps': download_mbps,
+                    'upload_mbps': upload_mbps,
+                    'obstruction_pct': obstruction_pct
+                }))
+            
+            # Log high-speed events (might indicate speed tests)
+            if download_mbps > 50 or upload_mbps > 20:
+                events.append(('high_speed', {
+                    'download_mbps': download_mbps,
+                    'upload_mbps': upload_mbps
+                }))
+            
             # Store the data point
             self.db.insert_metric(
                 timestamp=timestamp,
@@ -235,26 +211,10 @@ class DataCollector:
                 uptime_seconds=uptime_seconds,
                 gps_valid=gps_valid,
                 gps_satellites=gps_satellites,
-                eth_speed_mbps=eth_speed_mbps
+                eth_speed_mbps=eth_speed_mbps,
+                events=events
             )
             
-            # Record performance events
-            if quality_score < 50:
-                self.db.record_performance_event('poor_performance', {
-                    'quality_score': quality_score,
-                    'latency_ms': latency_ms,
-                    'download_mbps': download_mbps,
-                    'upload_mbps': upload_mbps,
-                    'obstruction_pct': obstruction_pct
-                })
-            
-            # Log high-speed events (might indicate speed tests)
-            if download_mbps > 50 or upload_mbps > 20:
-                self.db.record_performance_event('high_speed', {
-                    'download_mbps': download_mbps,
-                    'upload_mbps': upload_mbps
-                })
-            
             self.logger.debug(f"Collected: {download_mbps:.1f}Mbps↓ {upload_mbps:.1f}Mbps↑ {latency_ms:.0f}ms Q:{quality_score}%")
             
         except Exception as e:
@@ -1,8 +1,9 @@
 import sqlite3
 import os
-from datetime import datetime, timedelta
+import threading
+from datetime import date, datetime, timedelta
 from contextlib import contextmanager
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 import json
 
 class StarlinkDatabase:
@@ -10,6 +11,7 @@ class StarlinkDatabase:
         if db_path is None:
             db_path = os.environ.get('DATABASE_PATH', '../data/starlink_data.db')
         self.db_path = db_path
+        self._local = threading.local()  # Per-thread connection
         self.init_database()
     
     def init_database(self):
@@ -18,6 +20,10 @@ class StarlinkDatabase:
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         
         with self.get_connection() as conn:
+            # WAL lets the API read while the collector writes, and commits without rewriting a journal.
+            # The mode is stored in the database file, so setting it once here covers every connection.
+            conn.execute("PRAGMA journal_mode=WAL")
+            
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS metrics (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -147,22 +153,36 @@ class StarlinkDatabase:
     @contextmanager
     def get_connection(self):
         """Context manager for database connections"""
-        conn = sqlite3.connect(self.db_path, timeout=30.0)
-        conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+        # Each thread keeps its connection open, so sqlite3's per-connection statement cache
+        # lets repeated queries skip parsing and planning
+        local = self._local
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30.0)
+            conn.row_factory = sqlite3.Row  # Enable dict-like access to rows
+            conn.execute("PRAGMA synchronous=NORMAL")  # Durable across crashes in WAL mode, fewer fsyncs
+            local.conn = conn
+            local.depth = 0
+        
+        # A nested call joins the outer block's transaction, which commits or rolls back once at the end
+        local.depth += 1
         try:
             yield conn
-            conn.commit()
+            if local.depth == 1:
+                conn.commit()
         except Exception as e:
-            conn.rollback()
+            if local.depth == 1:
+                conn.rollback()
             raise e
         finally:
-            conn.close()
+            local.depth -= 1
     
     def insert_metric(self, timestamp: datetime, latency_ms: float, download_mbps: float, 
                      upload_mbps: float, obstruction_pct: float = 0, quality_score: int = 0,
                      snr_above_noise: bool = False, uptime_seconds: int = 0, 
-                     gps_valid: bool = False, gps_satellites: int = 0, eth_speed_mbps: int = 0):
-        """Insert a new metric data point"""
+                     gps_valid: bool = False, gps_satellites: int = 0, eth_speed_mbps: int = 0,
+                     events: List[Tuple[str, Dict]] = None):
+        """Insert a new metric data point, with any (event_type, details) performance events, in one transaction"""
         with self.get_connection() as conn:
             conn.execute("""
                 INSERT INTO metrics (timestamp, latency_ms, download_mbps, upload_mbps, 
@@ -171,6 +191,13 @@ class StarlinkDatabase:
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (timestamp, latency_ms, download_mbps, upload_mbps, obstruction_pct, 
                   quality_score, snr_above_noise, uptime_seconds, gps_valid, gps_satellites, eth_speed_mbps))
+            
+            if events:
+                conn.executemany("""
+                    INSERT INTO performance_events (timestamp, event_type, details)
+                    VALUES (?, ?, ?)
+                """, [(timestamp, event_type, json.dumps(details) if details else None)
+                      for event_type, details in events])
     
     def get_metrics(self, start_time: datetime = None, end_time: datetime = None, 
                    limit: int = 1000) -> List[Dict]:
@@ -226,29 +253,54 @@ class StarlinkDatabase:
         start_date = (datetime.now() - timedelta(days=days)).date()
         
         with self.get_connection() as conn:
-            # First, try to get existing daily stats
+            self._refresh_daily_stats(conn, start_date)
+            
             cursor = conn.execute("""
                 SELECT * FROM daily_stats 
                 WHERE date >= ? 
                 ORDER BY date DESC
             """, (start_date,))
             
-            existing_stats = [dict(row) for row in cursor.fetchall()]
+            return [dict(row) for row in cursor.fetchall()]
+    
+    def _refresh_daily_stats(self, conn, start_date):
+        """Calculate daily statistics if there are none yet for today"""
+        newest = conn.execute("SELECT MAX(date) FROM daily_stats WHERE date >= ?", (start_date,)).fetchone()[0]
+        if newest is None or newest < date.today().isoformat():
+            self._calculate_daily_stats()
+    
+    def get_period_stats(self, period: str = 'week', days: int = 30) -> List[Dict]:
+        """Get daily statistics aggregated per week (Monday to Sunday) or month, newest first"""
+        start_date = (datetime.now() - timedelta(days=days)).date()
+        
+        if period == 'week':
+            period_start = "date(date, 'weekday 0', '-6 days')"
+            period_end = "date(date, 'weekday 0')"
+        else:  # month
+            period_start = "strftime('%Y-%m', date)"
+            period_end = "date(date, 'start of month', '+1 month', '-1 day')"
+        
+        with self.get_connection() as conn:
+            self._refresh_daily_stats(conn, start_date)
             
-            # If we don't have recent stats, calculate them
-            if not existing_stats or existing_stats[0]['date'] < datetime.now().date().isoformat():
-                self._calculate_daily_stats()
-                
-                # Re-fetch after calculation
-                cursor = conn.execute("""
-                    SELECT * FROM daily_stats 
-                    WHERE date >= ? 
-                    ORDER BY date DESC
-                """, (start_date,))
-                
-                return [dict(row) for row in cursor.fetchall()]
+            cursor = conn.execute(f"""
+                SELECT 
+                    {period_start} as period_start,
+                    {period_end} as period_end,
+                    COUNT(*) as days_with_data,
+                    AVG(avg_latency_ms) as avg_latency_ms,
+                    AVG(avg_download_mbps) as avg_download_mbps,
+                    AVG(avg_upload_mbps) as avg_upload_mbps,
+                    AVG(avg_quality_score) as avg_quality_score,
+                    SUM(outage_count) as total_outages,
+                    SUM(total_outage_minutes) as total_outage_minutes
+                FROM daily_stats 
+                WHERE date >= ?
+                GROUP BY period_start
+                ORDER BY period_start DESC
+            """, (start_date,))
             
-            return existing_stats
+            return [dict(row) for row in cursor.fetchall()]
     
     def _calculate_daily_stats(self):
         """Calculate and store daily statistics"""
@@ -256,7 +308,24 @@ class StarlinkDatabase:
             # Get the last 7 days of data to process
             start_date = datetime.now() - timedelta(days=7)
             
-            cursor = conn.execute("""
+            # Aggregate and store in one statement - rows never round-trip through Python.
+            # Outages are rolled up per day too, so reports read everything from daily_stats
+            conn.execute("""
+                WITH daily_outages AS (
+                    SELECT 
+                        date(start_time) as date,
+                        COUNT(*) as outage_count,
+                        CAST(ROUND(COALESCE(SUM(duration_seconds), 0) / 60.0) AS INTEGER) as outage_minutes
+                    FROM outages 
+                    WHERE start_time >= :start
+                    GROUP BY date(start_time)
+                )
+                INSERT OR REPLACE INTO daily_stats 
+                (date, avg_latency_ms, max_latency_ms, min_latency_ms,
+                 avg_download_mbps, max_download_mbps, min_download_mbps,
+                 avg_upload_mbps, max_upload_mbps, min_upload_mbps,
+                 avg_quality_score, avg_obstruction_pct, data_points,
+                 outage_count, total_outage_minutes)
                 SELECT 
                     date(timestamp) as date,
                     AVG(latency_ms) as avg_latency,
@@ -270,24 +339,13 @@ class StarlinkDatabase:
                     MIN(upload_mbps) as min_upload,
                     AVG(quality_score) as avg_quality,
                     AVG(obstruction_pct) as avg_obstruction,
-                    COUNT(*) as data_points
+                    COUNT(*) as data_points,
+                    COALESCE((SELECT outage_count FROM daily_outages o WHERE o.date = date(timestamp)), 0),
+                    COALESCE((SELECT outage_minutes FROM daily_outages o WHERE o.date = date(timestamp)), 0)
                 FROM metrics 
-                WHERE timestamp >= ?
+                WHERE timestamp >= :start
                 GROUP BY date(timestamp)
-            """, (start_date,))
-            
-            daily_data = cursor.fetchall()
-            
-            for row in daily_data:
-                # Insert or replace daily stats
-                conn.execute("""
-                    INSERT OR REPLACE INTO daily_stats 
-                    (date, avg_latency_ms, max_latency_ms, min_latency_ms,
-                     avg_download_mbps, max_download_mbps, min_download_mbps,
-                     avg_upload_mbps, max_upload_mbps, min_upload_mbps,
-                     avg_quality_score, avg_obstruction_pct, data_points)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, row)
+            """, {'start': start_date})
     
     def get_performance_comparison(self, metric: str = 'download_mbps') -> Dict:
         """Compare performance by time of day, day of week, etc."""
@@ -368,37 +426,54 @@ class StarlinkDatabase:
     
     def get_summary_stats(self, days: int = 30) -> Dict:
         """Get summary statistics for the dashboard"""
-        start_time = datetime.now() - timedelta(days=days)
+        return self.get_summary_stats_multi([days])[days]
+    
+    def get_summary_stats_multi(self, windows: List[int]) -> Dict[int, Dict]:
+        """Summary statistics for several day windows, each table scanned once for all of them"""
+        now = datetime.now()
+        params = {f'since_{i}': now - timedelta(days=days) for i, days in enumerate(windows)}
+        params['since'] = min(params.values())
+        
+        def in_window(i, expression, column='timestamp'):
+            return f"CASE WHEN {column} >= :since_{i} THEN {expression} END"
+        
+        metric_columns = ',\n'.join(
+            f"""COUNT({in_window(i, '1')}) as total_measurements_{i},
+                    AVG({in_window(i, 'latency_ms')}) as avg_latency_{i},
+                    AVG({in_window(i, 'download_mbps')}) as avg_download_{i},
+                    AVG({in_window(i, 'upload_mbps')}) as avg_upload_{i},
+                    AVG({in_window(i, 'quality_score')}) as avg_quality_{i},
+                    MIN({in_window(i, 'timestamp')}) as oldest_data_{i},
+                    MAX({in_window(i, 'timestamp')}) as newest_data_{i}"""
+            for i in range(len(windows)))
+        outage_columns = ',\n'.join(
+            f"""COUNT({in_window(i, '1', 'start_time')}) as outage_count_{i},
+                    COALESCE(SUM({in_window(i, 'duration_seconds', 'start_time')}), 0) as total_outage_seconds_{i}"""
+            for i in range(len(windows)))
         
         with self.get_connection() as conn:
-            cursor = conn.execute("""
+            metrics = conn.execute(f"""
                 SELECT 
-                    COUNT(*) as total_measurements,
-                    AVG(latency_ms) as avg_latency,
-                    AVG(download_mbps) as avg_download,
-                    AVG(upload_mbps) as avg_upload,
-                    AVG(quality_score) as avg_quality,
-                    MIN(timestamp) as oldest_data,
-                    MAX(timestamp) as newest_data
+                    {metric_columns}
                 FROM metrics 
-                WHERE timestamp >= ?
-            """, (start_time,))
-            
-            stats = dict(cursor.fetchone())
+                WHERE timestamp >= :since
+            """, params).fetchone()
             
             # Get outage statistics
-            cursor = conn.execute("""
+            outages = conn.execute(f"""
                 SELECT 
-                    COUNT(*) as outage_count,
-                    COALESCE(SUM(duration_seconds), 0) as total_outage_seconds
+                    {outage_columns}
                 FROM outages 
-                WHERE start_time >= ?
-            """, (start_time,))
-            
-            outage_stats = dict(cursor.fetchone())
-            stats.update(outage_stats)
-            
-            return stats
+                WHERE start_time >= :since
+            """, params).fetchone()
+            
+            # Split the suffixed columns back into one dict per window
+            results = {days: {} for days in windows}
+            for row in (metrics, outages):
+                for name in row.keys():
+                    key, i = name.rsplit('_', 1)
+                    results[windows[int(i)]][key] = row[name]
+            return results
     
     def cleanup_old_data(self, days_to_keep: int = 90):
         """Clean up old detailed data (keep daily stats)"""
@@ -416,8 +491,9 @@ class StarlinkDatabase:
                 'deleted_outages': deleted_outages
             }
     
-    def get_trend_data(self, metric: str, period: str = 'hour', days: int = 7) -> List[Dict]:
-        """Get trend data for charts"""
+    def get_trend_data(self, metric: str, period: str = 'hour', days: int = 7,
+                       columnar: bool = False) -> Union[List[Dict], Dict[str, List]]:
+        """Get trend data for charts, as a list of rows or (columnar=True) one list per column"""
         start_time = datetime.now() - timedelta(days=days)
         
         if period == 'hour':
@@ -441,10 +517,16 @@ class StarlinkDatabase:
                 ORDER BY period
             """, (start_time,))
             
-            return [dict(row) for row in cursor.fetchall()]
+            rows = cursor.fetchall()
+            if columnar:
+                # Key names once per column instead of once per row
+                names = [column[0] for column in cursor.description]
+                columns = list(zip(*rows)) or [()] * len(names)
+                return {name: list(values) for name, values in zip(names, columns)}
+            return [dict(row) for row in rows]
     
     def get_advanced_analytics(self, days: int = 30) -> Dict:
-        """Get advanced performance analytics"""
+        """Get advanced performance analytics, averages rounded to the precision the page shows"""
         start_time = datetime.now() - timedelta(days=days)
         
         with self.get_connection() as conn:
@@ -455,10 +537,10 @@ class StarlinkDatabase:
                         WHEN strftime('%H', timestamp) BETWEEN '06' AND '18' THEN 'day'
                         ELSE 'night'
                     END as time_period,
-                    AVG(latency_ms) as avg_latency,
-                    AVG(download_mbps) as avg_download,
-                    AVG(upload_mbps) as avg_upload,
-                    AVG(quality_score) as avg_quality,
+                    COALESCE(ROUND(AVG(latency_ms)), 0) as avg_latency,
+                    COALESCE(ROUND(AVG(download_mbps), 1), 0) as avg_download,
+                    COALESCE(ROUND(AVG(upload_mbps), 1), 0) as avg_upload,
+                    COALESCE(ROUND(AVG(quality_score)), 0) as avg_quality,
                     COUNT(*) as data_points
                 FROM metrics 
                 WHERE timestamp >= ?
@@ -471,15 +553,15 @@ class StarlinkDatabase:
             cursor = conn.execute("""
                 SELECT 
                     strftime('%H', timestamp) as hour,
-                    AVG(latency_ms) as avg_latency,
-                    AVG(download_mbps) as avg_download,
-                    AVG(upload_mbps) as avg_upload,
-                    AVG(quality_score) as avg_quality,
+                    COALESCE(ROUND(AVG(latency_ms)), 0) as avg_latency,
+                    COALESCE(ROUND(AVG(download_mbps), 1), 0) as avg_download,
+                    COALESCE(ROUND(AVG(upload_mbps), 1), 0) as avg_upload,
+                    COALESCE(ROUND(AVG(quality_score)), 0) as avg_quality,
                     COUNT(*) as data_points
                 FROM metrics 
                 WHERE timestamp >= ?
                 GROUP BY strftime('%H', timestamp)
-                ORDER BY avg_download DESC
+                ORDER BY AVG(download_mbps) DESC
                 LIMIT 3
             """, (start_time,))
             
@@ -508,10 +590,10 @@ class StarlinkDatabase:
             # Speed consistency analysis
             cursor = conn.execute("""
                 SELECT 
-                    AVG(download_mbps) as avg_download,
-                    MIN(download_mbps) as min_download,
-                    MAX(download_mbps) as max_download,
-                    (MAX(download_mbps) - MIN(download_mbps)) as download_range,
+                    COALESCE(ROUND(AVG(download_mbps), 1), 0) as avg_download,
+                    COALESCE(ROUND(MIN(download_mbps), 1), 0) as min_download,
+                    COALESCE(ROUND(MAX(download_mbps), 1), 0) as max_download,
+                    COALESCE(ROUND(MAX(download_mbps) - MIN(download_mbps), 1), 0) as download_range,
                     CASE 
                         WHEN (MAX(download_mbps) - MIN(download_mbps)) < 10 THEN 'very_consistent'
                         WHEN (MAX(download_mbps) - MIN(download_mbps)) < 25 THEN 'consistent'
@@ -624,7 +706,13 @@ class StarlinkDatabase:
         start_time = datetime.now() - timedelta(days=days)
         
         with self.get_connection() as conn:
-            query = "SELECT * FROM speed_tests WHERE timestamp >= ?"
+            # The rate and status columns are NOT NULL; default the nullable ones here so rows need no fallbacks
+            query = """
+                SELECT id, timestamp, test_type, server_location, ping_ms, download_mbps, upload_mbps,
+                       COALESCE(jitter_ms, 0) AS jitter_ms, COALESCE(packet_loss_pct, 0) AS packet_loss_pct,
+                       COALESCE(test_duration_seconds, 0) AS test_duration_seconds,
+                       status, error_message, test_data, created_at
+                FROM speed_tests WHERE timestamp >= ?"""
             params = [start_time]
             
             if test_type:
@@ -647,8 +735,22 @@ class StarlinkDatabase:
             
             return results
     
+    def get_speed_tests_version(self, days: int = 30, test_type: str = None) -> tuple:
+        """(row count, newest id) of the tests get_speed_tests would read - changes whenever its result can"""
+        start_time = datetime.now() - timedelta(days=days)
+        
+        with self.get_connection() as conn:
+            query = "SELECT COUNT(*), MAX(id) FROM speed_tests WHERE timestamp >= ?"
+            params = [start_time]
+            
+            if test_type:
+                query += " AND test_type = ?"
+                params.append(test_type)
+            
+            return tuple(conn.execute(query, params).fetchone())
+    
     def get_speed_test_summary(self, days: int = 30) -> Dict:
-        """Get speed test summary statistics"""
+        """Get speed test summary statistics, rates rounded to 0.1 Mbps and ping to 1 ms"""
         start_time = datetime.now() - timedelta(days=days)
         
         with self.get_connection() as conn:
@@ -657,13 +759,13 @@ class StarlinkDatabase:
                     COUNT(*) as total_tests,
                     COUNT(CASE WHEN status = 'completed' THEN 1 END) as completed_tests,
                     COUNT(CASE WHEN status = 'failed' THEN 1 END) as failed_tests,
-                    AVG(CASE WHEN status = 'completed' THEN download_mbps END) as avg_download,
-                    MAX(CASE WHEN status = 'completed' THEN download_mbps END) as max_download,
-                    MIN(CASE WHEN status = 'completed' THEN download_mbps END) as min_download,
-                    AVG(CASE WHEN status = 'completed' THEN upload_mbps END) as avg_upload,
-                    MAX(CASE WHEN status = 'completed' THEN upload_mbps END) as max_upload,
-                    MIN(CASE WHEN status = 'completed' THEN upload_mbps END) as min_upload,
-                    AVG(CASE WHEN status = 'completed' THEN ping_ms END) as avg_ping,
+                    COALESCE(ROUND(AVG(CASE WHEN status = 'completed' THEN download_mbps END), 1), 0) as avg_download,
+                    COALESCE(ROUND(MAX(CASE WHEN status = 'completed' THEN download_mbps END), 1), 0) as max_download,
+                    COALESCE(ROUND(MIN(CASE WHEN status = 'completed' THEN download_mbps END), 1), 0) as min_download,
+                    COALESCE(ROUND(AVG(CASE WHEN status = 'completed' THEN upload_mbps END), 1), 0) as avg_upload,
+                    COALESCE(ROUND(MAX(CASE WHEN status = 'completed' THEN upload_mbps END), 1), 0) as max_upload,
+                    COALESCE(ROUND(MIN(CASE WHEN status = 'completed' THEN upload_mbps END), 1), 0) as min_upload,
+                    COALESCE(ROUND(AVG(CASE WHEN status = 'completed' THEN ping_ms END)), 0) as avg_ping,
                     MIN(timestamp) as oldest_test,
                     MAX(timestamp) as newest_test
                 FROM speed_tests 
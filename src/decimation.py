@@ -0,0 +1,35 @@
+import numpy as np
+
+
+def lttb_indices(values, target):
+    """Indices of the points Largest-Triangle-Three-Buckets keeps when reducing values to target points"""
+    # Points are taken as evenly spaced; missing values count as 0, as the charts draw them
+    n = len(values)
+    if target >= n or target < 3:
+        return np.arange(n)
+
+    y = np.fromiter((value or 0 for value in values), dtype=np.float64, count=n)
+    x = np.arange(n, dtype=np.float64)
+
+    # target - 2 buckets between the fixed end points, each holding at least one point
+    edges = np.linspace(1, n - 1, target - 1).astype(np.intp)
+    keep = np.empty(target, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+
+    previous = 0
+    for bucket in range(target - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        # Third vertex: the average of the next bucket (the last point for the final bucket)
+        if bucket + 2 < len(edges):
+            next_start, next_end = end, edges[bucket + 2]
+            next_x, next_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        else:
+            next_x, next_y = x[-1], y[-1]
+
+        # Keep the point forming the largest triangle with the previous kept point and that average
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        keep[bucket + 1] = previous
+
+    return keep
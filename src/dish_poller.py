@@ -0,0 +1,78 @@
+import threading
+import time
+import logging
+from typing import Callable, Optional
+
+
+class DishPoller:
+    def __init__(self, fetch: Callable, interval: int = 5):
+        """
+        Keep the latest dish reading fresh in a background thread
+
+        Args:
+            fetch: Callable returning a (status, speed_data) tuple
+            interval: How often to refresh the reading (seconds)
+        """
+        self.fetch = fetch
+        self.interval = interval
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+
+        # (status, speed_data, error) - replaced as a whole so readers never need a lock
+        self.latest = None
+
+        self.logger = logging.getLogger(__name__)
+
+    def refresh(self):
+        """Fetch a new reading and publish it"""
+        try:
+            status, speed_data = self.fetch()
+            self.latest = (status, speed_data, None)
+        except Exception as e:
+            self.logger.warning(f"Error polling dish: {e}")
+            self.latest = (None, None, e)
+
+    def get(self):
+        """Return the latest (status, speed_data), raising the last poll error if it failed"""
+        latest = self.latest
+        if latest is None:
+            # Nothing polled yet - fetch synchronously rather than render an empty page
+            self.refresh()
+            latest = self.latest
+
+        status, speed_data, error = latest
+        if error is not None:
+            raise error
+        return status, speed_data
+
+    def _poll_loop(self):
+        """Refresh the reading on a fixed schedule until stopped"""
+        next_tick = time.monotonic()
+        while self.running:
+            self.refresh()
+
+            # Fixed-rate ticks: a slow fetch shortens the wait instead of drifting the schedule,
+            # and a fetch that overruns a whole tick skips it rather than bursting to catch up
+            next_tick = max(next_tick + self.interval, time.monotonic())
+            while self.running and time.monotonic() < next_tick:
+                time.sleep(max(0, min(1, next_tick - time.monotonic())))
+
+    def start(self):
+        """Start polling in the background"""
+        if self.running:
+            return
+
+        self.running = True
+        self.thread = threading.Thread(target=self._poll_loop, daemon=True)
+        self.thread.start()
+        self.logger.info(f"Dish poller started (interval: {self.interval}s)")
+
+    def stop(self):
+        """Stop polling"""
+        if not self.running:
+            return
+
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=10)
+        self.logger.info("Dish poller stopped")
@@ -0,0 +1,23 @@
+# Gunicorn settings for the dashboard (gunicorn -c gunicorn.conf.py wsgi:app)
+import os
+
+bind = f"{os.environ.get('FLASK_HOST', '0.0.0.0')}:{os.environ.get('FLASK_PORT', '5000')}"
+
+# Keep a single worker: the data collector, dish poller, stats broadcaster and chart
+# history all live in the app process, so every extra worker would sample the dish
+# again and serve its own, different chart history
+workers = 1
+
+# Threads serve concurrent viewers; each open /api/stream or /api/speedtest/events
+# connection holds one. SQLite and gRPC calls release the GIL, so a request waiting on
+# the database or dish doesn't hold up the others. Raise GUNICORN_THREADS for more viewers.
+threads = int(os.environ.get('GUNICORN_THREADS', '16'))
+worker_class = 'gthread'
+
+
+def on_starting(server):
+    """Hold a command-line workers override (-w) to one worker, for the reason above"""
+    if server.num_workers != 1:
+        server.log.warning(f"Ignoring workers={server.num_workers}: the dashboard runs a single worker "
+                           "(raise 'threads' for more concurrent viewers)")
+        server.num_workers = 1
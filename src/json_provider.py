@@ -0,0 +1,51 @@
+import numpy as np
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib encoder
+    orjson = None
+
+
+class NumpyJSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider, also accepting NumPy arrays and scalars"""
+
+    @staticmethod
+    def default(o):
+        if isinstance(o, (np.ndarray, np.generic)):
+            if o.dtype == np.float32:
+                # Go through the shortest float32 repr so 42.3 isn't widened to 42.29999923706055
+                return o.astype(str).astype(np.float64).tolist()
+            return o.tolist()
+        return DefaultJSONProvider.default(o)
+
+
+class OrjsonProvider(NumpyJSONProvider):
+    """JSON provider backed by orjson, keeping Flask's sorted keys and HTTP-date datetimes"""
+
+    # Datetimes go through default() so they keep Flask's format rather than orjson's ISO 8601
+    options = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+               | orjson.OPT_PASSTHROUGH_DATETIME) if orjson else 0
+
+    def dumps(self, obj, **kwargs):
+        # sort_keys=True (as Jinja's tojson passes) is what OPT_SORT_KEYS already does
+        if kwargs.get('sort_keys') is True:
+            del kwargs['sort_keys']
+        if kwargs:
+            # Callers asking for other json.dumps options get the stdlib encoder
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=self.options).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=self.options), mimetype=self.mimetype)
+
+
+# Provider the app should install as app.json
+JSONProvider = OrjsonProvider if orjson is not None else NumpyJSONProvider
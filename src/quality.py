@@ -0,0 +1,98 @@
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - fall back to plain NumPy reductions
+    njit = None
+
+# Penalty tables: sorted thresholds and the penalty for each band between them.
+# bisect_left (searchsorted side='left') counts thresholds strictly below the value ("worse above" metrics),
+# bisect_right (side='right') counts thresholds at or below it ("worse below" metrics).
+LATENCY_THRESHOLDS = (50, 75, 100)
+LATENCY_PENALTIES = (0, 10, 20, 30)
+
+DOWNLOAD_THRESHOLDS = (10, 25, 50)
+DOWNLOAD_PENALTIES = (25, 15, 5, 0)
+
+UPLOAD_THRESHOLDS = (3, 8, 15)
+UPLOAD_PENALTIES = (25, 15, 5, 0)
+
+OBSTRUCTION_THRESHOLDS = (0.1, 1, 5, 10)
+OBSTRUCTION_PENALTIES = (0, 5, 10, 15, 20)
+
+SNR_PENALTY = 10
+
+
+def calculate_quality_score(latency: float, download_mbps: float, upload_mbps: float,
+                            obstruction_pct: float, snr_good: bool) -> int:
+    """Calculate connection quality score (0-100)"""
+    score = (100
+             - LATENCY_PENALTIES[bisect_left(LATENCY_THRESHOLDS, latency)]
+             - DOWNLOAD_PENALTIES[bisect_right(DOWNLOAD_THRESHOLDS, download_mbps)]
+             - UPLOAD_PENALTIES[bisect_right(UPLOAD_THRESHOLDS, upload_mbps)]
+             - OBSTRUCTION_PENALTIES[bisect_left(OBSTRUCTION_THRESHOLDS, obstruction_pct)])
+
+    if not snr_good:
+        score -= SNR_PENALTY
+
+    return max(0, min(100, score))
+
+
+# Array copies of the tables for the batch scorers. Thresholds are float32 like the stored samples,
+# so a sample of exactly 0.1 lands on the 0.1 threshold rather than just above it.
+_LATENCY_TABLE = (np.array(LATENCY_THRESHOLDS, dtype=np.float32), np.array(LATENCY_PENALTIES))
+_DOWNLOAD_TABLE = (np.array(DOWNLOAD_THRESHOLDS, dtype=np.float32), np.array(DOWNLOAD_PENALTIES))
+_UPLOAD_TABLE = (np.array(UPLOAD_THRESHOLDS, dtype=np.float32), np.array(UPLOAD_PENALTIES))
+_OBSTRUCTION_TABLE = (np.array(OBSTRUCTION_THRESHOLDS, dtype=np.float32), np.array(OBSTRUCTION_PENALTIES))
+
+
+def _quality_scores_loop(latency, download_mbps, upload_mbps, obstruction_pct, snr_good):
+    """Score each sample in a single loop, looking up all five penalties per sample"""
+    latency_limits, latency_penalties = _LATENCY_TABLE
+    download_limits, download_penalties = _DOWNLOAD_TABLE
+    upload_limits, upload_penalties = _UPLOAD_TABLE
+    obstruction_limits, obstruction_penalties = _OBSTRUCTION_TABLE
+
+    scores = np.empty(latency.shape[0], dtype=np.int64)
+    for i in range(latency.shape[0]):
+        score = (100
+                 - latency_penalties[np.searchsorted(latency_limits, latency[i], side='left')]
+                 - download_penalties[np.searchsorted(download_limits, download_mbps[i], side='right')]
+                 - upload_penalties[np.searchsorted(upload_limits, upload_mbps[i], side='right')]
+                 - obstruction_penalties[np.searchsorted(obstruction_limits, obstruction_pct[i], side='left')])
+        if not snr_good[i]:
+            score -= SNR_PENALTY
+        scores[i] = min(100, max(0, score))
+    return scores
+
+
+def _quality_scores_numpy(latency, download_mbps, upload_mbps, obstruction_pct, snr_good):
+    """NumPy equivalent of _quality_scores_loop for when Numba is not installed"""
+    latency_limits, latency_penalties = _LATENCY_TABLE
+    download_limits, download_penalties = _DOWNLOAD_TABLE
+    upload_limits, upload_penalties = _UPLOAD_TABLE
+    obstruction_limits, obstruction_penalties = _OBSTRUCTION_TABLE
+
+    score = (100
+             - latency_penalties[np.searchsorted(latency_limits, latency, side='left')]
+             - download_penalties[np.searchsorted(download_limits, download_mbps, side='right')]
+             - upload_penalties[np.searchsorted(upload_limits, upload_mbps, side='right')]
+             - obstruction_penalties[np.searchsorted(obstruction_limits, obstruction_pct, side='left')]
+             - np.where(snr_good, 0, SNR_PENALTY))
+
+    return np.clip(score, 0, 100)
+
+
+# calculate_quality_score over equal-length arrays of samples, in one pass
+if njit is not None:
+    quality_scores = njit(cache=True)(_quality_scores_loop)
+else:
+    quality_scores = _quality_scores_numpy
+
+
+def warm_up():
+    """Trigger JIT compilation (or load it from cache) before the first request needs it"""
+    sample = np.zeros(1, dtype=np.float32)
+    quality_scores(sample, sample, sample, sample, sample != 0)
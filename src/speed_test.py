@@ -1,27 +1,63 @@
 import time
 import threading
+import queue
 import subprocess
 import requests
 import json
 import socket
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 import logging
 import os
 import tempfile
 from croniter import croniter
 
 class SpeedTestEngine:
-    def __init__(self, db):
+    def __init__(self, db, on_result: Optional[Callable[[Dict], None]] = None):
         self.db = db
+        self.on_result = on_result  # Called with each result once it is stored
         self.logger = logging.getLogger(__name__)
         self.running_tests = {}
         self.scheduler_thread = None
         self.scheduler_running = False
         
-    def run_server_speed_test(self, test_type: str = 'manual') -> Dict:
+        # Tests run one at a time on a single long-lived worker, so they never skew each other's
+        # bandwidth. The slot is held from when a test is requested until it finishes.
+        self.test_slot = threading.Lock()
+        self.test_queue = queue.Queue(maxsize=1)
+        self.test_worker = threading.Thread(target=self._test_worker_loop, daemon=True)
+        self.test_worker.start()
+    
+    def request_test(self, test_type: str = 'manual', schedule: Optional[Dict] = None) -> Optional[str]:
+        """Hand a speed test to the worker; returns its test ID, or None if one is already queued or running"""
+        if not self.test_slot.acquire(blocking=False):
+            return None
+        test_id = self._new_test_id()
+        self.test_queue.put((test_type, schedule, test_id))
+        return test_id
+    
+    @staticmethod
+    def _new_test_id() -> str:
+        """ID a test's result is published under"""
+        return f"test_{time.time_ns()}"
+    
+    def _test_worker_loop(self):
+        """Run requested tests one after another"""
+        while True:
+            test_type, schedule, test_id = self.test_queue.get()
+            try:
+                if schedule is not None:
+                    self._run_scheduled_test(schedule, test_id=test_id)
+                else:
+                    self.run_server_speed_test(test_type=test_type, test_id=test_id)
+            except Exception as e:
+                self.logger.error(f"Speed test error: {e}")
+            finally:
+                self.test_slot.release()
+        
+    def run_server_speed_test(self, test_type: str = 'manual', test_id: Optional[str] = None) -> Dict:
         """Run a comprehensive speed test using multiple methods"""
-        test_id = f"test_{int(time.time())}"
+        test_id = test_id or self._new_test_id()
         self.running_tests[test_id] = {
             'status': 'running',
             'start_time': datetime.now(),
@@ -267,6 +303,9 @@ class SpeedTestEngine:
             )
         except Exception as e:
             self.logger.error(f"Failed to store speed test result: {e}")
+        
+        if self.on_result:
+            self.on_result(result)
     
     def get_test_status(self, test_id: str) -> Optional[Dict]:
         """Get status of a running test"""
@@ -318,13 +357,9 @@ class SpeedTestEngine:
                         # Run the scheduled test
                         self.logger.info(f"Running scheduled speed test: {schedule['name']}")
                         
-                        # Run test in background thread
-                        test_thread = threading.Thread(
-                            target=self._run_scheduled_test,
-                            args=(schedule,),
-                            daemon=True
-                        )
-                        test_thread.start()
+                        # Run test on the test worker, unless another test is already in progress
+                        if not self.request_test(test_type='scheduled', schedule=schedule):
+                            self.logger.info(f"Skipping scheduled test '{schedule['name']}': another test is running")
                         
                         # Calculate next run time
                         cron = croniter(schedule['cron_expression'], current_time)
@@ -341,10 +376,10 @@ class SpeedTestEngine:
             # Sleep for 60 seconds before checking again
             time.sleep(60)
     
-    def _run_scheduled_test(self, schedule: Dict):
+    def _run_scheduled_test(self, schedule: Dict, test_id: Optional[str] = None):
         """Run a scheduled speed test"""
         try:
-            result = self.run_server_speed_test(test_type='scheduled')
+            result = self.run_server_speed_test(test_type='scheduled', test_id=test_id)
             self.logger.info(f"Scheduled test '{schedule['name']}' completed: {result.get('download_mbps', 0):.1f} Mbps down")
         except Exception as e:
             self.logger.error(f"Scheduled test '{schedule['name']}' failed: {e}")
\ No newline at end of file
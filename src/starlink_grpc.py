@@ -406,6 +406,7 @@ unsupported hardware, the values will all report as 0.0.
 from itertools import chain
 import math
 import statistics
+import threading
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple, get_type_hints
 from typing_extensions import TypedDict, get_args
 
@@ -634,24 +635,55 @@ class UnwrappedHistory:
 class ChannelContext:
     """A wrapper for reusing an open grpc Channel across calls.
 
-    `close()` should be called on the object when it is no longer
-    in use.
+    The context may be shared between threads. `close()` should be called
+    on the object when it is no longer in use.
     """
     def __init__(self, target: Optional[str] = None) -> None:
         self.channel = None
         self.target = "192.168.100.1:9200" if target is None else target
+        self._lock = threading.Lock()
+        self._calls = {}  # In-flight calls per channel
 
     def get_channel(self) -> Tuple[grpc.Channel, bool]:
-        reused = True
-        if self.channel is None:
-            self.channel = grpc.insecure_channel(self.target)
-            reused = False
-        return self.channel, reused
+        with self._lock:
+            reused = True
+            if self.channel is None:
+                self.channel = grpc.insecure_channel(self.target)
+                reused = False
+            return self.channel, reused
+
+    def acquire(self) -> Tuple[grpc.Channel, bool]:
+        """Get the channel for one call, to be handed back with `release()`."""
+        with self._lock:
+            reused = True
+            if self.channel is None:
+                self.channel = grpc.insecure_channel(self.target)
+                reused = False
+            self._calls[self.channel] = self._calls.get(self.channel, 0) + 1
+            return self.channel, reused
+
+    def release(self, channel: grpc.Channel, failed: bool = False) -> None:
+        """Hand back a channel after a call.
+
+        A channel a call failed on is replaced for later calls, and closed
+        once the calls still in flight on it have finished.
+        """
+        with self._lock:
+            if failed and self.channel is channel:
+                self.channel = None
+            self._calls[channel] -= 1
+            if self._calls[channel] or self.channel is channel:
+                return
+            del self._calls[channel]
+        channel.close()
 
     def close(self) -> None:
-        if self.channel is not None:
-            self.channel.close()
-        self.channel = None
+        with self._lock:
+            channel, self.channel = self.channel, None
+            if channel in self._calls:
+                return  # Closed by the last call in flight on it
+        if channel is not None:
+            channel.close()
 
 
 def call_with_channel(function, *args, context: Optional[ChannelContext] = None, **kwargs):
@@ -669,13 +701,16 @@ def call_with_channel(function, *args, context: Optional[ChannelContext] = None,
             return function(channel, *args, **kwargs)
 
     while True:
-        channel, reused = context.get_channel()
+        channel, reused = context.acquire()
+        failed = False
         try:
             return function(channel, *args, **kwargs)
         except grpc.RpcError:
-            context.close()
+            failed = True
             if not reused:
                 raise
+        finally:
+            context.release(channel, failed)
 
 
 def status_field_names(context: Optional[ChannelContext] = None):
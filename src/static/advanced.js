@@ -0,0 +1,134 @@
+// Load advanced monitoring data
+async function loadAdvancedData() {
+    try {
+        // Load outage analysis
+        const outageResponse = await fetch('/api/advanced/outage-analysis?days=30');
+        const outageData = await outageResponse.json();
+        displayOutageAnalysis(outageData);
+
+        // Load weather impact
+        const weatherResponse = await fetch('/api/advanced/weather-impact?days=7');
+        const weatherData = await weatherResponse.json();
+        displayWeatherImpact(weatherData);
+
+        // Load peak analysis
+        const peakResponse = await fetch('/api/advanced/peak-analysis?days=7');
+        const peakData = await peakResponse.json();
+        displayPeakAnalysis(peakData);
+
+        // Load weather forecast
+        const forecastResponse = await fetch('/api/advanced/weather-forecast');
+        const forecastData = await forecastResponse.json();
+        displayWeatherForecast(forecastData);
+
+    } catch (error) {
+        console.error('Error loading advanced data:', error);
+    }
+}
+
+function displayOutageAnalysis(data) {
+    const container = document.getElementById('outageAnalysis');
+    if (data.error) {
+        container.innerHTML = `<div class="error">Error: ${data.error}</div>`;
+        return;
+    }
+
+    const stats = data.statistics || {};
+    container.innerHTML = `
+        <div><strong>Total Outages:</strong> ${stats.total_outages || 0}</div>
+        <div><strong>Total Duration:</strong> ${Math.round((stats.total_duration_seconds || 0) / 60)} minutes</div>
+        <div><strong>Average Duration:</strong> ${Math.round((stats.avg_duration_seconds || 0) / 60)} minutes</div>
+        <div><strong>Longest Outage:</strong> ${Math.round((stats.longest_duration_seconds || 0) / 60)} minutes</div>
+        ${stats.critical_outages ? `<div style="color: #e74c3c;"><strong>Critical Outages:</strong> ${stats.critical_outages}</div>` : ''}
+    `;
+}
+
+function displayWeatherImpact(data) {
+    const container = document.getElementById('weatherImpact');
+    if (data.error) {
+        container.innerHTML = `<div class="error">Weather service not configured</div>`;
+        return;
+    }
+
+    const insights = data.weather_insights || [];
+    if (insights.length === 0) {
+        container.innerHTML = '<div>No weather correlation data available yet</div>';
+        return;
+    }
+
+    const impactHTML = insights.map(insight => `
+        <div style="margin: 10px 0; padding: 10px; background: rgba(0,0,0,0.05); border-radius: 5px;">
+            <strong>${insight.condition}:</strong> 
+            <span style="color: ${insight.impact === 'negative' ? '#e74c3c' : '#27ae60'}">
+                ${insight.quality_score}% quality
+            </span>
+            <br><small>${insight.recommendation}</small>
+        </div>
+    `).join('');
+
+    container.innerHTML = impactHTML || '<div>Analyzing weather patterns...</div>';
+}
+
+function displayPeakAnalysis(data) {
+    const container = document.getElementById('peakAnalysis');
+    if (data.error) {
+        container.innerHTML = `<div class="error">Error: ${data.error}</div>`;
+        return;
+    }
+
+    const bestHours = data.best_hours || [];
+    const worstHours = data.worst_hours || [];
+
+    let html = '';
+    if (bestHours.length > 0) {
+        const best = bestHours[0];
+        html += `<div style="color: #27ae60;"><strong>Best Hour:</strong> ${best.hour}:00 (${Math.round(best.avg_quality || 0)}% quality)</div>`;
+    }
+    if (worstHours.length > 0) {
+        const worst = worstHours[0];
+        html += `<div style="color: #e74c3c;"><strong>Worst Hour:</strong> ${worst.hour}:00 (${Math.round(worst.avg_quality || 0)}% quality)</div>`;
+    }
+
+    const weekdayAvg = data.weekday_avg_quality || 0;
+    const weekendAvg = data.weekend_avg_quality || 0;
+    if (weekdayAvg > 0 || weekendAvg > 0) {
+        html += `<div style="margin-top: 15px;"><strong>Weekday vs Weekend:</strong></div>`;
+        html += `<div>Weekdays: ${Math.round(weekdayAvg)}% quality</div>`;
+        html += `<div>Weekends: ${Math.round(weekendAvg)}% quality</div>`;
+    }
+
+    container.innerHTML = html || '<div>Analyzing performance patterns...</div>';
+}
+
+function displayWeatherForecast(data) {
+    const container = document.getElementById('weatherForecast');
+    if (data.error) {
+        container.innerHTML = `<div class="error">Weather forecast not available</div>`;
+        return;
+    }
+
+    const forecast = data.forecast || [];
+    const warnings = data.warnings || [];
+
+    let html = `<div><strong>Impact Prediction:</strong> ${data.impact_prediction || 'Good conditions expected'}</div>`;
+
+    if (warnings.length > 0) {
+        html += '<div style="margin-top: 15px;"><strong>Warnings:</strong></div>';
+        warnings.forEach(warning => {
+            html += `<div style="color: #e67e22; margin: 5px 0;"><strong>${warning.time}:</strong> ${warning.warning}</div>`;
+        });
+    }
+
+    if (forecast.length > 0) {
+        const next = forecast[0];
+        html += `<div style="margin-top: 15px;"><strong>Current:</strong> ${next.weather_condition || 'Unknown'} ${Math.round(next.temperature_c || 0)}°C</div>`;
+    }
+
+    container.innerHTML = html || '<div>Weather forecast not available</div>';
+}
+
+// Load data on page load
+loadAdvancedData();
+
+// Refresh data every 30 seconds
+setInterval(loadAdvancedData, 30000);
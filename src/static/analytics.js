@@ -0,0 +1,773 @@
+// Chart configurations
+const chartConfig = {
+    responsive: true,
+    maintainAspectRatio: false,
+    scales: {
+        y: {
+            beginAtZero: true,
+            grid: { color: 'rgba(0,0,0,0.1)' },
+            ticks: { font: { size: 10 } }
+        },
+        x: {
+            grid: { color: 'rgba(0,0,0,0.1)' },
+            ticks: { 
+                font: { size: 10 },
+                maxTicksLimit: 12
+            }
+        }
+    },
+    plugins: {
+        legend: { 
+            display: true,
+            position: 'top',
+            labels: { font: { size: 11 } }
+        }
+    },
+    // Tooltips follow the nearest x position, so lines need no point markers to hover on
+    interaction: { mode: 'nearest', axis: 'x', intersect: false },
+    // Data arrives pre-shaped (see points()), so Chart.js draws once per update without re-parsing
+    animation: false,
+    parsing: false,
+    normalized: true
+};
+
+// Values as Chart.js's internal category-scale points ({x: label index, y}), for parsing: false
+function points(values) {
+    return values.map((y, x) => ({ x, y }));
+}
+
+const HTML_ESCAPES = { '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;' };
+
+// Text for an HTML string (null/undefined become empty, as Array.join renders them)
+function escapeHtml(value) {
+    return value == null ? '' : String(value).replace(/[&<>"']/g, c => HTML_ESCAPES[c]);
+}
+
+// Summary cards: text and value class for each data-k element, from the page state
+const summaryCards = {
+    avg_download: d => [(d.s7.avg_download || 0).toFixed(1) + ' Mbps', 'good'],
+    avg_upload: d => [(d.s7.avg_upload || 0).toFixed(1) + ' Mbps', 'good'],
+    avg_latency: d => [(d.s7.avg_latency || 0).toFixed(0) + ' ms', (d.s7.avg_latency || 0) < 50 ? 'good' : 'warning'],
+    avg_quality: d => [(d.s7.avg_quality || 0).toFixed(0) + '%', 'good'],
+    total_measurements: d => [(d.s30.total_measurements || 0).toLocaleString('en-US')],
+    outage_count: d => [String(d.s30.outage_count || 0), d.s30.outage_count ? 'bad' : 'good'],
+    outage_hours: d => [((d.s30.total_outage_seconds || 0) / 3600).toFixed(1) + 'h']
+};
+
+function renderSummary(dash) {
+    document.querySelectorAll('[data-k]').forEach(el => {
+        const [text, level] = summaryCards[el.dataset.k](dash);
+        el.textContent = text;
+        if (level) {
+            el.className = 'summary-value ' + level;
+        }
+    });
+}
+
+// Initialize charts
+let speedTrendChart, latencyTrendChart;
+
+function initializeCharts() {
+    const speedCtx = document.getElementById('speedTrendChart').getContext('2d');
+    const latencyCtx = document.getElementById('latencyTrendChart').getContext('2d');
+
+    speedTrendChart = new Chart(speedCtx, {
+        type: 'line',
+        data: { labels: [], datasets: [] },
+        options: chartConfig
+    });
+
+    latencyTrendChart = new Chart(latencyCtx, {
+        type: 'line',
+        data: { labels: [], datasets: [] },
+        options: chartConfig
+    });
+}
+
+// Redraw a chart on the next frame, without animation
+function redraw(chart) {
+    requestAnimationFrame(() => chart.update('none'));
+}
+
+// Run callback once, when the element first scrolls near the viewport
+function whenVisible(selector, callback) {
+    const el = document.querySelector(selector);
+    if (!el || !('IntersectionObserver' in window)) {
+        callback();
+        return;
+    }
+
+    const observer = new IntersectionObserver(entries => {
+        if (entries.some(entry => entry.isIntersecting)) {
+            observer.unobserve(el);
+            callback();
+        }
+    }, { rootMargin: '200px' });
+    observer.observe(el);
+}
+
+// Call fn once calls have stopped for ms milliseconds
+function debounce(fn, ms) {
+    let timer;
+    return (...args) => {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn(...args), ms);
+    };
+}
+
+const TREND_RELOAD_DELAY_MS = 150;
+
+// In-flight trend request per chart - a newer request aborts it so responses can't land out of order
+const trendRequests = new Map();
+
+// Load trend data
+async function loadTrendData(metric, period, days, chart) {
+    trendRequests.get(chart)?.abort();
+    const controller = new AbortController();
+    trendRequests.set(chart, controller);
+
+    try {
+        const response = await fetch(`/api/historical/trends?metric=${metric}&period=${period}&days=${days}&format=columns`,
+            { signal: controller.signal });
+        const data = await response.json();
+
+        renderTrendData(metric, data.data, chart);
+    } catch (error) {
+        if (error.name === 'AbortError') {
+            return;
+        }
+        console.error('Error loading trend data:', error);
+        // Show error in chart
+        chart.data.labels = ['Error'];
+        chart.data.datasets = [{
+            label: `Error loading ${metric}`,
+            data: points([0]),
+            borderColor: '#ef4444',
+            backgroundColor: 'rgba(239, 68, 68, 0.1)'
+        }];
+        redraw(chart);
+    } finally {
+        if (trendRequests.get(chart) === controller) {
+            trendRequests.delete(chart);
+        }
+    }
+}
+
+// Line colors and legend label per trend metric (anything else falls back to OTHER_METRIC_STYLE)
+const METRIC_STYLES = {
+    download_mbps: { border: 'rgb(34, 197, 94)', background: 'rgba(34, 197, 94, 0.1)', label: 'download Mbps' },
+    upload_mbps: { border: 'rgb(239, 68, 68)', background: 'rgba(239, 68, 68, 0.1)', label: 'upload Mbps' },
+    latency_ms: { border: 'rgb(99, 132, 255)', background: 'rgba(99, 132, 255, 0.1)', label: 'latency (ms)' }
+};
+const OTHER_METRIC_STYLE = { border: 'rgb(168, 85, 247)', background: 'rgba(168, 85, 247, 0.1)' };
+
+// Draw columnar trend data (period/avg_value lists) into a chart
+function renderTrendData(metric, columns, chart) {
+    const style = METRIC_STYLES[metric] || { ...OTHER_METRIC_STYLE, label: metric.replace('_', ' ') };
+
+    if (!columns || columns.period.length === 0) {
+        // Show "no data" message in chart
+        chart.data.labels = ['Collecting Data...'];
+        chart.data.datasets = [{
+            label: `${style.label} - Data Collection Started`,
+            data: points([0]),
+            borderColor: '#cbd5e1',
+            backgroundColor: 'rgba(203, 213, 225, 0.1)',
+            tension: 0.4,
+            fill: true
+        }];
+        redraw(chart);
+        return;
+    }
+
+    const labels = columns.period;
+    const values = columns.avg_value.map(v => v || 0);
+
+    chart.data.labels = labels;
+    chart.data.datasets = [{
+        label: style.label,
+        data: points(values),
+        borderColor: style.border,
+        backgroundColor: style.background,
+        tension: 0.4,
+        fill: true,
+        pointRadius: 0,
+        pointHoverRadius: 4,
+        borderWidth: 2
+    }];
+
+    redraw(chart);
+}
+
+// Load comparison data
+async function loadComparisonData() {
+    try {
+        const response = await fetch('/api/historical/comparison?metric=download_mbps');
+        renderComparisonData(await response.json());
+    } catch (error) {
+        console.error('Error loading comparison data:', error);
+    }
+}
+
+// Draw the hour-of-day and day-of-week charts
+function renderComparisonData(data) {
+    drawBars(document.getElementById('hourlyPerformanceChart'), {
+        labels: data.hourly.map(d => `${d.hour}:00`),
+        values: data.hourly.map(d => d.avg_value || 0),
+        color: 'rgba(34, 197, 94, 0.8)',
+        label: 'Avg Download Speed (Mbps)'
+    });
+
+    drawBars(document.getElementById('weeklyPerformanceChart'), {
+        labels: data.weekly.map(d => d.day_name),
+        values: data.weekly.map(d => d.avg_value || 0),
+        color: 'rgba(99, 132, 255, 0.8)',
+        label: 'Avg Download Speed (Mbps)'
+    });
+}
+
+// The hour/day bar charts are at most 24 bars, so they are drawn straight onto their
+// canvases rather than through Chart.js
+const BAR_CHART_ASPECT = 250 / 400;
+const BAR_FONT = '11px Arial';
+
+function drawBars(canvas, bars) {
+    canvas.bars = bars;  // Kept for redrawing on resize
+    requestAnimationFrame(() => paintBars(canvas));
+}
+
+function paintBars(canvas) {
+    const { labels, values, color, label } = canvas.bars;
+
+    // Fill the container width, at the screen's pixel density
+    canvas.style.width = '100%';
+    const width = canvas.clientWidth;
+    const height = Math.round(width * BAR_CHART_ASPECT);
+    const ratio = window.devicePixelRatio || 1;
+    canvas.style.height = `${height}px`;
+    canvas.width = width * ratio;
+    canvas.height = height * ratio;
+
+    const ctx = canvas.getContext('2d');
+    ctx.setTransform(ratio, 0, 0, ratio, 0, 0);
+    ctx.clearRect(0, 0, width, height);
+    ctx.font = BAR_FONT;
+    ctx.textAlign = 'center';
+    ctx.fillStyle = '#666';
+    ctx.fillText(label, width / 2, 12);
+
+    if (values.length === 0) {
+        ctx.fillText('No data available', width / 2, height / 2);
+        return;
+    }
+
+    // Room for the legend line on top and the labels underneath
+    const top = 32;
+    const plotHeight = height - top - 20;
+    const max = Math.max(...values) || 1;
+    const slot = width / values.length;
+    const barWidth = slot * 0.8;
+    // Label every nth bar so e.g. "23:00" labels don't overlap
+    const labelEvery = Math.ceil(ctx.measureText(labels[labels.length - 1]).width * 1.5 / slot);
+
+    values.forEach((value, i) => {
+        const x = i * slot + (slot - barWidth) / 2;
+        const barHeight = (value / max) * plotHeight;
+        ctx.fillStyle = color;
+        ctx.fillRect(x, top + plotHeight - barHeight, barWidth, barHeight);
+
+        ctx.fillStyle = '#666';
+        if (slot >= 30) {
+            ctx.fillText(value.toFixed(1), x + barWidth / 2, top + plotHeight - barHeight - 4);
+        }
+        if (i % labelEvery === 0) {
+            ctx.fillText(labels[i], x + barWidth / 2, height - 6);
+        }
+    });
+}
+
+window.addEventListener('resize', debounce(() => {
+    document.querySelectorAll('canvas').forEach(canvas => {
+        if (canvas.bars) {
+            paintBars(canvas);
+        }
+    });
+}, TREND_RELOAD_DELAY_MS));
+
+// Initialize everything
+document.addEventListener('DOMContentLoaded', function() {
+    // The cards are server-rendered; this re-renders them from the page state with the same formatting
+    renderSummary(window.__DASH__);
+
+    // Build the charts once the page has painted; data rendering waits on this
+    const idle = window.requestIdleCallback || (callback => setTimeout(callback, 1));
+    const chartsReady = new Promise(resolve => idle(() => {
+        initializeCharts();
+        resolve();
+    }, { timeout: 200 }));
+
+    // Event listeners for controls - both selects of a chart share one debounced reload, so
+    // cycling through options only fetches the last selection
+    const speedPeriod = document.getElementById('speedPeriod');
+    const speedDays = document.getElementById('speedDays');
+    const reloadSpeedTrend = debounce(async () => {
+        await chartsReady;
+        loadTrendData('download_mbps', speedPeriod.value, speedDays.value, speedTrendChart);
+    }, TREND_RELOAD_DELAY_MS);
+    speedPeriod.addEventListener('change', reloadSpeedTrend);
+    speedDays.addEventListener('change', reloadSpeedTrend);
+
+    const latencyPeriod = document.getElementById('latencyPeriod');
+    const latencyDays = document.getElementById('latencyDays');
+    const reloadLatencyTrend = debounce(async () => {
+        await chartsReady;
+        loadTrendData('latency_ms', latencyPeriod.value, latencyDays.value, latencyTrendChart);
+    }, TREND_RELOAD_DELAY_MS);
+    latencyPeriod.addEventListener('change', reloadLatencyTrend);
+    latencyDays.addEventListener('change', reloadLatencyTrend);
+
+    // Trend selection the bootstrap request carries (see the page head)
+    const BOOTSTRAP_TREND = { period: 'hour', days: '7' };
+
+    // Whether a chart still shows the initial selection, with no newer request of its own in flight,
+    // so the bootstrap trends can be drawn without overwriting what the user picked since
+    function showsBootstrapTrend(chart, periodSelect, daysSelect) {
+        return !trendRequests.has(chart)
+            && periodSelect.value === BOOTSTRAP_TREND.period && daysSelect.value === BOOTSTRAP_TREND.days;
+    }
+
+    // Reports functionality
+    document.getElementById('loadReports').addEventListener('click', async function() {
+        const reportType = document.getElementById('reportType').value;
+        const days = document.getElementById('reportDays').value;
+        const container = document.getElementById('reportsContainer');
+
+        try {
+            container.innerHTML = '<div class="loading">📊 Loading reports...</div>';
+
+            const response = await fetch(`/api/historical/reports?type=${reportType}&days=${days}&format=ndjson`);
+
+            if (!response.ok) {
+                const data = await response.json();
+                throw new Error(data.error || 'Failed to load reports');
+            }
+
+            await renderReportsTable(response, reportType, container);
+        } catch (error) {
+            container.innerHTML = `<div style="color: #ef4444; padding: 20px; text-align: center;">❌ Error loading reports: ${error.message}</div>`;
+        }
+    });
+
+    // Report types differ only in their leading columns and which outage count they carry
+    const reportLayouts = {
+        daily: {
+            headers: ['Date'],
+            leading: (item) => [item.date],
+            outages: (item) => item.outage_count
+        },
+        weekly: {
+            headers: ['Week Start', 'Week End', 'Days'],
+            leading: (item) => [item.week_start, item.week_end, item.days_with_data],
+            outages: (item) => item.total_outages
+        },
+        monthly: {
+            headers: ['Month', 'Days'],
+            leading: (item) => [item.month, item.days_with_data],
+            outages: (item) => item.total_outages
+        }
+    };
+
+    const REPORT_BATCH_ROWS = 20;
+
+    // Daily rows carry the raw averages, so they are rounded (and null-filled) for display here
+    const fixed = (value, digits) => value == null ? '0' : value.toFixed(digits);
+
+    function reportRow(item, layout) {
+        const grade = escapeHtml(item.performance_grade || 'F');
+        return '<tr><td>' + layout.leading(item).map(escapeHtml).join('</td><td>')
+            + '</td><td>' + fixed(item.avg_latency_ms, 0) + ' ms'
+            + '</td><td>' + fixed(item.avg_download_mbps, 1) + ' Mbps'
+            + '</td><td>' + fixed(item.avg_upload_mbps, 1) + ' Mbps'
+            + '</td><td>' + fixed(item.avg_quality_score, 0) + '%'
+            + '</td><td>' + (layout.outages(item) || 0) + ' (' + (item.total_outage_minutes || 0) + 'm)'
+            + '</td><td><span class="grade-badge grade-' + grade + '">' + grade + '</span></td></tr>';
+    }
+
+    // Read the NDJSON report stream, appending rows in batches of REPORT_BATCH_ROWS per frame
+    async function renderReportsTable(response, reportType, container) {
+        const layout = reportLayouts[reportType] || reportLayouts.monthly;
+        const headers = [...layout.headers, 'Avg Latency', 'Avg Download', 'Avg Upload', 'Quality', 'Outages', 'Grade'];
+
+        let tbody = null;
+        let pending = [];
+        const flush = async () => {
+            await new Promise(requestAnimationFrame);
+            if (!tbody) {
+                container.innerHTML = `
+                    <table class="report-table">
+                        <thead>
+                            <tr>${headers.map(h => `<th>${h}</th>`).join('')}</tr>
+                        </thead>
+                        <tbody></tbody>
+                    </table>
+                `;
+                tbody = container.querySelector('tbody');
+            }
+            tbody.insertAdjacentHTML('beforeend', pending.join(''));
+            pending = [];
+        };
+
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        for (;;) {
+            const { done, value } = await reader.read();
+            buffer += decoder.decode(value, { stream: !done });
+
+            // The last piece may be a partial line - keep it for the next chunk
+            const lines = buffer.split('\n');
+            buffer = done ? '' : lines.pop();
+            for (const line of lines) {
+                if (line) {
+                    pending.push(reportRow(JSON.parse(line), layout));
+                }
+                if (pending.length >= REPORT_BATCH_ROWS) {
+                    await flush();
+                }
+            }
+
+            if (done) {
+                break;
+            }
+        }
+
+        if (pending.length > 0) {
+            await flush();
+        }
+        if (!tbody) {
+            container.innerHTML = '<div style="text-align: center; padding: 40px; color: #666;">📊 No report data available for the selected period</div>';
+        }
+    }
+
+    // Load advanced analytics
+    async function loadAdvancedAnalytics() {
+        try {
+            const response = await fetch('/api/historical/analytics?days=30');
+            const data = await response.json();
+
+            if (!data.success) {
+                throw new Error(data.error || 'Failed to load analytics');
+            }
+
+            renderAdvancedAnalytics(data.data);
+        } catch (error) {
+            console.error('Error loading advanced analytics:', error);
+        }
+    }
+
+    function renderAdvancedAnalytics(analytics) {
+        // Day vs Night comparison
+        const dayNightEl = document.getElementById('dayNightComparison');
+        if (analytics.day_vs_night && analytics.day_vs_night.day && analytics.day_vs_night.night) {
+            const day = analytics.day_vs_night.day;
+            const night = analytics.day_vs_night.night;
+
+            dayNightEl.innerHTML = `
+                <div class="comparison-row">
+                    <span class="comparison-label">Download Speed</span>
+                    <span class="comparison-value">Day: ${day.avg_download} Mbps | Night: ${night.avg_download} Mbps</span>
+                </div>
+                <div class="comparison-row">
+                    <span class="comparison-label">Latency</span>
+                    <span class="comparison-value">Day: ${day.avg_latency} ms | Night: ${night.avg_latency} ms</span>
+                </div>
+                <div class="comparison-row">
+                    <span class="comparison-label">Quality Score</span>
+                    <span class="comparison-value">Day: ${day.avg_quality}% | Night: ${night.avg_quality}%</span>
+                </div>
+            `;
+        } else {
+            dayNightEl.innerHTML = '<div style="color: #666; text-align: center; padding: 20px;">Insufficient data for comparison</div>';
+        }
+
+        // Quality distribution
+        const qualityEl = document.getElementById('qualityDistribution');
+        if (analytics.quality_distribution && analytics.quality_distribution.length > 0) {
+            const qualityHTML = analytics.quality_distribution.map(item => `
+                <div class="comparison-row">
+                    <span class="metric-badge metric-${item.quality_category}">${item.quality_category.charAt(0).toUpperCase() + item.quality_category.slice(1)}</span>
+                    <span class="comparison-value">${item.percentage}% (${item.count} measurements)</span>
+                </div>
+            `).join('');
+            qualityEl.innerHTML = qualityHTML;
+        } else {
+            qualityEl.innerHTML = '<div style="color: #666; text-align: center; padding: 20px;">No quality data available</div>';
+        }
+
+        // Speed consistency
+        const consistencyEl = document.getElementById('speedConsistency');
+        if (analytics.speed_consistency) {
+            const consistency = analytics.speed_consistency;
+            consistencyEl.innerHTML = `
+                <div class="comparison-row">
+                    <span class="comparison-label">Average Speed</span>
+                    <span class="comparison-value">${consistency.avg_download} Mbps</span>
+                </div>
+                <div class="comparison-row">
+                    <span class="comparison-label">Speed Range</span>
+                    <span class="comparison-value">${consistency.min_download} - ${consistency.max_download} Mbps</span>
+                </div>
+                <div class="comparison-row">
+                    <span class="comparison-label">Consistency</span>
+                    <span class="metric-badge metric-${consistency.consistency_rating === 'very_consistent' ? 'excellent' : consistency.consistency_rating === 'consistent' ? 'good' : 'fair'}">${consistency.consistency_rating?.replace('_', ' ') || 'Unknown'}</span>
+                </div>
+            `;
+        } else {
+            consistencyEl.innerHTML = '<div style="color: #666; text-align: center; padding: 20px;">No consistency data available</div>';
+        }
+
+        // Peak hours
+        const peakEl = document.getElementById('peakHours');
+        if (analytics.peak_hours && analytics.peak_hours.length > 0) {
+            const peakHTML = analytics.peak_hours.map((hour, index) => `
+                <div class="comparison-row">
+                    <span class="comparison-label">#${index + 1} Peak: ${hour.hour}:00</span>
+                    <span class="comparison-value">${hour.avg_download} Mbps</span>
+                </div>
+            `).join('');
+            peakEl.innerHTML = peakHTML;
+        } else {
+            peakEl.innerHTML = '<div style="color: #666; text-align: center; padding: 20px;">No peak hour data available</div>';
+        }
+    }
+
+    // Load performance insights
+    async function loadPerformanceInsights() {
+        try {
+            const response = await fetch('/api/historical/insights?days=30');
+            const data = await response.json();
+
+            if (!data.success) {
+                throw new Error(data.error || 'Failed to load insights');
+            }
+
+            renderPerformanceInsights(data.data);
+        } catch (error) {
+            console.error('Error loading performance insights:', error);
+        }
+    }
+
+    function renderPerformanceInsights(insights) {
+        const insightsEl = document.getElementById('performanceInsights');
+
+        if (!insights || insights.length === 0) {
+            insightsEl.innerHTML = '<div style="background: white; padding: 30px; border-radius: 8px; text-align: center; color: #10b981;"><strong>🎉 Great Performance!</strong><br>No significant performance issues detected in the analyzed period.</div>';
+            return;
+        }
+
+        const insightsHTML = insights.map(insight => `
+            <div class="insight-item insight-${insight.severity}">
+                <div class="insight-title">${insight.title}</div>
+                <div class="insight-description">${insight.description}</div>
+                <div class="insight-recommendation">💡 ${insight.recommendation}</div>
+            </div>
+        `).join('');
+
+        insightsEl.innerHTML = insightsHTML;
+    }
+
+    // Load speed test analytics
+    async function loadSpeedTestAnalytics() {
+        try {
+            // Summary and trends are independent - fetch them together
+            const [summaryData, trendsData] = await Promise.all([
+                fetch('/api/speedtest/summary?days=30').then(response => response.json()),
+                fetch('/api/speedtest/trends?days=30').then(response => response.json())
+            ]);
+
+            if (summaryData.success) {
+                renderSpeedTestSummary(summaryData.data);
+            }
+
+            if (trendsData.success) {
+                renderSpeedTestTrends(trendsData.data);
+            }
+        } catch (error) {
+            console.error('Error loading speed test analytics:', error);
+        }
+    }
+
+    function renderSpeedTestSummary(data) {
+        const summaryEl = document.getElementById('speedTestSummary');
+
+        if (!data || data.total_tests === 0) {
+            summaryEl.innerHTML = '<div style="text-align: center; padding: 20px; color: #666;">No speed tests available. <a href="/speedtest" style="color: #667eea;">Run your first test →</a></div>';
+            return;
+        }
+
+        summaryEl.innerHTML = `
+            <div class="comparison-row">
+                <span class="comparison-label">Total Tests</span>
+                <span class="comparison-value">${data.total_tests}</span>
+            </div>
+            <div class="comparison-row">
+                <span class="comparison-label">Success Rate</span>
+                <span class="comparison-value">${((data.completed_tests / data.total_tests) * 100).toFixed(1)}%</span>
+            </div>
+            <div class="comparison-row">
+                <span class="comparison-label">Avg Download</span>
+                <span class="comparison-value">${data.avg_download} Mbps</span>
+            </div>
+            <div class="comparison-row">
+                <span class="comparison-label">Max Download</span>
+                <span class="comparison-value">${data.max_download} Mbps</span>
+            </div>
+            <div class="comparison-row">
+                <span class="comparison-label">Avg Upload</span>
+                <span class="comparison-value">${data.avg_upload} Mbps</span>
+            </div>
+        `;
+    }
+
+    function renderSpeedTestTrends(data) {
+        const ctx = document.getElementById('speedTestTrendChart').getContext('2d');
+
+        if (!data || data.length === 0) {
+            // Show "no data" message
+            ctx.font = '16px Arial';
+            ctx.fillStyle = '#666';
+            ctx.textAlign = 'center';
+            ctx.fillText('No speed test data available', ctx.canvas.width / 2, ctx.canvas.height / 2);
+            return;
+        }
+
+        const labels = data.map(d => d.date);
+        const downloadData = data.map(d => d.avg_download || 0);
+        const uploadData = data.map(d => d.avg_upload || 0);
+
+        new Chart(ctx, {
+            type: 'line',
+            data: {
+                labels: labels,
+                datasets: [{
+                    label: 'Download Speed (Mbps)',
+                    data: downloadData,
+                    borderColor: 'rgb(34, 197, 94)',
+                    backgroundColor: 'rgba(34, 197, 94, 0.1)',
+                    tension: 0.4,
+                    fill: true,
+                    pointRadius: 0,
+                    pointHoverRadius: 4,
+                    borderWidth: 2
+                }, {
+                    label: 'Upload Speed (Mbps)',
+                    data: uploadData,
+                    borderColor: 'rgb(239, 68, 68)',
+                    backgroundColor: 'rgba(239, 68, 68, 0.1)',
+                    tension: 0.4,
+                    fill: true,
+                    pointRadius: 0,
+                    pointHoverRadius: 4,
+                    borderWidth: 2
+                }]
+            },
+            options: {
+                responsive: true,
+                interaction: { mode: 'nearest', axis: 'x', intersect: false },
+                plugins: {
+                    legend: {
+                        display: true,
+                        position: 'top'
+                    }
+                },
+                scales: {
+                    y: {
+                        beginAtZero: true,
+                        title: {
+                            display: true,
+                            text: 'Speed (Mbps)'
+                        }
+                    },
+                    x: {
+                        title: {
+                            display: true,
+                            text: 'Date'
+                        }
+                    }
+                }
+            }
+        });
+    }
+
+    // Both trend charts from their own endpoint, for the current selections
+    function reloadTrends() {
+        return Promise.all([
+            loadTrendData('download_mbps', speedPeriod.value, speedDays.value, speedTrendChart),
+            loadTrendData('latency_ms', latencyPeriod.value, latencyDays.value, latencyTrendChart)
+        ]);
+    }
+
+    // Every section's initial data in one request; the individual endpoints serve the controls
+    async function loadInitialData() {
+        try {
+            // Usually already requested by the page head
+            const data = await (window.__dashboardPrefetch ||
+                fetch('/api/dashboard/bootstrap?days=30&trend_period=hour&trend_days=7').then(response => response.json()));
+
+            if (!data.success) {
+                throw new Error(data.error || 'Failed to load analytics');
+            }
+
+            const sections = data.data;
+            await chartsReady;
+
+            // Sections the server failed to build are loaded from their own endpoints instead
+            const pending = [];
+            if ('trends' in sections) {
+                if (showsBootstrapTrend(speedTrendChart, speedPeriod, speedDays)) {
+                    renderTrendData('download_mbps', sections.trends.download_mbps, speedTrendChart);
+                }
+                if (showsBootstrapTrend(latencyTrendChart, latencyPeriod, latencyDays)) {
+                    renderTrendData('latency_ms', sections.trends.latency_ms, latencyTrendChart);
+                }
+            } else {
+                pending.push(reloadTrends());
+            }
+            if ('comparison' in sections) {
+                renderComparisonData(sections.comparison);
+            } else {
+                pending.push(loadComparisonData());
+            }
+
+            // Sections below the fold are only built once scrolled to
+            whenVisible('.analytics-section', 'analytics' in sections
+                ? () => renderAdvancedAnalytics(sections.analytics) : loadAdvancedAnalytics);
+            whenVisible('.speedtest-section', 'speedtest_summary' in sections && 'speedtest_trends' in sections
+                ? () => {
+                    renderSpeedTestSummary(sections.speedtest_summary);
+                    renderSpeedTestTrends(sections.speedtest_trends);
+                }
+                : loadSpeedTestAnalytics);
+            whenVisible('.insights-section', 'insights' in sections
+                ? () => renderPerformanceInsights(sections.insights) : loadPerformanceInsights);
+
+            await Promise.all(pending);
+        } catch (error) {
+            console.error('Error loading bootstrap data, loading sections separately:', error);
+            await chartsReady;
+            // Fall back to the independent requests; the sections below the fold fetch theirs
+            // once scrolled to
+            whenVisible('.analytics-section', loadAdvancedAnalytics);
+            whenVisible('.speedtest-section', loadSpeedTestAnalytics);
+            whenVisible('.insights-section', loadPerformanceInsights);
+            await Promise.all([
+                reloadTrends(),
+                loadComparisonData()
+            ]);
+        }
+    }
+
+    loadInitialData().finally(() => {
+        document.getElementById('loading').style.display = 'none';
+    });
+});
@@ -0,0 +1,187 @@
+// Chart configurations
+const chartConfig = {
+    responsive: true,
+    maintainAspectRatio: true,
+    scales: {
+        y: {
+            beginAtZero: true,
+            grid: { color: 'rgba(0,0,0,0.1)' },
+            ticks: { font: { size: 10 } }
+        },
+        x: {
+            grid: { color: 'rgba(0,0,0,0.1)' },
+            ticks: { 
+                font: { size: 10 },
+                maxTicksLimit: 10
+            }
+        }
+    },
+    plugins: {
+        legend: { 
+            display: true,
+            position: 'top',
+            labels: { font: { size: 11 } }
+        }
+    },
+    animation: { duration: 0 }
+};
+
+// Initialize charts
+const latencyCtx = document.getElementById('latencyChart').getContext('2d');
+const speedCtx = document.getElementById('speedChart').getContext('2d');
+const qualityCtx = document.getElementById('qualityChart').getContext('2d');
+const obstructionCtx = document.getElementById('obstructionChart').getContext('2d');
+
+const latencyChart = new Chart(latencyCtx, {
+    type: 'line',
+    data: {
+        labels: [],
+        datasets: [{
+            label: 'Latency (ms)',
+            data: [],
+            borderColor: 'rgb(99, 132, 255)',
+            backgroundColor: 'rgba(99, 132, 255, 0.2)',
+            tension: 0.4,
+            fill: true
+        }]
+    },
+    options: {
+        ...chartConfig,
+        scales: {
+            ...chartConfig.scales,
+            y: {
+                ...chartConfig.scales.y,
+                suggestedMax: 100
+            }
+        }
+    }
+});
+
+const speedChart = new Chart(speedCtx, {
+    type: 'line',
+    data: {
+        labels: [],
+        datasets: [{
+            label: 'Download (Mbps)',
+            data: [],
+            borderColor: 'rgb(34, 197, 94)',
+            backgroundColor: 'rgba(34, 197, 94, 0.1)',
+            tension: 0.4
+        }, {
+            label: 'Upload (Mbps)',
+            data: [],
+            borderColor: 'rgb(239, 68, 68)',
+            backgroundColor: 'rgba(239, 68, 68, 0.1)',
+            tension: 0.4
+        }]
+    },
+    options: chartConfig
+});
+
+const qualityChart = new Chart(qualityCtx, {
+    type: 'line',
+    data: {
+        labels: [],
+        datasets: [{
+            label: 'Quality Score (%)',
+            data: [],
+            borderColor: 'rgb(168, 85, 247)',
+            backgroundColor: 'rgba(168, 85, 247, 0.2)',
+            tension: 0.4,
+            fill: true
+        }]
+    },
+    options: {
+        ...chartConfig,
+        scales: {
+            ...chartConfig.scales,
+            y: {
+                ...chartConfig.scales.y,
+                min: 0,
+                max: 100
+            }
+        }
+    }
+});
+
+const obstructionChart = new Chart(obstructionCtx, {
+    type: 'bar',
+    data: {
+        labels: [],
+        datasets: [{
+            label: 'Obstruction (%)',
+            data: [],
+            backgroundColor: 'rgba(245, 158, 11, 0.8)',
+            borderColor: 'rgb(245, 158, 11)',
+            borderWidth: 1
+        }]
+    },
+    options: {
+        ...chartConfig,
+        scales: {
+            ...chartConfig.scales,
+            y: {
+                ...chartConfig.scales.y,
+                suggestedMax: 10
+            }
+        }
+    }
+});
+
+// Function to add a stats reading to the charts
+function addDataPoint(data) {
+    if (data.error) {
+        console.error('API Error:', data.error);
+        return;
+    }
+
+    // Add new data point
+    const timestamp = data.timestamp;
+
+    // Update latency chart
+    latencyChart.data.labels.push(timestamp);
+    latencyChart.data.datasets[0].data.push(data.latency);
+
+    // Update speed chart
+    speedChart.data.labels.push(timestamp);
+    speedChart.data.datasets[0].data.push(data.download_mbps);
+    speedChart.data.datasets[1].data.push(data.upload_mbps);
+
+    // Update quality chart
+    qualityChart.data.labels.push(timestamp);
+    qualityChart.data.datasets[0].data.push(data.quality_score);
+
+    // Update obstruction chart
+    obstructionChart.data.labels.push(timestamp);
+    obstructionChart.data.datasets[0].data.push(data.obstruction_pct);
+
+    // Keep only last 50 data points
+    const maxPoints = 50;
+    [latencyChart, speedChart, qualityChart, obstructionChart].forEach(chart => {
+        if (chart.data.labels.length > maxPoints) {
+            chart.data.labels.shift();
+            chart.data.datasets.forEach(dataset => dataset.data.shift());
+        }
+        chart.update('none'); // Update without animation
+    });
+}
+
+// Function to update charts
+function updateCharts() {
+    fetch('/api/current-stats')
+        .then(response => response.json())
+        .then(addDataPoint)
+        .catch(error => console.error('Error updating charts:', error));
+}
+
+// Initial chart update
+updateCharts();
+
+if (window.EventSource) {
+    // Server pushes a reading every 5 seconds (EventSource reconnects on its own)
+    const stream = new EventSource('/api/stream');
+    stream.onmessage = event => addDataPoint(JSON.parse(event.data));
+} else {
+    // Update charts every 5 seconds
+    setInterval(updateCharts, 5000);
+}
@@ -0,0 +1,195 @@
+let testRunning = false;
+
+// Summary cards and recent results come from the JSON API, so the page itself is a static file
+async function loadSpeedTestData() {
+    try {
+        const [summaryResponse, historyResponse] = await Promise.all([
+            fetch('/api/speedtest/summary?days=30'),
+            fetch('/api/speedtest/history?days=7&limit=5', { cache: 'no-cache' })
+        ]);
+        const summary = (await summaryResponse.json()).data || {};
+        const history = (await historyResponse.json()).data || [];
+
+        document.getElementById('totalTests').textContent = summary.total_tests || 0;
+        document.getElementById('avgDownload').textContent = (summary.avg_download || 0).toFixed(1) + ' Mbps';
+        document.getElementById('avgUpload').textContent = (summary.avg_upload || 0).toFixed(1) + ' Mbps';
+        document.getElementById('avgPing').textContent = (summary.avg_ping || 0).toFixed(0) + ' ms';
+
+        const rows = history.map(test => {
+            const status = test.status;
+            const row = document.createElement('tr');
+            [
+                test.timestamp.slice(0, 16),
+                test.download_mbps.toFixed(1) + ' Mbps',
+                test.upload_mbps.toFixed(1) + ' Mbps',
+                test.ping_ms.toFixed(0) + ' ms'
+            ].forEach(text => {
+                row.insertCell().textContent = text;
+            });
+
+            const badge = document.createElement('span');
+            badge.className = 'status-indicator status-' + status;
+            badge.textContent = status.charAt(0).toUpperCase() + status.slice(1);
+            row.insertCell().appendChild(badge);
+            return row;
+        });
+        document.getElementById('historyTableBody').replaceChildren(...rows);
+    } catch (error) {
+        console.error('Error loading speed test data:', error);
+    }
+}
+
+async function runSpeedTest() {
+    if (testRunning) return;
+
+    testRunning = true;
+    const button = document.getElementById('runTestBtn');
+    const status = document.getElementById('testStatus');
+    const progressBar = document.getElementById('progressBar');
+
+    button.disabled = true;
+    button.textContent = '⏳ Testing...';
+    status.style.display = 'block';
+
+    // Simulate progress
+    let progress = 0;
+    const progressInterval = setInterval(() => {
+        progress += Math.random() * 10;
+        if (progress > 90) progress = 90;
+        progressBar.style.width = progress + '%';
+    }, 1000);
+
+    // Subscribe before starting, so the result can't arrive before we are listening
+    const events = new EventSource('/api/speedtest/events');
+    await new Promise(resolve => {
+        events.onopen = resolve;
+        events.onerror = resolve; // Start anyway - the timeout below still ends the wait
+    });
+    const finish = (result) => {
+        events.close();
+        clearTimeout(timeout);
+        clearInterval(progressInterval);
+        showTestComplete(result);
+    };
+    const timeout = setTimeout(() => {
+        finish('Timeout - test may still be running in background');
+    }, 120000); // Max 2 minutes
+
+    // Results of every test (scheduled ones, other pages' tests) are pushed here; only ours ends the
+    // wait. Those arriving before the POST returns our test ID are kept until it does.
+    let testId = null;
+    const received = [];
+    const onResult = (result) => {
+        if (result.test_id !== testId) return false;
+        progressBar.style.width = '100%';
+        finish(result);
+        loadSpeedTestData(); // Refresh the cards and table with the new result
+        return true;
+    };
+    events.onmessage = (event) => {
+        const result = JSON.parse(event.data);
+        if (testId === null) {
+            received.push(result);
+        } else {
+            onResult(result);
+        }
+    };
+
+    try {
+        const response = await fetch('/api/speedtest/run', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({'test_type': 'manual'})
+        });
+
+        const result = await response.json();
+
+        if (result.status === 'starting') {
+            // The server pushes the result, tagged with this test ID, as soon as it is stored
+            testId = result.test_id;
+            received.some(onResult);
+        } else {
+            // Not started, e.g. another test is still running
+            finish(result.message || result.error || 'Speed test could not be started');
+        }
+    } catch (error) {
+        finish('Error: ' + error.message);
+    }
+}
+
+function showTestComplete(result) {
+    testRunning = false;
+    const button = document.getElementById('runTestBtn');
+    const status = document.getElementById('testStatus');
+
+    button.disabled = false;
+    button.textContent = '🚀 Start Speed Test';
+
+    if (typeof result === 'object') {
+        status.innerHTML = `
+            <h3>✅ Test Complete!</h3>
+            <p><strong>Download:</strong> ${result.download_mbps.toFixed(1)} Mbps</p>
+            <p><strong>Upload:</strong> ${result.upload_mbps.toFixed(1)} Mbps</p>
+            <p><strong>Ping:</strong> ${result.ping_ms.toFixed(0)} ms</p>
+        `;
+    } else {
+        status.innerHTML = `<h3>ℹ️ ${result}</h3>`;
+    }
+
+    setTimeout(() => {
+        status.style.display = 'none';
+    }, 10000);
+}
+
+async function createSchedule() {
+    const name = document.getElementById('scheduleName').value;
+    const cronExpression = document.getElementById('scheduleType').value;
+    const statusDiv = document.getElementById('scheduleStatus');
+
+    if (!name.trim()) {
+        statusDiv.style.display = 'block';
+        statusDiv.style.backgroundColor = '#fecaca';
+        statusDiv.style.color = '#991b1b';
+        statusDiv.textContent = 'Please enter a schedule name';
+        return;
+    }
+
+    try {
+        const response = await fetch('/api/speedtest/schedules', {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({
+                name: name,
+                cron_expression: cronExpression,
+                enabled: true
+            })
+        });
+
+        const result = await response.json();
+
+        statusDiv.style.display = 'block';
+        if (result.success) {
+            statusDiv.style.backgroundColor = '#d1fae5';
+            statusDiv.style.color = '#065f46';
+            statusDiv.textContent = 'Schedule created successfully!';
+            document.getElementById('scheduleName').value = '';
+        } else {
+            statusDiv.style.backgroundColor = '#fecaca';
+            statusDiv.style.color = '#991b1b';
+            statusDiv.textContent = 'Error: ' + result.error;
+        }
+
+        setTimeout(() => {
+            statusDiv.style.display = 'none';
+        }, 5000);
+
+    } catch (error) {
+        statusDiv.style.display = 'block';
+        statusDiv.style.backgroundColor = '#fecaca';
+        statusDiv.style.color = '#991b1b';
+        statusDiv.textContent = 'Error creating schedule: ' + error.message;
+    }
+}
+
+// Initial load
+loadSpeedTestData();
@@ -0,0 +1,111 @@
+import json
+import queue
+import threading
+import time
+import logging
+from typing import Callable, Optional
+
+
+class Broadcaster:
+    def __init__(self, encode: Callable = json.dumps):
+        """
+        Fan each message out to every subscribed client
+
+        Args:
+            encode: Callable turning a payload into a JSON string
+        """
+        self.encode = encode
+        self.subscribers = set()
+        self.lock = threading.Lock()
+
+    def subscribe(self) -> queue.Queue:
+        """Register a client and return the queue its messages arrive on"""
+        subscription = queue.Queue(maxsize=10)
+        with self.lock:
+            self.subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: queue.Queue):
+        """Stop delivering messages to a client"""
+        with self.lock:
+            self.subscribers.discard(subscription)
+
+    def has_subscribers(self) -> bool:
+        """Whether any client is listening"""
+        with self.lock:
+            return bool(self.subscribers)
+
+    def send(self, payload):
+        """Encode a payload once and queue it for every subscriber"""
+        with self.lock:
+            subscribers = list(self.subscribers)
+        if not subscribers:
+            return
+
+        message = self.encode(payload)
+        for subscription in subscribers:
+            try:
+                subscription.put_nowait(message)
+            except queue.Full:
+                pass  # Slow client - it will catch up on the next message
+
+
+class StatsBroadcaster(Broadcaster):
+    def __init__(self, fetch: Callable, interval: int = 5, encode: Callable = json.dumps):
+        """
+        Push one stats reading per tick to every subscribed client
+
+        Args:
+            fetch: Callable returning a JSON-serializable stats payload
+            interval: How often to publish a reading (seconds)
+            encode: Callable turning a payload into a JSON string
+        """
+        super().__init__(encode)
+        self.fetch = fetch
+        self.interval = interval
+        self.running = False
+        self.thread: Optional[threading.Thread] = None
+
+        self.logger = logging.getLogger(__name__)
+
+    def publish(self):
+        """Fetch one reading and fan it out to all subscribers"""
+        if not self.has_subscribers():
+            return  # Nobody listening - don't touch the dish
+
+        try:
+            payload = self.fetch()
+        except Exception as e:
+            self.logger.warning(f"Error fetching stats for stream: {e}")
+            payload = {'error': str(e)}
+        self.send(payload)
+
+    def _publish_loop(self):
+        """Publish a reading every interval until stopped"""
+        while self.running:
+            self.publish()
+
+            for _ in range(self.interval):
+                if not self.running:
+                    break
+                time.sleep(1)
+
+    def start(self):
+        """Start publishing in the background"""
+        if self.running:
+            return
+
+        self.running = True
+        self.thread = threading.Thread(target=self._publish_loop, daemon=True)
+        self.thread.start()
+        self.logger.info(f"Stats broadcaster started (interval: {self.interval}s)")
+
+    def stop(self):
+        """Stop publishing"""
+        if not self.running:
+            return
+
+        self.running = False
+        if self.thread:
+            self.thread.join(timeout=10)
+        self.logger.info("Stats broadcaster stopped")
@@ -0,0 +1,196 @@
+from collections import deque
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional - fall back to plain NumPy reductions
+    njit = None
+
+ACTIVE_THRESHOLD_BPS = 1e6  # > 1 Mbps counts as active usage
+RECENT_SAMPLES = 60         # Last minute at 1-second samples
+
+
+def _summarize_loop(dl, ul):
+    """Walk the samples once, accumulating sum/count/peak for the active and recent windows"""
+    ads = aus = rds = rus = 0.0
+    adm = aum = rdm = rum = 0.0
+    adc = auc = rdc = ruc = 0
+
+    n = dl.shape[0]
+    recent_start = n - RECENT_SAMPLES if n > RECENT_SAMPLES else 0
+
+    for i in range(n):
+        d = dl[i]
+        u = ul[i]
+
+        if d > ACTIVE_THRESHOLD_BPS:
+            ads += d
+            adc += 1
+            if d > adm:
+                adm = d
+        if u > ACTIVE_THRESHOLD_BPS:
+            aus += u
+            auc += 1
+            if u > aum:
+                aum = u
+
+        if i >= recent_start:
+            if d > 0:
+                rds += d
+                rdc += 1
+                if d > rdm:
+                    rdm = d
+            if u > 0:
+                rus += u
+                ruc += 1
+                if u > rum:
+                    rum = u
+
+    return ads, adc, adm, aus, auc, aum, rds, rdc, rdm, rus, ruc, rum
+
+
+def _window_stats(samples, threshold):
+    """Sum, count and peak per row of the samples above threshold, from one zero-filled buffer"""
+    # Qualifying samples are > threshold >= 0, so zero is neutral for the sum, count and peak alike
+    selected = np.where(samples > threshold, samples, 0)
+    return (selected.sum(axis=1, dtype=np.float64).tolist(),
+            np.count_nonzero(selected, axis=1).tolist(),
+            selected.max(axis=1, initial=0).tolist())
+
+
+def _summarize_numpy(dl, ul):
+    """NumPy equivalent of _summarize_loop for when Numba is not installed"""
+    # Downlink and uplink are reduced together as the two rows of one array
+    samples = np.stack((dl, ul))
+    active_sums, active_counts, active_peaks = _window_stats(samples, ACTIVE_THRESHOLD_BPS)
+    recent_sums, recent_counts, recent_peaks = _window_stats(samples[:, -RECENT_SAMPLES:], 0)
+    return (active_sums[0], active_counts[0], active_peaks[0],
+            active_sums[1], active_counts[1], active_peaks[1],
+            recent_sums[0], recent_counts[0], recent_peaks[0],
+            recent_sums[1], recent_counts[1], recent_peaks[1])
+
+
+if njit is not None:
+    summarize = njit(cache=True)(_summarize_loop)
+else:
+    summarize = _summarize_numpy
+
+
+def warm_up():
+    """Trigger JIT compilation (or load it from cache) before the first request needs it"""
+    sample = np.zeros(2, dtype=np.float32)
+    summarize(sample, sample)
+
+
+class _RollingStats:
+    """Sum, count and peak of the samples above a threshold within a sliding window"""
+
+    def __init__(self, size, threshold):
+        self.size = size
+        self.threshold = threshold
+        self.total = 0.0
+        self.count = 0
+        self.peaks = deque()  # (position, value) with decreasing values - front is the window max
+        self.position = 0
+
+    def push(self, value, evicted=None):
+        """Add one sample, dropping the one that just left the window - O(1) amortized"""
+        if evicted is not None:
+            if evicted > self.threshold:
+                self.count -= 1
+                # Reset rather than subtract down to zero so float error can't accumulate
+                self.total = self.total - evicted if self.count else 0.0
+            if self.peaks and self.peaks[0][0] <= self.position - self.size:
+                self.peaks.popleft()
+
+        if value > self.threshold:
+            self.total += value
+            self.count += 1
+            while self.peaks and self.peaks[-1][1] <= value:
+                self.peaks.pop()
+            self.peaks.append((self.position, value))
+        self.position += 1
+
+    def load(self, values):
+        """Replace the window contents with a full window of samples (oldest first), vectorized"""
+        mask = values > self.threshold
+        self.count = int(np.count_nonzero(mask))
+        self.total = float(values.sum(where=mask)) if self.count else 0.0
+
+        # The peak deque holds each qualifying sample that beats every later qualifying sample
+        qualifying = np.where(mask, values, -np.inf)
+        later_peak = np.append(np.maximum.accumulate(qualifying[::-1])[::-1][1:], -np.inf)
+        keep = np.flatnonzero(mask & (qualifying > later_peak))
+        self.peaks = deque(zip(keep.tolist(), values[keep].tolist()))
+        self.position = len(values)
+
+    def stats(self):
+        """Sum, count and peak of the qualifying samples currently in the window"""
+        return self.total, self.count, self.peaks[0][1] if self.peaks else 0.0
+
+
+class ThroughputWindow:
+    def __init__(self, size: int = 300, recent: int = RECENT_SAMPLES):
+        """
+        Rolling throughput aggregates over the latest dish history samples
+
+        Args:
+            size: Number of samples in the active-usage window
+            recent: Number of trailing samples in the recent-activity window (<= size)
+        """
+        self.size = size
+        self.recent = recent
+        self.active_downlink = _RollingStats(size, ACTIVE_THRESHOLD_BPS)
+        self.active_uplink = _RollingStats(size, ACTIVE_THRESHOLD_BPS)
+        self.recent_downlink = _RollingStats(recent, 0)
+        self.recent_uplink = _RollingStats(recent, 0)
+
+        # Fixed ring buffers - the slot at head is the oldest sample once the window is full
+        self._downlink = np.zeros(size, dtype=np.float32)
+        self._uplink = np.zeros(size, dtype=np.float32)
+        self._head = 0
+        self._filled = 0
+
+        # Dish sample counter of the newest sample seen, for incremental fetches
+        self.end_counter = None
+
+    def _push(self, ring, value, active, recent):
+        """Store one sample in the ring and update both windows with what enters and leaves"""
+        head = self._head
+        evicted_active = float(ring[head]) if self._filled == self.size else None
+        evicted_recent = float(ring[head - self.recent]) if self._filled >= self.recent else None
+
+        ring[head] = np.nan_to_num(np.float32(value))  # Missing (None/NaN) samples count as 0, as in _load
+        value = float(ring[head])  # Aggregate the stored float32 so eviction subtracts the same value
+        active.push(value, evicted_active)
+        recent.push(value, evicted_recent)
+
+    def _load(self, ring, samples, active, recent):
+        """Refill the ring from the newest samples of a batch and rebuild both windows"""
+        ring[:] = np.nan_to_num(np.asarray(samples[-self.size:], dtype=np.float32))
+        values = ring.astype(np.float64)
+        active.load(values)
+        recent.load(values[-self.recent:])
+
+    def extend(self, downlink_samples, uplink_samples):
+        """Add new samples (oldest first); missing samples count as no throughput"""
+        if min(len(downlink_samples), len(uplink_samples)) >= self.size:
+            # The batch replaces the whole window (first fetch or after a gap) - load it in bulk
+            self._load(self._downlink, downlink_samples, self.active_downlink, self.recent_downlink)
+            self._load(self._uplink, uplink_samples, self.active_uplink, self.recent_uplink)
+            self._head = 0
+            self._filled = self.size
+            return
+
+        for downlink, uplink in zip(downlink_samples, uplink_samples):
+            self._push(self._downlink, downlink, self.active_downlink, self.recent_downlink)
+            self._push(self._uplink, uplink, self.active_uplink, self.recent_uplink)
+            self._head = (self._head + 1) % self.size
+            if self._filled < self.size:
+                self._filled += 1
+
+    def snapshot(self):
+        """Precomputed aggregates, in the same order as summarize()"""
+        return (self.active_downlink.stats() + self.active_uplink.stats()
+                + self.recent_downlink.stats() + self.recent_uplink.stats())
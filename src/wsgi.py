@@ -0,0 +1,5 @@
+# WSGI entry point for production servers (gunicorn wsgi:app)
+from app import app
+
+if __name__ == '__main__':
+    app.run(host='0.0.0.0', port=5000, debug=False)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The app's modules are imported flat from src/, as the app itself does
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
@@ -0,0 +1,47 @@
+import numpy as np
+
+import throughput
+
+
+def _samples(values):
+    """Dish history samples as get_speed_data builds them - missing samples (None) become NaN"""
+    return np.asarray(values, dtype=np.float32)
+
+
+def test_backends_agree_on_missing_samples():
+    dl = _samples([None, 2e6, None, None, None, None, 5e5])
+    ul = _samples([None, None, 3e6, 0, 1, None, None])
+
+    expected = throughput._summarize_numpy(dl, ul)
+    assert expected[:3] == (2e6, 1, 2e6)
+    np.testing.assert_allclose(throughput.summarize(dl, ul), expected)
+    np.testing.assert_allclose(throughput._summarize_loop(dl, ul), expected)
+
+
+def test_backends_agree_beyond_recent_window():
+    rng = np.random.default_rng(0)
+    dl = rng.uniform(0, 5e6, 300).astype(np.float32)
+    ul = rng.uniform(0, 2e6, 300).astype(np.float32)
+    dl[::7] = np.nan
+    ul[::11] = np.nan
+
+    expected = throughput._summarize_numpy(dl, ul)
+    np.testing.assert_allclose(throughput.summarize(dl, ul), expected, rtol=1e-6)
+    np.testing.assert_allclose(throughput._summarize_loop(dl, ul), expected, rtol=1e-6)
+
+
+def test_window_push_and_load_agree_on_missing_samples():
+    dl = [None, 2e6, float('nan'), 5e5, 3e6]
+    ul = [float('nan'), None, 3e6, 0, 1]
+
+    loaded = throughput.ThroughputWindow(size=5, recent=3)
+    loaded.extend(dl, ul)  # A full window is loaded in bulk
+
+    pushed = throughput.ThroughputWindow(size=5, recent=3)
+    for downlink, uplink in zip(dl, ul):
+        pushed.extend([downlink], [uplink])  # One sample at a time goes through _push
+
+    # Both paths store missing samples as 0 (the pushed ring has wrapped back to the loaded order)
+    np.testing.assert_array_equal(pushed._downlink, loaded._downlink)
+    np.testing.assert_array_equal(pushed._uplink, loaded._uplink)
+    np.testing.assert_allclose(pushed.snapshot(), loaded.snapshot())